@@ -2,6 +2,33 @@ import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
 import math
+from io import BytesIO
+
+from eoq_batch import eoq_cost_curve, eoq_frame, read_sku_table
+from feasible_region import draw_feasible_region, feasible_polygon
+from result_cache import cached
+
+
+@cached("grafik_biaya_eoq")
+def grafik_biaya_eoq(D, S, H):
+    # Grafik dirender sekali per (D, S, H) dan disimpan sebagai PNG
+    kurva = eoq_cost_curve(D, S, H)
+    fig, ax = plt.subplots()
+    ax.plot(kurva.quantity, kurva.holding_cost, label='Biaya Penyimpanan')
+    ax.plot(kurva.quantity, kurva.ordering_cost, label='Biaya Pemesanan')
+    ax.plot(kurva.quantity, kurva.total_cost, label='Total Biaya')
+    ax.axvline(kurva.eoq, color='red', linestyle='--', label='EOQ')
+
+    ax.set_xlabel('Jumlah Pesanan (Q)')
+    ax.set_ylabel('Biaya (Rp)')
+    ax.set_title('Hubungan Jumlah Pesanan dan Biaya')
+    ax.legend()
+    ax.grid(True)
+
+    buffer = BytesIO()
+    fig.savefig(buffer, format="png", dpi=100, bbox_inches="tight")
+    plt.close(fig)
+    return buffer.getvalue()
 
 # Judul aplikasi
 st.title("Aplikasi Model Matematika Industri")
@@ -63,11 +90,11 @@ if menu == "Optimasi Produksi":
         
         # Visualisasi
         fig, ax = plt.subplots()
-        x = np.linspace(0, x_max, 100)
+        x = np.array([0, x_max])
         y = (total_time - time_a * x) / time_b
         
         ax.plot(x, y, label='Kendala Waktu Mesin')
-        ax.fill_between(x, 0, y, alpha=0.1)
+        draw_feasible_region(ax, feasible_polygon([[time_a, time_b]], [total_time]))
         ax.scatter([optimal_x], [optimal_y], color='red', label='Solusi Optimal')
         
         ax.set_xlabel('Jumlah Produk A')
@@ -101,25 +128,22 @@ elif menu == "Model Persediaan":
         st.write(f"Total Biaya Pemesanan: Rp{total_ordering_cost:,.2f}")
         st.write(f"Total Biaya Persediaan Tahunan: Rp{total_cost:,.2f}")
         
-        # Visualisasi hubungan EOQ dan biaya
-        q_values = np.linspace(100, 2*eoq, 50)
-        holding_costs = (q_values / 2) * H
-        ordering_costs = (D / q_values) * S
-        total_costs = holding_costs + ordering_costs
-        
-        fig, ax = plt.subplots()
-        ax.plot(q_values, holding_costs, label='Biaya Penyimpanan')
-        ax.plot(q_values, ordering_costs, label='Biaya Pemesanan')
-        ax.plot(q_values, total_costs, label='Total Biaya')
-        ax.axvline(eoq, color='red', linestyle='--', label='EOQ')
-        
-        ax.set_xlabel('Jumlah Pesanan (Q)')
-        ax.set_ylabel('Biaya (Rp)')
-        ax.set_title('Hubungan Jumlah Pesanan dan Biaya')
-        ax.legend()
-        ax.grid(True)
-        
-        st.pyplot(fig)
+        # Visualisasi hubungan EOQ dan biaya (grid adaptif di sekitar EOQ)
+        st.image(grafik_biaya_eoq(D, S, H))
+
+    st.subheader("Mode Tabel (Banyak SKU)")
+    berkas_sku = st.file_uploader("Unggah CSV/Parquet dengan kolom sku, D, S, H, L (opsional)",
+                                  type=["csv", "parquet"])
+    if berkas_sku is not None:
+        try:
+            tabel_sku = eoq_frame(read_sku_table(berkas_sku))
+        except (ImportError, ValueError) as exc:
+            st.error(f"Error: {exc}")
+        else:
+            st.write(f"Total Biaya Persediaan Tahunan {len(tabel_sku):,} SKU: Rp{tabel_sku['biaya_total'].sum():,.2f}")
+            st.dataframe(tabel_sku.nlargest(1000, "biaya_total"))
+            st.download_button("Unduh hasil EOQ (CSV)", tabel_sku.to_csv(index=False).encode("utf-8"),
+                               file_name="hasil_eoq_sku.csv", mime="text/csv")
 
 # Tab 3: Model Antrian
 elif menu == "Model Antrian":
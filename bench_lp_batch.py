@@ -0,0 +1,56 @@
+import time
+
+import numpy as np
+
+from lp_batch import solve_product_mix_batch
+
+# =============== BENCHMARK SOLVER BATCH vs LOOP PYTHON ===============
+# Jalankan: python bench_lp_batch.py
+
+
+def solve_loop(p1, p2, t1, t2, max1, max2, total_time):
+    # Versi per-skenario seperti perhitungan titik pojok di halaman Optimasi
+    hasil = []
+    for args in zip(p1, p2, t1, t2, max1, max2, total_time):
+        p1_, p2_, t1_, t2_, max1_, max2_, total_ = args
+        titik = [
+            (0, 0),
+            (min(max1_, total_/t1_), 0),
+            (max1_, min((total_ - t1_*max1_)/t2_, max2_)),
+            (min((total_ - t2_*max2_)/t1_, max1_), max2_),
+            (0, min(total_/t2_, max2_)),
+        ]
+        layak = [True, True, total_ >= t1_*max1_, total_ >= t2_*max2_, True]
+        nilai_Z = [p1_*x + p2_*y if ok else -np.inf for (x, y), ok in zip(titik, layak)]
+        hasil.append(max(nilai_Z))
+    return np.array(hasil)
+
+
+def make_scenarios(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return (
+        rng.uniform(80000, 160000, n), rng.uniform(50000, 110000, n),
+        rng.uniform(1, 5, n), rng.uniform(1, 4, n),
+        rng.uniform(10, 50, n), rng.uniform(10, 60, n),
+        rng.uniform(60, 200, n),
+    )
+
+
+if __name__ == "__main__":
+    n_loop = 100_000
+    for n in (10_000, 100_000, 1_000_000):
+        params = make_scenarios(n)
+        start = time.perf_counter()
+        hasil = solve_product_mix_batch(*params)
+        t_batch = time.perf_counter() - start
+        print(f"batch  n={n:>9,}: {t_batch*1000:8.1f} ms  ({n/t_batch:,.0f} skenario/detik)")
+
+    params = make_scenarios(n_loop)
+    start = time.perf_counter()
+    profit_loop = solve_loop(*params)
+    t_loop = time.perf_counter() - start
+    start = time.perf_counter()
+    profit_batch = solve_product_mix_batch(*params).profit
+    t_batch = time.perf_counter() - start
+    print(f"loop   n={n_loop:>9,}: {t_loop*1000:8.1f} ms  ({n_loop/t_loop:,.0f} skenario/detik)")
+    print(f"speedup: {t_loop/t_batch:.0f}x, selisih maks: {np.abs(profit_loop - profit_batch).max():.3g}")
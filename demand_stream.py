@@ -0,0 +1,158 @@
+import os
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from eoq_batch import eoq_frame, read_sku_table
+
+# =============== EOQ STREAMING DARI HISTORI TRANSAKSI ===============
+# Berkas transaksi (sku, tanggal, jumlah) dibaca per chunk dengan
+# pd.read_csv(chunksize=...), setiap chunk langsung diringkas per SKU lalu
+# digabung ke agregat berjalan. Memori sebanding dengan jumlah SKU + satu
+# chunk, bukan ukuran berkas. Permintaan tahunan = total jumlah / rentang
+# tanggal seluruh histori (dalam tahun), lalu dihitung EOQ massal.
+# Jalankan tanpa UI:
+#   python demand_stream.py transaksi.csv parameter_sku.csv hasil.csv
+
+CHUNK_ROWS = 1_000_000
+
+
+@dataclass
+class StreamStats:
+    rows: int = 0
+    chunks: int = 0
+    bytes_read: int = 0
+    total_bytes: int = 0  # 0 jika ukuran sumber tidak diketahui
+    skus: int = 0
+    skipped_rows: int = 0  # jumlah/SKU kosong atau tidak numerik
+    first_date: pd.Timestamp = None
+    last_date: pd.Timestamp = None
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def mb_per_second(self):
+        return self.bytes_read / 1e6 / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def progress(self):
+        return min(self.bytes_read / self.total_bytes, 1.0) if self.total_bytes else 0.0
+
+    @property
+    def years(self):
+        # Rentang histori dalam tahun (inklusif hari terakhir)
+        if self.first_date is None or self.last_date is None:
+            return np.nan
+        return ((self.last_date - self.first_date).days + 1) / 365.0
+
+
+def _source_size(handle):
+    try:
+        return os.fstat(handle.fileno()).st_size
+    except (AttributeError, OSError, ValueError):
+        pass
+    try:
+        pos = handle.tell()
+        size = handle.seek(0, os.SEEK_END)
+        handle.seek(pos)
+        return size
+    except (AttributeError, OSError, ValueError):
+        return 0
+
+
+def aggregate_demand_iter(source, sku="sku", quantity="jumlah", date="tanggal", chunk_rows=CHUNK_ROWS):
+    # Generator (agregat berjalan, StreamStats) setelah setiap chunk.
+    # source: path atau berkas biner (mis. unggahan Streamlit). date=None
+    # bila berkas tidak punya kolom tanggal.
+    own = isinstance(source, (str, os.PathLike))
+    handle = open(source, "rb") if own else source
+    try:
+        stats = StreamStats(total_bytes=_source_size(handle))
+        start = time.perf_counter()
+        columns = [sku, quantity] + ([date] if date else [])
+        total = pd.DataFrame(columns=["permintaan", "transaksi"], dtype=float)
+        reader = pd.read_csv(handle, usecols=columns, chunksize=chunk_rows,
+                             dtype={sku: str}, low_memory=True)
+        for chunk in reader:
+            qty = pd.to_numeric(chunk[quantity], errors="coerce")
+            ok = qty.notna() & chunk[sku].notna()
+            stats.skipped_rows += int((~ok).sum())
+            part = (pd.DataFrame({"sku": chunk[sku][ok], "permintaan": qty[ok]})
+                    .groupby("sku", sort=False)["permintaan"].agg(["sum", "count"])
+                    .rename(columns={"sum": "permintaan", "count": "transaksi"}))
+            total = part if total.empty else total.add(part, fill_value=0.0)
+            if date:
+                # Tanggal unik saja yang di-parse (jauh lebih sedikit dari baris)
+                days = pd.to_datetime(pd.Series(chunk[date].dropna().unique()), errors="coerce")
+                lo, hi = days.min(), days.max()
+                if pd.notna(lo):
+                    stats.first_date = lo if stats.first_date is None else min(stats.first_date, lo)
+                    stats.last_date = hi if stats.last_date is None else max(stats.last_date, hi)
+            stats.rows += len(chunk)
+            stats.chunks += 1
+            stats.skus = len(total)
+            try:
+                stats.bytes_read = handle.tell()
+            except (OSError, ValueError):
+                stats.bytes_read = 0
+            stats.elapsed = time.perf_counter() - start
+            yield total, stats
+    finally:
+        if own:
+            handle.close()
+
+
+def aggregate_demand(source, sku="sku", quantity="jumlah", date="tanggal", chunk_rows=CHUNK_ROWS, years=None):
+    # Tabel per SKU (permintaan tahunan, total, transaksi) dan StreamStats.
+    total, stats = pd.DataFrame(columns=["permintaan", "transaksi"], dtype=float), StreamStats()
+    for total, stats in aggregate_demand_iter(source, sku, quantity, date, chunk_rows):
+        pass
+    return annual_demand(total, stats, years), stats
+
+
+def annual_demand(total, stats, years=None):
+    # Agregat berjalan -> tabel SKU dengan kolom permintaan per tahun.
+    years = years or stats.years
+    if not years or not np.isfinite(years):
+        raise ValueError("Rentang histori tidak diketahui: isi kolom tanggal atau jumlah tahun")
+    out = total.rename(columns={"permintaan": "total_jumlah"}).reset_index()
+    out.insert(1, "permintaan", out["total_jumlah"] / years)
+    out["transaksi"] = out["transaksi"].astype(int)
+    return out
+
+
+def stream_eoq(demand, parameters=None, S=None, H=None, L=0.0):
+    # Tabel permintaan tahunan -> EOQ massal. Biaya per SKU dari tabel
+    # parameters (sku, biaya_pesan, biaya_simpan, lead_time) atau skalar S/H/L
+    # untuk SKU yang tidak ada di tabel tersebut.
+    df = demand[["sku", "permintaan"]].copy()
+    if parameters is not None:
+        params = parameters.rename(columns={"S": "biaya_pesan", "H": "biaya_simpan", "L": "lead_time"})
+        params = params.assign(sku=params["sku"].astype(str))
+        keep = [c for c in ("sku", "biaya_pesan", "biaya_simpan", "lead_time") if c in params.columns]
+        df = df.merge(params[keep], on="sku", how="left")
+    for column, value in (("biaya_pesan", S), ("biaya_simpan", H), ("lead_time", L)):
+        if value is not None:
+            df[column] = df[column].fillna(value) if column in df.columns else value
+    return eoq_frame(df)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 4:
+        sys.exit("Pemakaian: python demand_stream.py transaksi.csv parameter_sku.csv|parquet hasil.csv|parquet")
+    permintaan, statistik = aggregate_demand(sys.argv[1])
+    hasil = stream_eoq(permintaan, read_sku_table(sys.argv[2]))
+    out = Path(sys.argv[3])
+    if out.suffix.lower() in (".parquet", ".pq"):
+        hasil.to_parquet(out, index=False)
+    else:
+        hasil.to_csv(out, index=False)
+    print(f"{statistik.rows:,} transaksi, {statistik.skus:,} SKU dalam {statistik.elapsed:.1f} detik "
+          f"({statistik.rows_per_second:,.0f} baris/detik, {statistik.mb_per_second:.1f} MB/detik) -> {out}")
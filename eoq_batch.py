@@ -0,0 +1,335 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+# =============== EOQ MASSAL (BANYAK SKU SEKALIGUS) ===============
+# Semua rumus bekerja pada array NumPy sehingga 100 ribu SKU dihitung
+# dalam satu panggilan tanpa loop Python per baris (kernel umum EPQ/backorder
+# di bawah, EOQ klasik adalah kasus khususnya):
+#   EOQ = sqrt(2DS/H),  ROP = D/hari_per_tahun * L,  TC = sqrt(2DSH)
+# Baris dengan parameter tidak valid (D < 0, S < 0, H <= 0) menghasilkan NaN.
+
+# Nama kolom tabel unggahan -> nama kanonik
+SKU_COLUMNS = {
+    "sku": "sku",
+    "D": "permintaan", "permintaan": "permintaan",
+    "S": "biaya_pesan", "biaya_pesan": "biaya_pesan",
+    "H": "biaya_simpan", "biaya_simpan": "biaya_simpan",
+    "L": "lead_time", "lead_time": "lead_time",
+}
+REQUIRED_COLUMNS = ("permintaan", "biaya_pesan", "biaya_simpan")
+
+
+@dataclass
+class EOQBatchResult:
+    eoq: np.ndarray
+    rop: np.ndarray
+    orders_per_year: np.ndarray
+    cycle_days: np.ndarray
+    ordering_cost: np.ndarray
+    holding_cost: np.ndarray
+    total_cost: np.ndarray
+    valid: np.ndarray
+
+
+def eoq_batch(D, S, H, L=0.0, days_per_year=365):
+    # Parameter boleh skalar atau array (dibroadcast satu sama lain).
+    hasil = inventory_batch(D, S, H, L, days_per_year=days_per_year)
+    return EOQBatchResult(
+        eoq=hasil.order_quantity,
+        rop=hasil.rop,
+        orders_per_year=hasil.orders_per_year,
+        cycle_days=hasil.cycle_days,
+        ordering_cost=hasil.ordering_cost,
+        holding_cost=hasil.holding_cost,
+        total_cost=hasil.total_cost,
+        valid=hasil.valid,
+    )
+
+
+# =============== KERNEL PERSEDIAAN: EOQ, EPQ, BACKORDER TERENCANA ===============
+# Satu rumus umum untuk ketiga model, dengan rho = 1 - D/P (P = laju
+# produksi per tahun, P = inf untuk EOQ) dan B = biaya backorder per unit
+# per tahun (B = inf bila kekurangan tidak diizinkan):
+#   Q* = sqrt(2DS / (H rho)) * sqrt((H + B) / B)
+#   b* = Q* rho H / (H + B)            (backorder maksimum)
+#   I_max = Q* rho - b*                (stok maksimum)
+#   TC* = sqrt(2DSH rho) * sqrt(B / (H + B))
+# EOQ: P = B = inf; EPQ: B = inf; backorder: P = inf. P dan B boleh
+# array sehingga beberapa model dihitung dalam satu panggilan (mis. (3, n)).
+
+INVENTORY_MODELS = ("eoq", "epq", "backorder")
+
+
+@dataclass
+class InventoryBatchResult:
+    order_quantity: np.ndarray
+    max_inventory: np.ndarray
+    max_backorder: np.ndarray
+    rop: np.ndarray  # D/hari * L - backorder maksimum
+    orders_per_year: np.ndarray
+    cycle_days: np.ndarray
+    production_days: np.ndarray  # lama produksi per siklus (0 untuk pembelian)
+    ordering_cost: np.ndarray
+    holding_cost: np.ndarray
+    shortage_cost: np.ndarray
+    total_cost: np.ndarray
+    valid: np.ndarray
+
+
+def inventory_batch(D, S, H, L=0.0, P=np.inf, B=np.inf, days_per_year=365):
+    D, S, H, L, P, B = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (D, S, H, L, P, B)))
+    valid = (D >= 0) & (S >= 0) & (H > 0) & (L >= 0) & (P > D) & (B > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rho = np.where(np.isinf(P), 1.0, 1.0 - D / P)
+        share = np.where(np.isinf(B), 1.0, B / (H + B))  # B / (H + B)
+        DS2 = 2.0 * D * S
+        Q = np.sqrt(DS2 / (H * rho * share))
+        peak = Q * rho  # stok maksimum tanpa backorder
+        backorder = peak * (1.0 - share)
+        inventory = peak - backorder
+        # Permintaan nol: tidak pernah memesan, biaya pemesanan nol
+        orders = np.where(D > 0, D / Q, 0.0)
+        holding = np.where(peak > 0, H * inventory ** 2 / (2.0 * peak), 0.0)
+        shortage = np.where((peak > 0) & np.isfinite(B), B * backorder ** 2 / (2.0 * peak), 0.0)
+        values = {
+            "order_quantity": Q,
+            "max_inventory": inventory,
+            "max_backorder": backorder,
+            "rop": D / days_per_year * L - backorder,
+            "orders_per_year": orders,
+            "cycle_days": days_per_year / orders,
+            "production_days": np.where(np.isinf(P), 0.0, Q / P * days_per_year),
+            "ordering_cost": orders * S,
+            "holding_cost": holding,
+            "shortage_cost": shortage,
+            "total_cost": np.sqrt(DS2 * H * rho * share),
+        }
+    return InventoryBatchResult(valid=valid, **{k: np.where(valid, v, np.nan) for k, v in values.items()})
+
+
+def read_sku_table(source):
+    # source: path atau berkas unggahan Streamlit (punya atribut name).
+    name = str(getattr(source, "name", source))
+    if name.lower().endswith((".parquet", ".pq")):
+        return pd.read_parquet(source)
+    return pd.read_csv(source)
+
+
+def normalize_sku_table(df):
+    # Seragamkan nama kolom (D/S/H/L atau nama Indonesia) dan periksa kolom wajib.
+    df = df.rename(columns={c: SKU_COLUMNS[c] for c in df.columns if c in SKU_COLUMNS})
+    missing = [c for c in REQUIRED_COLUMNS if c not in df.columns]
+    if missing:
+        raise ValueError(f"Kolom wajib tidak ditemukan: {', '.join(missing)}")
+    return df
+
+
+def eoq_frame(df, days_per_year=365):
+    # Tabel SKU -> tabel yang sama ditambah kolom hasil EOQ.
+    df = normalize_sku_table(df)
+    lead_time = df["lead_time"].to_numpy(dtype=float) if "lead_time" in df.columns else 0.0
+    hasil = eoq_batch(df["permintaan"].to_numpy(dtype=float), df["biaya_pesan"].to_numpy(dtype=float),
+                      df["biaya_simpan"].to_numpy(dtype=float), lead_time, days_per_year)
+    out = df.copy()
+    out["eoq"] = hasil.eoq
+    out["rop"] = hasil.rop
+    out["frekuensi_pesan"] = hasil.orders_per_year
+    out["siklus_hari"] = hasil.cycle_days
+    out["biaya_pemesanan"] = hasil.ordering_cost
+    out["biaya_penyimpanan"] = hasil.holding_cost
+    out["biaya_total"] = hasil.total_cost
+    return out
+
+
+def inventory_models_frame(df, models=INVENTORY_MODELS, days_per_year=365):
+    # Semua model untuk semua SKU dalam satu panggilan kernel (models x n).
+    # EPQ butuh kolom laju_produksi (unit/tahun), backorder butuh biaya_backorder.
+    df = normalize_sku_table(df)
+    n = len(df)
+    column = lambda name, fill: df[name].to_numpy(dtype=float) if name in df.columns else np.full(n, fill)
+    P = {"eoq": np.inf, "epq": column("laju_produksi", np.nan), "backorder": np.inf}
+    B = {"eoq": np.inf, "epq": np.inf, "backorder": column("biaya_backorder", np.nan)}
+    hasil = inventory_batch(df["permintaan"].to_numpy(dtype=float), df["biaya_pesan"].to_numpy(dtype=float),
+                            df["biaya_simpan"].to_numpy(dtype=float), column("lead_time", 0.0),
+                            np.array([np.broadcast_to(P[m], (n,)) for m in models]),
+                            np.array([np.broadcast_to(B[m], (n,)) for m in models]), days_per_year)
+    out = df.copy()
+    for i, model in enumerate(models):
+        out[f"q_{model}"] = hasil.order_quantity[i]
+        out[f"stok_maks_{model}"] = hasil.max_inventory[i]
+        if model == "backorder":
+            out["backorder_maks"] = hasil.max_backorder[i]
+        out[f"rop_{model}"] = hasil.rop[i]
+        out[f"biaya_total_{model}"] = hasil.total_cost[i]
+    return out
+
+
+# =============== KURVA BIAYA EOQ ===============
+# Grid Q log-spaced simetris di sekitar EOQ: dengan x = Q/EOQ biaya total
+# relatif TC/TC* = (x + 1/x) / 2, sehingga rentang dipilih agar kedua ujung
+# kurva mencapai cost_ratio * TC*. Jumlah titik tetap (ganjil, EOQ tepat di
+# tengah) berapapun besarnya EOQ; parameter array menghasilkan (n, points).
+
+
+@dataclass
+class EOQCostCurve:
+    quantity: np.ndarray
+    holding_cost: np.ndarray
+    ordering_cost: np.ndarray
+    total_cost: np.ndarray
+    eoq: np.ndarray
+
+
+def eoq_cost_curve(D, S, H, points=101, cost_ratio=1.5):
+    if cost_ratio <= 1:
+        raise ValueError("cost_ratio harus > 1")
+    points = max(3, int(points) | 1)
+    D, S, H = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (D, S, H)))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        eoq = np.sqrt(2.0 * D * S / H)
+        eoq = np.where((D > 0) & (S > 0) & (H > 0), eoq, np.nan)
+        x = cost_ratio + np.sqrt(cost_ratio ** 2 - 1.0)
+        Q = eoq[..., None] * np.geomspace(1.0 / x, x, points)
+        holding = Q / 2.0 * H[..., None]
+        ordering = D[..., None] * S[..., None] / Q
+    return EOQCostCurve(Q, holding, ordering, holding + ordering, eoq)
+
+
+# =============== EOQ DENGAN DISKON KUANTITAS (PRICE BREAK) ===============
+# Setiap SKU punya k tingkat harga: pesanan >= batas[j] mendapat harga[j].
+#   all_units   : seluruh unit dibayar dengan harga tingkat pesanan
+#   incremental : hanya unit di atas batas[j] yang mendapat harga[j]
+# Biaya simpan per unit per tahun = H + holding_rate * nilai unit.
+# Semua tingkat semua SKU dievaluasi sekaligus sebagai array (n, k): Q
+# optimal tiap tingkat digeser ke rentang [batas[j], batas[j+1]] lalu
+# dipilih biaya total terkecil. Tingkat NaN (SKU dengan tingkat lebih
+# sedikit) diabaikan.
+
+DISCOUNT_KINDS = ("all_units", "incremental")
+
+
+@dataclass
+class DiscountEOQResult:
+    eoq: np.ndarray
+    tier: np.ndarray  # indeks tingkat terpilih (-1 jika tidak valid)
+    unit_price: np.ndarray  # harga rata-rata per unit pada Q terpilih
+    purchase_cost: np.ndarray
+    ordering_cost: np.ndarray
+    holding_cost: np.ndarray
+    total_cost: np.ndarray
+    tier_quantity: np.ndarray  # (n, k) Q kandidat tiap tingkat
+    tier_cost: np.ndarray  # (n, k) biaya total kandidat tiap tingkat
+
+
+def eoq_discount_batch(D, S, breaks, prices, H=0.0, holding_rate=0.0, kind="all_units"):
+    # D, S, H, holding_rate: (n,) atau skalar; breaks, prices: (k,) atau (n, k)
+    if kind not in DISCOUNT_KINDS:
+        raise ValueError(f"Jenis diskon harus salah satu dari {DISCOUNT_KINDS}")
+    prices = np.atleast_2d(np.asarray(prices, dtype=float))
+    breaks = np.atleast_2d(np.asarray(breaks, dtype=float))
+    D, S, H, rate = (np.asarray(v, dtype=float) for v in (D, S, H, holding_rate))
+    n = np.broadcast_shapes(D.shape, S.shape, H.shape, rate.shape, prices.shape[:1], breaks.shape[:1])
+    n = n[0] if n else 1
+    k = max(prices.shape[1], breaks.shape[1])
+    prices = np.broadcast_to(prices, (n, k))
+    breaks = np.broadcast_to(breaks, (n, k))
+    D, S, H, rate = (np.broadcast_to(v, (n,))[:, None] for v in (D, S, H, rate))
+
+    tier_ok = np.isfinite(prices) & np.isfinite(breaks)
+    lo = np.where(tier_ok, breaks, np.inf)
+    # Batas atas tingkat = batas tingkat valid berikutnya
+    hi = np.minimum.accumulate(lo[:, ::-1], axis=1)[:, ::-1]
+    hi = np.concatenate([hi[:, 1:], np.full((n, 1), np.inf)], axis=1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if kind == "all_units":
+            fixed = np.zeros((n, k))
+        else:
+            # Biaya beli sampai batas tingkat j: R_j = sum_{i<j} p_i (lo_{i+1} - lo_i)
+            width = np.where(tier_ok, np.nan_to_num(hi - lo, posinf=0.0) * np.where(tier_ok, prices, 0.0), 0.0)
+            R = np.concatenate([np.zeros((n, 1)), np.cumsum(width, axis=1)[:, :-1]], axis=1)
+            fixed = R - prices * lo  # C(Q) = fixed + p Q di tingkat j
+        # TC(Q) = D (fixed + pQ)/Q + DS/Q + H Q/2 + rate (fixed + pQ)/2
+        h = H + rate * prices
+        Q = np.sqrt(2.0 * D * (S + fixed) / h)
+        Q = np.clip(np.where(np.isfinite(Q), Q, lo), lo, hi)
+        purchase = D * (fixed + prices * Q) / Q
+        cost = purchase + D * S / Q + h * Q / 2.0 + rate * fixed / 2.0
+    valid_cost = tier_ok & np.isfinite(cost) & (Q > 0)
+    cost = np.where(valid_cost, cost, np.inf)
+
+    tier = np.argmin(cost, axis=1)
+    rows = np.arange(n)
+    best_Q = Q[rows, tier]
+    valid = np.isfinite(cost[rows, tier]) & (D[:, 0] > 0) & (S[:, 0] >= 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        p, f = prices[rows, tier], fixed[rows, tier]
+        unit_price = (f + p * best_Q) / best_Q
+        d, s, hh, r = D[:, 0], S[:, 0], H[:, 0], rate[:, 0]
+        values = {
+            "eoq": best_Q,
+            "unit_price": unit_price,
+            "purchase_cost": d * unit_price,
+            "ordering_cost": d * s / best_Q,
+            "holding_cost": (hh + r * unit_price) * best_Q / 2.0,
+        }
+    values = {key: np.where(valid, v, np.nan) for key, v in values.items()}
+    return DiscountEOQResult(
+        tier=np.where(valid, tier, -1),
+        total_cost=values["purchase_cost"] + values["ordering_cost"] + values["holding_cost"],
+        tier_quantity=np.where(tier_ok, Q, np.nan),
+        tier_cost=np.where(valid_cost, cost, np.nan),
+        **values,
+    )
+
+
+def discount_columns(df):
+    # Pasangan kolom tingkat harga: batas_1/harga_1, batas_2/harga_2, ...
+    tiers = sorted(int(c.split("_")[1]) for c in df.columns
+                   if str(c).startswith("harga_") and str(c).split("_")[1].isdigit())
+    return [f"batas_{j}" for j in tiers], [f"harga_{j}" for j in tiers]
+
+
+def eoq_discount_frame(df, kind="all_units", holding_rate=None):
+    # Tabel SKU dengan kolom batas_j/harga_j -> tambah kolom hasil diskon.
+    # Biaya simpan: kolom biaya_simpan (tetap) dan/atau persen_simpan (% harga).
+    df = df.rename(columns={c: SKU_COLUMNS[c] for c in df.columns if c in SKU_COLUMNS})
+    break_cols, price_cols = discount_columns(df)
+    if not price_cols or "permintaan" not in df.columns or "biaya_pesan" not in df.columns:
+        raise ValueError("Tabel diskon harus memuat permintaan, biaya_pesan dan pasangan batas_j/harga_j")
+    # Salinan milik sendiri: pandas 3 dapat mengembalikan view read-only dari blok float
+    breaks = df.reindex(columns=break_cols).to_numpy(dtype=float, copy=True)
+    breaks[:, 0] = np.nan_to_num(breaks[:, 0], nan=0.0)  # tingkat pertama mulai dari 0
+    H = df["biaya_simpan"].to_numpy(dtype=float) if "biaya_simpan" in df.columns else 0.0
+    if holding_rate is None:
+        holding_rate = df["persen_simpan"].to_numpy(dtype=float) / 100.0 if "persen_simpan" in df.columns else 0.0
+    hasil = eoq_discount_batch(df["permintaan"].to_numpy(dtype=float), df["biaya_pesan"].to_numpy(dtype=float),
+                               breaks, df[price_cols].to_numpy(dtype=float), H, holding_rate, kind)
+    out = df.copy()
+    out["eoq_diskon"] = hasil.eoq
+    out["tingkat_harga"] = hasil.tier + 1
+    out["harga_rata2"] = hasil.unit_price
+    out["biaya_pembelian"] = hasil.purchase_cost
+    out["biaya_pemesanan"] = hasil.ordering_cost
+    out["biaya_penyimpanan"] = hasil.holding_cost
+    out["biaya_total"] = hasil.total_cost
+    return out
+
+
+if __name__ == "__main__":
+    # Cek regresi: tabel diskon satu tingkat dan tabel dengan semua kolom
+    # tingkat bertipe float (keduanya dulu gagal di pandas 3 karena view read-only)
+    satu_tingkat = pd.DataFrame({"sku": ["A"], "permintaan": [1000], "biaya_pesan": [50],
+                                 "biaya_simpan": [2], "batas_1": [0], "harga_1": [10]})
+    hasil = eoq_discount_frame(satu_tingkat)
+    assert np.isclose(hasil["eoq_diskon"].iloc[0], np.sqrt(2 * 1000 * 50 / 2)), hasil
+    n = 100_000
+    rng = np.random.default_rng(0)
+    semua_float = pd.DataFrame({"permintaan": rng.uniform(100, 10_000, n), "biaya_pesan": 50.0,
+                                "biaya_simpan": 2.0, "batas_1": 0.0, "harga_1": 10.0,
+                                "batas_2": 500.0, "harga_2": 9.5})
+    hasil = eoq_discount_frame(semua_float)
+    assert hasil["biaya_total"].notna().all(), hasil
+    print(f"OK: {len(hasil):,} SKU, tingkat harga terpakai {sorted(hasil['tingkat_harga'].unique().tolist())}")
@@ -0,0 +1,114 @@
+from collections import deque
+
+import numpy as np
+from matplotlib.patches import Polygon
+
+# =============== DAERAH LAYAK 2 VARIABEL (HALF-PLANE INTERSECTION) ===============
+# Setiap kendala a1 x1 + a2 x2 <= b adalah setengah bidang. Irisan semua
+# setengah bidang dihitung tepat dalam O(n log n): urutkan menurut sudut
+# garis batas, lalu sapu dengan deque. Hasilnya poligon konveks (titik pojok
+# berurutan berlawanan arah jarum jam) yang digambar sebagai satu patch.
+
+
+def _intersection(p, q):
+    # Titik potong garis batas p dan q; p = (a1, a2, b).
+    det = p[0] * q[1] - p[1] * q[0]
+    return np.array([(p[2] * q[1] - p[1] * q[2]) / det,
+                     (p[0] * q[2] - p[2] * q[0]) / det])
+
+
+def _outside(h, point, tol):
+    return h[0] * point[0] + h[1] * point[1] > h[2] + tol
+
+
+def half_plane_intersection(A, b, tol=1e-9):
+    # Titik pojok poligon {x : A x <= b}, bentuk (k, 2); kosong jika tidak layak.
+    # Daerah harus terbatas (tambahkan batas kotak bila perlu).
+    A = np.atleast_2d(np.asarray(A, dtype=float))
+    b = np.asarray(b, dtype=float).ravel()
+    norm = np.hypot(A[:, 0], A[:, 1])
+    trivial = norm <= tol
+    if np.any(b[trivial] < -tol):
+        return np.zeros((0, 2))
+    A, b, norm = A[~trivial], b[~trivial], norm[~trivial]
+    planes = np.column_stack([A / norm[:, None], b / norm]) + 0.0  # tanpa -0.0
+
+    # Arah garis batas dengan daerah layak di sebelah kiri: (-a2, a1)
+    angle = np.arctan2(planes[:, 0], -planes[:, 1])
+    order = np.argsort(angle, kind="stable")
+    planes, angle = planes[order], angle[order]
+    # Sudut yang berselisih <= tol dianggap satu kelompok sejajar; dari tiap
+    # kelompok cukup simpan kendala paling ketat (b terkecil)
+    group = np.concatenate([[0], np.cumsum(np.diff(angle) > tol)])
+    order = np.lexsort((planes[:, 2], group))
+    keep = np.ones(len(planes), dtype=bool)
+    keep[1:] = np.diff(group[order]) > 0
+    planes = planes[order][keep]
+
+    dq = deque()
+    for h in planes:
+        while len(dq) >= 2 and _outside(h, _intersection(dq[-1], dq[-2]), tol):
+            dq.pop()
+        while len(dq) >= 2 and _outside(h, _intersection(dq[0], dq[1]), tol):
+            dq.popleft()
+        if dq and abs(dq[-1][0] * h[1] - dq[-1][1] * h[0]) <= tol:
+            if dq[-1][0] * h[0] + dq[-1][1] * h[1] < 0:
+                # Garis sejajar berlawanan arah bertemu langsung: daerah kosong
+                return np.zeros((0, 2))
+            if h[2] >= dq[-1][2]:
+                continue
+            dq.pop()
+        dq.append(h)
+    while len(dq) >= 3 and _outside(dq[0], _intersection(dq[-1], dq[-2]), tol):
+        dq.pop()
+    while len(dq) >= 3 and _outside(dq[-1], _intersection(dq[0], dq[1]), tol):
+        dq.popleft()
+    if len(dq) < 3:
+        return np.zeros((0, 2))
+    planes = list(dq)
+    vertices = np.array([_intersection(planes[i], planes[(i + 1) % len(planes)])
+                         for i in range(len(planes))])
+    return _dedupe(vertices, tol) + 0.0
+
+
+def _dedupe(vertices, tol):
+    # Buang titik pojok kembar (beberapa garis melalui titik yang sama).
+    keep = np.ones(len(vertices), dtype=bool)
+    diff = np.abs(vertices - np.roll(vertices, 1, axis=0)).max(axis=1)
+    keep[diff <= max(tol, 1e-9 * np.abs(vertices).max(initial=1.0))] = False
+    if not keep.any():
+        return vertices[:1]
+    return vertices[keep]
+
+
+def feasible_polygon(A_ub, b_ub, bounds=None, box=None):
+    # Daerah layak halaman Optimasi: kendala <= ditambah batas variabel
+    # (default x >= 0). box membatasi daerah tak terbatas untuk digambar.
+    A_ub = np.atleast_2d(np.asarray(A_ub, dtype=float)).reshape(-1, 2)
+    b_ub = np.asarray(b_ub, dtype=float).ravel()
+    bounds = [(0, None), (0, None)] if bounds is None else bounds
+    rows, rhs = [A_ub], [b_ub]
+    for i, (lo, hi) in enumerate(bounds):
+        e = np.eye(2)[i]
+        if lo is not None:
+            rows.append(-e[None])
+            rhs.append([-lo])
+        if hi is not None and np.isfinite(hi):
+            rows.append(e[None])
+            rhs.append([hi])
+    if box is None:
+        scale = max(1.0, np.abs(np.concatenate(rhs)).max(initial=1.0))
+        box = 1e6 * scale
+    rows.append(np.vstack([np.eye(2), -np.eye(2)]))
+    rhs.append([box, box, box, box])
+    return half_plane_intersection(np.vstack(rows), np.concatenate(rhs))
+
+
+def draw_feasible_region(ax, vertices, **kwargs):
+    # Gambar daerah layak sebagai satu Polygon patch.
+    kwargs.setdefault("alpha", 0.1)
+    if len(vertices) < 3:
+        return None
+    patch = Polygon(vertices, closed=True, **kwargs)
+    ax.add_patch(patch)
+    return patch
@@ -0,0 +1,171 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+# =============== SIMULASI PERSEDIAAN (s,Q) / (s,S) ===============
+# Dinamika harian persediaan untuk R replikasi sekaligus: state berupa
+# array (R,) dan hanya hari yang diloop (T iterasi), bukan replikasi.
+# Urutan kejadian per hari: pesanan tiba -> permintaan dilayani ->
+# posisi persediaan diperiksa -> pesanan baru (tiba L hari kemudian).
+#   (s,Q): bila posisi <= s pesan kelipatan Q hingga posisi > s
+#   (s,S): bila posisi <= s pesan S - posisi
+# Permintaan tak terlayani hilang (lost sales) atau menjadi backorder.
+# Biaya simpan dihitung dari stok akhir hari (H / hari_per_tahun per unit).
+
+POLICIES = ("sQ", "sS")
+DEMAND_MODELS = ("normal", "poisson")
+
+
+@dataclass
+class SimulationResult:
+    fill_rate: np.ndarray  # (R,) unit terlayani langsung / total permintaan
+    stockout_days: np.ndarray  # (R,) hari dengan permintaan tak terlayani
+    orders: np.ndarray  # (R,) jumlah pesanan
+    average_inventory: np.ndarray  # (R,) rata-rata stok akhir hari
+    ordering_cost: np.ndarray  # (R,) per tahun
+    holding_cost: np.ndarray
+    shortage_cost: np.ndarray
+    total_cost: np.ndarray
+    mean_on_hand: np.ndarray  # (T,) rata-rata stok akhir hari antar replikasi
+    sample_on_hand: np.ndarray  # (T,) lintasan stok replikasi pertama
+    days: int
+
+    @property
+    def replications(self):
+        return self.fill_rate.size
+
+    def summary(self, analytic_cost=None):
+        # Rata-rata antar replikasi dan galat baku biaya total.
+        out = {
+            "fill_rate": float(self.fill_rate.mean()),
+            "hari_stockout_per_tahun": float(self.stockout_days.mean() * 365 / self.days),
+            "pesanan_per_tahun": float(self.orders.mean() * 365 / self.days),
+            "stok_rata2": float(self.average_inventory.mean()),
+            "biaya_pemesanan": float(self.ordering_cost.mean()),
+            "biaya_penyimpanan": float(self.holding_cost.mean()),
+            "biaya_kekurangan": float(self.shortage_cost.mean()),
+            "biaya_total": float(self.total_cost.mean()),
+            "galat_baku_biaya": float(self.total_cost.std(ddof=1) / np.sqrt(self.replications))
+            if self.replications > 1 else np.nan,
+        }
+        if analytic_cost is not None:
+            out["biaya_analitik"] = float(analytic_cost)
+            out["selisih_biaya_%"] = (out["biaya_total"] / analytic_cost - 1.0) * 100 if analytic_cost else np.nan
+        return out
+
+
+def daily_demand(mean, std=0.0, days=365, replications=1000, model="normal", rng=None):
+    # Array permintaan harian (R, T); normal dipotong di nol.
+    if model not in DEMAND_MODELS:
+        raise ValueError(f"Model permintaan harus salah satu dari {DEMAND_MODELS}")
+    rng = rng if rng is not None else np.random.default_rng()
+    if model == "poisson":
+        return rng.poisson(mean, (replications, days)).astype(float)
+    return np.maximum(rng.normal(mean, std, (replications, days)), 0.0)
+
+
+def simulate_inventory(demand, reorder_point, order_quantity=None, order_up_to=None, lead_time=0,
+                       ordering_cost=0.0, holding_cost=0.0, shortage_cost=0.0, lead_time_std=0.0,
+                       policy="sQ", backorders=False, initial_inventory=None, days_per_year=365,
+                       seed=None):
+    # demand: (R, T) permintaan harian; lead time dalam hari (dibulatkan),
+    # bila lead_time_std > 0 lead time tiap pesanan acak normal (>= 0).
+    # holding_cost dan shortage_cost per unit (simpan: per tahun).
+    if policy not in POLICIES:
+        raise ValueError(f"Kebijakan harus salah satu dari {POLICIES}")
+    if policy == "sQ" and not order_quantity or policy == "sS" and order_up_to is None:
+        raise ValueError("Kebijakan (s,Q) butuh Q > 0; kebijakan (s,S) butuh S")
+    if policy == "sS" and order_up_to <= reorder_point:
+        raise ValueError("Kebijakan (s,S) butuh S > s")
+    demand = np.atleast_2d(np.asarray(demand, dtype=float))
+    R, T = demand.shape
+    rng = np.random.default_rng(seed)
+    s = float(reorder_point)
+    L = int(round(lead_time))
+    max_lead = max(L + int(np.ceil(6 * lead_time_std)), 1)
+
+    if initial_inventory is None:
+        initial_inventory = s + order_quantity if policy == "sQ" else order_up_to
+    on_hand = np.full(R, float(initial_inventory))  # negatif = backorder
+    pipeline = np.zeros((R, T + max_lead + 1))  # kedatangan per hari
+    on_order = np.zeros(R)
+    rows = np.arange(R)
+
+    served = np.zeros(R)
+    stockout_days = np.zeros(R)
+    orders = np.zeros(R)
+    inventory_sum = np.zeros(R)
+    short_sum = np.zeros(R)
+    mean_on_hand = np.empty(T)
+    sample_on_hand = np.empty(T)
+
+    for t in range(T):
+        arriving = pipeline[:, t]
+        on_hand += arriving
+        on_order -= arriving
+
+        d = demand[:, t]
+        available = np.maximum(on_hand, 0.0)
+        filled = np.minimum(d, available)
+        short = d - filled
+        served += filled
+        stockout_days += short > 1e-12
+        short_sum += short
+        on_hand = on_hand - d if backorders else on_hand - filled
+
+        position = on_hand + on_order
+        need = position <= s
+        if need.any():
+            if policy == "sQ":
+                qty = np.where(need, (np.floor((s - position) / order_quantity) + 1) * order_quantity, 0.0)
+            else:
+                qty = np.where(need, order_up_to - position, 0.0)
+            if lead_time_std > 0:
+                lags = np.clip(np.rint(rng.normal(lead_time, lead_time_std, R)), 0, max_lead).astype(int)
+            else:
+                lags = np.full(R, L)
+            # Pesanan akhir hari t tiba awal hari t + L (paling cepat besok pagi)
+            arrive = t + np.maximum(lags, 1)
+            idx = rows[need]
+            pipeline[idx, arrive[idx]] += qty[idx]
+            on_order[idx] += qty[idx]
+            orders += need
+
+        stock = np.maximum(on_hand, 0.0)
+        inventory_sum += stock
+        mean_on_hand[t] = stock.mean()
+        sample_on_hand[t] = on_hand[0]
+
+    total_demand = demand.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fill_rate = np.where(total_demand > 0, served / total_demand, 1.0)
+    scale = days_per_year / T
+    average_inventory = inventory_sum / T
+    ordering = orders * ordering_cost * scale
+    holding = average_inventory * holding_cost
+    shortage = short_sum * shortage_cost * scale
+    return SimulationResult(
+        fill_rate=fill_rate,
+        stockout_days=stockout_days,
+        orders=orders,
+        average_inventory=average_inventory,
+        ordering_cost=ordering,
+        holding_cost=holding,
+        shortage_cost=shortage,
+        total_cost=ordering + holding + shortage,
+        mean_on_hand=mean_on_hand,
+        sample_on_hand=sample_on_hand,
+        days=T,
+    )
+
+
+def simulate_eoq_policy(D, S, H, L, Q, s, daily_std=0.0, replications=1000, days=365,
+                        demand_model="normal", policy="sQ", order_up_to=None, shortage_cost=0.0,
+                        lead_time_std=0.0, backorders=False, seed=None, days_per_year=365):
+    # Jalankan kebijakan halaman EOQ (Q = EOQ, s = ROP) pada permintaan acak.
+    # Satu seed menentukan permintaan dan lead time sehingga hasil dapat diulang.
+    seeds = np.random.SeedSequence(seed).spawn(2)
+    demand = daily_demand(D / days_per_year, daily_std, days, replications, demand_model,
+                          np.random.default_rng(seeds[0]))
+    return simulate_inventory(demand, s, Q, order_up_to, L, S, H, shortage_cost, lead_time_std,
+                              policy, backorders, days_per_year=days_per_year, seed=seeds[1])
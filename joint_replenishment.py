@@ -0,0 +1,145 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from eoq_batch import SKU_COLUMNS
+
+# =============== JOINT REPLENISHMENT (BANYAK ITEM SATU PEMASOK) ===============
+# Item dari pemasok yang sama dipesan bersama: biaya pesan utama S0 setiap
+# kali memesan ke pemasok, ditambah biaya minor s_i bila item i ikut.
+# Item i dipesan setiap k_i siklus dasar T (k_i bilangan bulat >= 1):
+#   TC(T, k) = (S0 + sum s_i / k_i) / T + T/2 * sum k_i D_i H_i
+# Untuk T tetap, k_i optimal = bilangan bulat terkecil dengan
+# k(k+1) >= 2 s_i / (D_i H_i T^2); untuk k tetap, T optimal berbentuk EOQ.
+# T dicari pada grid log-spaced yang dipersempit bertahap, lalu kedua
+# langkah diulang hingga k tidak berubah.
+# Pembanding: EOQ independen dengan biaya pesan S0 + s_i per item.
+
+
+@dataclass
+class JRPResult:
+    cycle: float  # siklus dasar T (tahun)
+    multipliers: np.ndarray  # k_i
+    order_quantity: np.ndarray  # Q_i = k_i D_i T
+    ordering_cost: float
+    holding_cost: float
+    total_cost: float
+    independent_cost: float  # total biaya EOQ independen
+    iterations: int
+
+    @property
+    def savings(self):
+        return self.independent_cost - self.total_cost
+
+    @property
+    def savings_pct(self):
+        return self.savings / self.independent_cost * 100 if self.independent_cost else 0.0
+
+
+def _optimal_cycle(S0, s, DH, k):
+    # T optimal untuk k tetap; k: (g, n)
+    return np.sqrt(2.0 * (S0 + np.sum(s / k, axis=-1)) / np.sum(k * DH, axis=-1))
+
+
+def _optimal_multipliers(s, DH, T):
+    # k_i terkecil dengan k(k+1) >= 2 s_i / (D_i H_i T^2); T: (g,)
+    r = 2.0 * s / (DH * T[:, None] ** 2)
+    k = np.ceil((-1.0 + np.sqrt(1.0 + 4.0 * r)) / 2.0)
+    return np.maximum(k, 1.0)
+
+
+def _cost(S0, s, DH, T, k):
+    ordering = (S0 + np.sum(s / k, axis=-1)) / T
+    holding = T / 2.0 * np.sum(k * DH, axis=-1)
+    return ordering, holding
+
+
+def solve_jrp(D, s, H, S0, max_iter=100, n_grid=128, zoom_rounds=4):
+    # D, s, H: (n,) per item (permintaan/tahun, biaya minor, biaya simpan/unit/tahun).
+    D, s, H = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (D, s, H)))
+    D, s, H = D.ravel(), s.ravel(), H.ravel()
+    if D.size == 0:
+        raise ValueError("Tidak ada item untuk dipesan bersama")
+    if S0 < 0 or np.any(s < 0) or np.any(D <= 0) or np.any(H <= 0):
+        raise ValueError("Butuh D > 0, H > 0, s >= 0 dan S0 >= 0 untuk semua item")
+    DH = D * H
+
+    # Untuk T tetap k_i optimal terpisah per item, sehingga optimum global
+    # adalah minimum fungsi satu variabel f(T) = min_k TC(T, k). f dievaluasi
+    # pada grid log-spaced (g, n) sekaligus, lalu grid dipersempit di sekitar
+    # titik terbaik beberapa kali.
+    single = np.sqrt(2.0 * (S0 + s) / DH)
+    minor = np.sqrt(2.0 * s[s > 0] / DH[s > 0])
+    T_all = _optimal_cycle(S0, s, DH, np.ones(D.size))
+    lo = min(T_all, single.min(), minor.min(initial=np.inf))
+    hi = max(T_all, single.max())
+    for _ in range(zoom_rounds):
+        grid = np.geomspace(lo, hi, n_grid) if hi > lo else np.array([lo])
+        ordering, holding = _cost(S0, s, DH, grid, _optimal_multipliers(s, DH, grid))
+        i = int(np.argmin(ordering + holding))
+        lo, hi = grid[max(i - 1, 0)], grid[min(i + 1, grid.size - 1)]
+    T = grid[i:i + 1]
+
+    # Perbaikan iteratif: T optimal untuk k, k optimal untuk T, hingga k stabil
+    k = _optimal_multipliers(s, DH, T)
+    for it in range(1, max_iter + 1):
+        T = _optimal_cycle(S0, s, DH, k)
+        k_new = _optimal_multipliers(s, DH, T)
+        if np.array_equal(k_new, k):
+            break
+        k = k_new
+    T = _optimal_cycle(S0, s, DH, k)
+    ordering, holding = _cost(S0, s, DH, T, k)
+
+    # Fungsi bantu bekerja pada grid (g, n); di sini g = 1
+    k, T = k[0], float(T[0])
+    ordering, holding = float(ordering[0]), float(holding[0])
+    independent = float(np.sum(np.sqrt(2.0 * D * (S0 + s) * H)))
+    return JRPResult(
+        cycle=T,
+        multipliers=k.astype(int),
+        order_quantity=k * D * T,
+        ordering_cost=ordering,
+        holding_cost=holding,
+        total_cost=ordering + holding,
+        independent_cost=independent,
+        iterations=it,
+    )
+
+
+def jrp_frame(df, major_cost, days_per_year=365):
+    # Tabel item (sku, D, biaya_pesan = biaya minor s_i, H, pemasok opsional)
+    # -> (tabel item + kolom k, siklus_hari, q_gabungan; ringkasan per pemasok).
+    # major_cost: skalar atau {pemasok: S0}; kolom biaya_pemasok juga diterima.
+    df = df.rename(columns={c: SKU_COLUMNS[c] for c in df.columns if c in SKU_COLUMNS})
+    missing = [c for c in ("permintaan", "biaya_pesan", "biaya_simpan") if c not in df.columns]
+    if missing:
+        raise ValueError(f"Kolom wajib tidak ditemukan: {', '.join(missing)}")
+    out = df.copy()
+    groups = out.groupby("pemasok", sort=False, dropna=False).groups if "pemasok" in out.columns else {"-": out.index}
+    rows = []
+    for supplier, index in groups.items():
+        if isinstance(major_cost, dict):
+            S0 = major_cost[supplier]
+        elif "biaya_pemasok" in out.columns:
+            S0 = float(out.loc[index, "biaya_pemasok"].iloc[0])
+        else:
+            S0 = float(major_cost)
+        part = out.loc[index]
+        hasil = solve_jrp(part["permintaan"].to_numpy(float), part["biaya_pesan"].to_numpy(float),
+                          part["biaya_simpan"].to_numpy(float), S0)
+        out.loc[index, "k"] = hasil.multipliers
+        out.loc[index, "siklus_hari"] = hasil.multipliers * hasil.cycle * days_per_year
+        out.loc[index, "q_gabungan"] = hasil.order_quantity
+        rows.append({
+            "pemasok": supplier,
+            "jumlah_item": len(index),
+            "siklus_dasar_hari": hasil.cycle * days_per_year,
+            "biaya_gabungan": hasil.total_cost,
+            "biaya_independen": hasil.independent_cost,
+            "penghematan": hasil.savings,
+            "penghematan_%": hasil.savings_pct,
+        })
+    out["k"] = out["k"].astype(int)
+    return out, pd.DataFrame(rows)
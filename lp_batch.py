@@ -0,0 +1,75 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+# =============== SOLVER BATCH 2 PRODUK (TITIK POJOK TERVEKTORISASI) ===============
+# Model yang sama dengan halaman Optimasi:
+#   maks  p1 x1 + p2 x2
+#   dengan t1 x1 + t2 x2 <= total_time, 0 <= x1 <= max1, 0 <= x2 <= max2
+# Semua parameter boleh berupa array NumPy yang dapat di-broadcast, sehingga
+# jutaan skenario dievaluasi sekaligus tanpa loop Python.
+
+CORNER_NAMES = np.array(["A", "B", "C", "D", "E"])
+
+
+@dataclass
+class BatchResult:
+    x1: np.ndarray
+    x2: np.ndarray
+    profit: np.ndarray
+    corner: np.ndarray  # indeks titik pojok optimal (0=A ... 4=E), -1 jika tidak layak
+
+    @property
+    def corner_names(self):
+        return np.where(self.corner >= 0, CORNER_NAMES[self.corner], "-")
+
+
+def corner_points_batch(t1, t2, max1, max2, total_time):
+    # Titik pojok A..E untuk setiap skenario, bentuk (5, ...) beserta mask kelayakan.
+    t1, t2, max1, max2, total_time = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (t1, t2, max1, max2, total_time)))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sisa_c = total_time - t1 * max1
+        sisa_d = total_time - t2 * max2
+        x1 = np.stack([
+            np.zeros_like(t1),
+            np.minimum(max1, np.where(t1 > 0, total_time / t1, np.inf)),
+            max1,
+            np.minimum(np.where(t1 > 0, sisa_d / t1, np.inf), max1),
+            np.zeros_like(t1),
+        ])
+        x2 = np.stack([
+            np.zeros_like(t2),
+            np.zeros_like(t2),
+            np.minimum(np.where(t2 > 0, sisa_c / t2, np.inf), max2),
+            max2,
+            np.minimum(max2, np.where(t2 > 0, total_time / t2, np.inf)),
+        ])
+    feasible = np.stack([
+        total_time >= 0,
+        total_time >= 0,
+        sisa_c >= 0,
+        sisa_d >= 0,
+        total_time >= 0,
+    ])
+    return x1, x2, feasible
+
+
+def solve_product_mix_batch(p1, p2, t1, t2, max1, max2, total_time):
+    # Evaluasi kelima titik pojok untuk semua skenario lalu ambil yang terbaik.
+    p1, p2, t1, t2, max1, max2, total_time = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (p1, p2, t1, t2, max1, max2, total_time)))
+    x1, x2, feasible = corner_points_batch(t1, t2, max1, max2, total_time)
+    nilai_Z = np.where(feasible, p1 * x1 + p2 * x2, -np.inf)
+    corner = np.argmax(nilai_Z, axis=0)
+    x1_opt = np.take_along_axis(x1, corner[None], axis=0)[0]
+    x2_opt = np.take_along_axis(x2, corner[None], axis=0)[0]
+    profit = np.take_along_axis(nilai_Z, corner[None], axis=0)[0]
+
+    infeasible = ~feasible.any(axis=0)
+    return BatchResult(
+        x1=np.where(infeasible, np.nan, x1_opt),
+        x2=np.where(infeasible, np.nan, x2_opt),
+        profit=np.where(infeasible, np.nan, profit),
+        corner=np.where(infeasible, -1, corner),
+    )
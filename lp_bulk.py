@@ -0,0 +1,154 @@
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from lp_interior import solve_lp_interior
+from lp_solver import solve_lp
+
+# =============== SOLVE MASSAL INSTANS LP (CSV/PARQUET) ===============
+# Satu baris tabel = satu instans LP  maks c x  s.t.  A x <= b,  0 <= x <= ub.
+# Kolom: c_j (keuntungan), a_i_j (pemakaian sumber daya i oleh produk j),
+# b_i (kapasitas), ub_j (permintaan maksimal, opsional), id (opsional).
+# Tabel format halaman Optimasi (p1, p2, t1, t2, max1, max2, total_time)
+# juga diterima. Instans dibagi per chunk ke ProcessPoolExecutor dan hasil
+# dikirim balik begitu setiap chunk selesai. method: "simplex" atau "interior".
+# Jalankan tanpa UI: python lp_bulk.py masukan.csv hasil.csv [simplex|interior]
+
+SOLVERS = {"simplex": solve_lp, "interior": solve_lp_interior}
+
+PRODUCT_MIX_COLUMNS = {
+    "p1": "c_1", "p2": "c_2", "t1": "a_1_1", "t2": "a_1_2",
+    "total_time": "b_1", "max1": "ub_1", "max2": "ub_2",
+}
+
+
+def read_instances(source):
+    # source: path atau berkas unggahan Streamlit (punya atribut name).
+    name = str(getattr(source, "name", source))
+    if name.lower().endswith((".parquet", ".pq")):
+        return pd.read_parquet(source)
+    return pd.read_csv(source)
+
+
+def _indexed_columns(columns, prefix, n_index):
+    # {indeks (1-based): nama kolom} untuk kolom seperti c_3 atau a_2_3
+    pattern = re.compile(rf"{prefix}" + r"_(\d+)" * n_index + "$")
+    found = {}
+    for col in columns:
+        match = pattern.match(str(col))
+        if match:
+            found[tuple(int(g) for g in match.groups())] = col
+    return found
+
+
+def parse_instances(df):
+    # Tabel -> (id, C (k, n), A (k, m, n), b (k, m), ub (k, n)).
+    if set(PRODUCT_MIX_COLUMNS) - {"max1", "max2"} <= set(df.columns):
+        df = df.rename(columns=PRODUCT_MIX_COLUMNS)
+    c_cols = _indexed_columns(df.columns, "c", 1)
+    b_cols = _indexed_columns(df.columns, "b", 1)
+    if not c_cols or not b_cols:
+        raise ValueError("Tabel harus memuat kolom c_j dan b_i (atau p1, p2, t1, t2, total_time)")
+    n = max(j for j, in c_cols)
+    m = max(i for i, in b_cols)
+    k = len(df)
+
+    def block(cols, shape, fill):
+        out = np.full((k, int(np.prod(shape))), fill, dtype=float)
+        flat = {np.ravel_multi_index(tuple(i - 1 for i in idx), shape): col
+                for idx, col in cols.items()
+                if all(1 <= i <= s for i, s in zip(idx, shape))}
+        if flat:
+            out[:, list(flat)] = df[list(flat.values())].to_numpy(dtype=float)
+        return np.where(np.isnan(out), fill, out).reshape((k,) + shape)
+
+    C = block(c_cols, (n,), 0.0)
+    A = block(_indexed_columns(df.columns, "a", 2), (m, n), 0.0)
+    b = block(b_cols, (m,), 0.0)
+    ub = block(_indexed_columns(df.columns, "ub", 1), (n,), np.inf)
+    ids = df["id"].to_numpy() if "id" in df.columns else np.arange(1, k + 1)
+    return ids, C, A, b, ub
+
+
+def _solve_chunk(positions, ids, C, A, b, ub, maximize, method="simplex"):
+    # Dijalankan di proses pekerja; tabel hasil chunk berindeks posisi baris masukan.
+    solver = SOLVERS[method]
+    rows = []
+    for i in range(len(ids)):
+        bounds = np.column_stack([np.zeros(C.shape[1]), ub[i]])
+        start = time.perf_counter()
+        try:
+            hasil = solver(C[i], A[i], b[i], bounds=bounds, maximize=maximize)
+            status, objective, x, nit = hasil.status, hasil.objective, hasil.x, hasil.nit
+        except (ValueError, np.linalg.LinAlgError) as exc:
+            status, objective, x, nit = f"error: {exc}", np.nan, np.full(C.shape[1], np.nan), 0
+        if status != "optimal":
+            x = np.full(C.shape[1], np.nan)
+        rows.append({
+            "id": ids[i],
+            "status": status,
+            "objective": objective,
+            **{f"x_{j + 1}": x[j] for j in range(C.shape[1])},
+            "iterasi": nit,
+            "waktu_ms": (time.perf_counter() - start) * 1000,
+        })
+    return pd.DataFrame(rows, index=positions)
+
+
+def solve_instances_iter(df, max_workers=None, chunk_size=None, maximize=True, method="simplex"):
+    # Generator (selesai, total, tabel chunk) dalam urutan selesai. Dengan
+    # max_workers=1 semua diselesaikan di proses ini (tanpa pool).
+    if method not in SOLVERS:
+        raise ValueError(f"Metode solver tidak dikenal: {method}")
+    ids, C, A, b, ub = parse_instances(df)
+    total = len(ids)
+    positions = np.arange(total)
+    max_workers = max_workers or os.cpu_count() or 1
+    chunk_size = chunk_size or max(1, -(-total // (4 * max_workers)))
+    chunks = [slice(s, s + chunk_size) for s in range(0, total, chunk_size)]
+
+    done = 0
+    if max_workers == 1 or len(chunks) <= 1:
+        for sl in chunks:
+            part = _solve_chunk(positions[sl], ids[sl], C[sl], A[sl], b[sl], ub[sl], maximize, method)
+            done += len(part)
+            yield done, total, part
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(_solve_chunk, positions[sl], ids[sl], C[sl], A[sl], b[sl], ub[sl],
+                               maximize, method)
+                   for sl in chunks]
+        for future in as_completed(futures):
+            part = future.result()
+            done += len(part)
+            yield done, total, part
+
+
+def solve_instances(df, max_workers=None, chunk_size=None, maximize=True, method="simplex"):
+    # Versi headless: seluruh hasil dalam urutan baris masukan.
+    parts = [part for _, _, part in solve_instances_iter(df, max_workers, chunk_size, maximize, method)]
+    if not parts:
+        return pd.DataFrame(columns=["id", "status", "objective"])
+    return pd.concat(parts).sort_index()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (3, 4):
+        sys.exit("Pemakaian: python lp_bulk.py masukan.csv|parquet hasil.csv|parquet [simplex|interior]")
+    start = time.perf_counter()
+    hasil = solve_instances(read_instances(sys.argv[1]), method=sys.argv[3] if len(sys.argv) == 4 else "simplex")
+    out = Path(sys.argv[2])
+    if out.suffix.lower() in (".parquet", ".pq"):
+        hasil.to_parquet(out, index=False)
+    else:
+        hasil.to_csv(out, index=False)
+    elapsed = time.perf_counter() - start
+    print(f"{len(hasil):,} instans diselesaikan dalam {elapsed:.1f} detik "
+          f"({(hasil['status'] == 'optimal').sum():,} optimal) -> {out}")
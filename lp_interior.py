@@ -0,0 +1,202 @@
+import time
+from dataclasses import replace
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.linalg import LinAlgError, qr, solve_triangular
+
+from lp_solver import build_standard_form, solve_standard
+
+# =============== SOLVER INTERIOR POINT (PRIMAL-DUAL MEHROTRA) ===============
+# Alternatif simplex untuk model padat besar (ribuan kendala): jumlah
+# iterasi hampir tidak bergantung pada ukuran model, setiap iterasi satu
+# faktorisasi Cholesky persamaan normal A D A^T. Model standar
+#   min c x,  A x = b,  0 <= x <= u   (setelah digeser ke batas bawah)
+# diselesaikan dengan prediktor-korektor Mehrotra, lalu crossover: basis
+# ditebak dari solusi interior dan simplex dilanjutkan dari basis tersebut
+# sehingga hasil akhir tetap titik pojok (basis, sensitivitas, dsb.).
+
+
+def _cholesky(M):
+    # Cholesky dengan regularisasi kecil bila M hampir singular
+    # (baris kosong atau kendala linear bergantung).
+    reg = 1e-14 * max(1.0, np.abs(np.diag(M)).max(initial=0.0))
+    for _ in range(6):
+        try:
+            return np.linalg.cholesky(M + reg * np.eye(M.shape[0]))
+        except np.linalg.LinAlgError:
+            reg *= 1e3
+    raise np.linalg.LinAlgError("Matriks persamaan normal tidak definit positif")
+
+
+def _normal_solve(L, r):
+    return solve_triangular(L, solve_triangular(L, r, lower=True), lower=True, trans="T")
+
+
+def _max_step(v, dv):
+    # Langkah terbesar (<= 1) agar v + alpha * dv tetap >= 0
+    neg = dv < 0
+    return min(1.0, np.min(-v[neg] / dv[neg], initial=np.inf))
+
+
+def interior_point(A, b, c, u, tol=1e-8, max_iter=100):
+    # Mengembalikan (status, x, y, z, iterasi); status "optimal" atau
+    # "iteration_limit" (termasuk bila iterat divergen: model mungkin tidak
+    # layak atau tidak terbatas, status pastinya ditentukan simplex).
+    m, n = A.shape
+    At = A.T.tocsr() if sp.issparse(A) else A.T
+    F = np.isfinite(u)
+    uF = u[F]
+
+    def normal_matrix(d):
+        M = A @ sp.diags(d) @ At if sp.issparse(A) else (A * d) @ At
+        return M.toarray() if sp.issparse(M) else M
+
+    # Titik awal Mehrotra: solusi kuadrat terkecil lalu digeser ke interior
+    L = _cholesky(normal_matrix(np.ones(n)))
+    x = At @ _normal_solve(L, b)
+    y = _normal_solve(L, A @ c)
+    z = c - At @ y
+    x += max(-1.5 * x.min(initial=0.0), 0.0)
+    z += max(-1.5 * z.min(initial=0.0), 0.0)
+    xz = x @ z
+    x += 0.5 * xz / max(z.sum(), 1e-12) + 1e-2
+    z += 0.5 * xz / max(x.sum(), 1e-12) + 1e-2
+    x[F] = np.where(x[F] < uF, x[F], 0.5 * uF)
+    w = uF - x[F]
+    v = np.full(F.sum(), max(1e-2, z.mean() if n else 1.0))
+    z[F] += v
+
+    norm_b = 1.0 + np.linalg.norm(b)
+    norm_c = 1.0 + np.linalg.norm(c)
+    n_comp = n + F.sum()
+    for it in range(1, max_iter + 1):
+        r_p = b - A @ x
+        r_u = uF - x[F] - w
+        r_d = c - At @ y - z
+        r_d[F] += v
+        primal_obj = c @ x
+        dual_obj = b @ y - uF @ v
+        mu = (x @ z + w @ v) / n_comp
+        if (np.linalg.norm(r_p) / norm_b < tol and np.linalg.norm(r_u) / norm_b < tol
+                and np.linalg.norm(r_d) / norm_c < tol
+                and abs(primal_obj - dual_obj) / (1.0 + abs(primal_obj)) < tol):
+            return "optimal", x, y, z - _spread(v, F, n), it - 1
+        if not np.all(np.isfinite([primal_obj, dual_obj, mu])) or max(np.abs(x).max(), np.abs(y).max(initial=0.0)) > 1e12:
+            break
+
+        theta = z / x
+        theta[F] += v / w
+        d = 1.0 / theta
+        try:
+            L = _cholesky(normal_matrix(d))
+        except np.linalg.LinAlgError:
+            break
+
+        def direction(r_xz, r_wv):
+            # Eliminasi ke persamaan normal A D A^T dy = r_p + A D r
+            r = r_d - r_xz / x
+            r[F] += (r_wv - v * r_u) / w
+            dy = _normal_solve(L, r_p + A @ (d * r))
+            dx = d * (At @ dy - r)
+            dz = (r_xz - z * dx) / x
+            dw = r_u - dx[F]
+            dv = (r_wv - v * dw) / w
+            return dx, dy, dz, dw, dv
+
+        # Prediktor (affine scaling)
+        dx, dy, dz, dw, dv = direction(-x * z, -w * v)
+        a_p = min(_max_step(x, dx), _max_step(w, dw))
+        a_d = min(_max_step(z, dz), _max_step(v, dv))
+        mu_aff = ((x + a_p * dx) @ (z + a_d * dz) + (w + a_p * dw) @ (v + a_d * dv)) / n_comp
+        sigma = (mu_aff / mu) ** 3
+
+        # Korektor dengan pusat sigma * mu
+        dx, dy, dz, dw, dv = direction(sigma * mu - x * z - dx * dz, sigma * mu - w * v - dw * dv)
+        a_p = min(1.0, 0.995 * min(_max_step(x, dx), _max_step(w, dw)))
+        a_d = min(1.0, 0.995 * min(_max_step(z, dz), _max_step(v, dv)))
+        x, w = x + a_p * dx, w + a_p * dw
+        y, z, v = y + a_d * dy, z + a_d * dz, v + a_d * dv
+    return "iteration_limit", x, y, z - _spread(v, F, n), it
+
+
+def _spread(v, F, n):
+    out = np.zeros(n)
+    out[F] = v
+    return out
+
+
+def _crossover_basis(model, x, reduced, active):
+    # Tebak basis dari solusi interior: kolom dengan nilai jauh dari batas
+    # dan reduced cost kecil diutamakan; kekurangan kolom diisi slack atau
+    # variabel buatan (kolom satuan). Mengembalikan (basis, at_upper).
+    A = model.A
+    m, n_std = A.shape
+    span = model.upper - model.lower
+    dist = np.minimum(x - model.lower, np.where(np.isfinite(span), model.upper - x, np.inf))
+    score = np.where(active, dist / (np.abs(reduced) + 1e-12), 0.0)
+    cand = np.flatnonzero(score > 1.0)
+    cand = cand[np.argsort(-score[cand])][:m]
+
+    cols = A[:, cand]
+    cols = cols.toarray() if sp.issparse(cols) else np.asarray(cols, dtype=float)
+    cols = cols / np.maximum(np.linalg.norm(cols, axis=0), 1e-300)
+    # Kolom kandidat diberi bobot besar agar dipilih QR berpivot lebih dulu
+    _, R, piv = qr(np.hstack([1e3 * cols, np.eye(m)]), mode="economic", pivoting=True)
+    diag = np.abs(np.diag(R))
+    rank = int(np.sum(diag > 1e-9 * diag.max(initial=1.0)))
+    chosen = piv[:rank]
+    if rank < m:
+        # Baris yang masih kosong diisi kolom satuan lain
+        rest = np.setdiff1d(np.arange(cand.size, cand.size + m), chosen)[:m - rank]
+        chosen = np.concatenate([chosen, rest])
+
+    picked_cand = cand[chosen[chosen < cand.size]]
+    unit_rows = chosen[chosen >= cand.size] - cand.size
+    # Kolom satuan: slack jika baris <= (dan belum terpilih), selain itu variabel buatan
+    use_slack = (unit_rows < model.n_ub) & ~np.isin(model.n_vars + unit_rows, picked_cand)
+    unit_cols = np.where(use_slack, model.n_vars + unit_rows, n_std + unit_rows)
+    basis = np.concatenate([picked_cand, unit_cols]).astype(int)
+
+    at_upper = np.isfinite(model.upper) & (model.upper - x < x - model.lower)
+    at_upper[basis[basis < n_std]] = False
+    return basis, at_upper
+
+
+def solve_interior(model, tol=1e-8, max_iter=100):
+    # Interior point + crossover pada StandardForm. Jika interior point
+    # gagal konvergen, simplex biasa dipakai (dan menentukan statusnya).
+    start = time.perf_counter()
+    active = model.upper > model.lower
+    A = model.A
+    A_act = A[:, active]
+    if sp.issparse(A_act):
+        A_act = sp.csr_matrix(A_act)
+    b = model.b - A @ model.lower
+    u = (model.upper - model.lower)[active]
+
+    status, ipm_iter = "iteration_limit", 0
+    if active.any():
+        try:
+            status, x_act, _, z_act, ipm_iter = interior_point(A_act, b, model.c[active], u, tol, max_iter)
+        except (np.linalg.LinAlgError, LinAlgError):
+            status = "iteration_limit"
+    if status != "optimal":
+        result = solve_standard(model)
+        return replace(result, ipm_iterations=ipm_iter, solve_time=time.perf_counter() - start)
+
+    x = model.lower.copy()
+    x[active] += x_act
+    reduced = np.zeros(A.shape[1])
+    reduced[active] = z_act
+    basis, at_upper = _crossover_basis(model, x, reduced, active)
+    result = solve_standard(model, basis=basis, at_upper=at_upper)
+    return replace(result, ipm_iterations=ipm_iter, solve_time=time.perf_counter() - start)
+
+
+def solve_lp_interior(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=None,
+                      maximize=True, tol=1e-8, max_iter=100):
+    # Padanan solve_lp dengan backend interior point; hasil akhir LPResult
+    # dari crossover (nit = pivot simplex setelah interior point).
+    model = build_standard_form(c, A_ub, b_ub, A_eq, b_eq, bounds, maximize)
+    return solve_interior(model, tol=tol, max_iter=max_iter)
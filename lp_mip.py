@@ -0,0 +1,168 @@
+import heapq
+import time
+from dataclasses import dataclass, replace
+
+import numpy as np
+
+from lp_solver import build_standard_form, solve_standard
+
+# =============== BRANCH AND BOUND (PRODUKSI UNIT UTUH) ===============
+# Relaksasi LP setiap simpul diselesaikan dengan solver simplex; simpul anak
+# di-warm start dari basis induknya (cukup beberapa pivot dual simplex).
+# Simpul dipilih dengan strategi best-bound dan dipangkas jika batas
+# relaksasinya tidak lebih baik dari solusi bulat terbaik (incumbent).
+
+MIP_MESSAGES = {
+    "optimal": "Solusi bulat optimal ditemukan",
+    "infeasible": "Tidak ada solusi bulat yang layak",
+    "unbounded": "Relaksasi LP tidak terbatas",
+    "node_limit": "Batas jumlah simpul tercapai",
+    "time_limit": "Batas waktu tercapai",
+}
+
+
+@dataclass
+class MIPResult:
+    status: str
+    x: np.ndarray
+    objective: float
+    bound: float
+    gap: float
+    nodes: int
+    lp_iterations: int
+    solve_time: float
+    message: str
+
+    @property
+    def success(self):
+        # Solusi bulat tersedia (optimal atau terbaik saat batas tercapai)
+        return self.x is not None
+
+
+def _relative_gap(incumbent, bound):
+    if not np.isfinite(incumbent):
+        return np.inf
+    return abs(incumbent - bound) / max(1.0, abs(incumbent))
+
+
+def _rounding_heuristic(model, x, integer, tol):
+    # Coba bulatkan solusi relaksasi (ke bawah lalu ke terdekat) dan cek kelayakan.
+    n = model.n_vars
+    A = model.A[:, :n]
+    for rounded in (np.floor(x + tol), np.round(x)):
+        cand = np.where(integer, rounded, x)
+        cand = np.clip(cand, model.lower[:n], model.upper[:n])
+        row = A @ cand
+        ok_ub = np.all(row[:model.n_ub] <= model.b[:model.n_ub] + 1e-9 * max(1.0, np.abs(model.b).max(initial=0.0)))
+        ok_eq = np.allclose(row[model.n_ub:], model.b[model.n_ub:], atol=1e-9)
+        if ok_ub and ok_eq:
+            return cand
+    return None
+
+
+def solve_integer_lp(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=None,
+                     maximize=True, integrality=None, node_limit=10000,
+                     time_limit=10.0, gap_tol=1e-6, int_tol=1e-6):
+    # integrality: array bool per variabel (default semua bulat).
+    start = time.perf_counter()
+    model = build_standard_form(c, A_ub, b_ub, A_eq, b_eq, bounds, maximize)
+    n = model.n_vars
+    integer = np.ones(n, dtype=bool) if integrality is None else np.asarray(integrality, dtype=bool)
+    # Batas variabel bulat boleh langsung dibulatkan ke dalam
+    lower, upper = model.lower.copy(), model.upper.copy()
+    lower[:n] = np.where(integer, np.ceil(lower[:n] - int_tol), lower[:n])
+    upper[:n] = np.where(integer, np.floor(upper[:n] + int_tol), upper[:n])
+    sense = model.sense
+
+    def finish(status, x_best, incumbent, bound, nodes, lp_iter):
+        objective = sense * incumbent if x_best is not None else np.nan
+        if status == "optimal":
+            bound = incumbent
+        return MIPResult(
+            status=status,
+            x=x_best,
+            objective=objective,
+            bound=sense * bound,
+            gap=_relative_gap(incumbent, bound),
+            nodes=nodes,
+            lp_iterations=lp_iter,
+            solve_time=time.perf_counter() - start,
+            message=MIP_MESSAGES[status],
+        )
+
+    if np.any(lower > upper):
+        return finish("infeasible", None, np.inf, np.inf, 0, 0)
+
+    root = solve_standard(replace(model, lower=lower, upper=upper))
+    lp_iter = root.nit
+    if root.status == "unbounded":
+        return finish("unbounded", None, np.inf, -np.inf, 1, lp_iter)
+    if not root.success:
+        return finish("infeasible", None, np.inf, np.inf, 1, lp_iter)
+
+    # Nilai internal (minimasi): incumbent = solusi bulat terbaik
+    incumbent, x_best = np.inf, None
+    heuristic = _rounding_heuristic(model, root.x, integer, int_tol)
+    if heuristic is not None:
+        incumbent, x_best = float(model.c[:n] @ heuristic), heuristic
+
+    counter = 0
+    heap = [(sense * root.objective, counter, lower, upper, root)]
+    nodes = 1
+    while heap:
+        bound = heap[0][0]
+        # Uji gap hanya setelah ada incumbent: inf <= gap_tol * inf bernilai benar
+        if np.isfinite(incumbent) and incumbent - bound <= gap_tol * max(1.0, abs(incumbent)):
+            break
+        if nodes >= node_limit:
+            return finish("node_limit", x_best, incumbent, bound, nodes, lp_iter)
+        if time.perf_counter() - start > time_limit:
+            return finish("time_limit", x_best, incumbent, bound, nodes, lp_iter)
+
+        node_bound, _, node_lower, node_upper, lp = heapq.heappop(heap)
+        if node_bound >= incumbent:
+            continue
+        x = lp.x
+        frac = np.abs(x - np.round(x))
+        frac[~integer] = 0.0
+        j = int(np.argmax(frac))
+        if frac[j] <= int_tol:
+            # Solusi relaksasi sudah bulat: incumbent baru
+            incumbent, x_best = node_bound, np.where(integer, np.round(x), x)
+            continue
+
+        # Cabang x_j <= floor dan x_j >= ceil, di-warm start dari basis induk
+        for side in ("down", "up"):
+            child_lower, child_upper = node_lower.copy(), node_upper.copy()
+            if side == "down":
+                child_upper[j] = np.floor(x[j])
+            else:
+                child_lower[j] = np.ceil(x[j])
+            if child_lower[j] > child_upper[j]:
+                continue
+            child = solve_standard(replace(model, lower=child_lower, upper=child_upper),
+                                   basis=lp.basis, at_upper=lp.at_upper)
+            nodes += 1
+            lp_iter += child.nit
+            if not child.success:
+                continue
+            child_bound = sense * child.objective
+            if child_bound >= incumbent:
+                continue  # dipangkas oleh batas
+            heuristic = _rounding_heuristic(model, child.x, integer, int_tol)
+            if heuristic is not None and model.c[:n] @ heuristic < incumbent:
+                incumbent, x_best = float(model.c[:n] @ heuristic), heuristic
+            counter += 1
+            heapq.heappush(heap, (child_bound, counter, child_lower, child_upper, child))
+
+    if x_best is None:
+        return finish("infeasible", None, np.inf, np.inf, nodes, lp_iter)
+    return finish("optimal", x_best, incumbent, incumbent, nodes, lp_iter)
+
+
+if __name__ == "__main__":
+    # Cek regresi: relaksasi akar x + y = 1.3 pecahan dan pembulatan gagal,
+    # jadi solusi bulat (total 2 unit) hanya ditemukan lewat percabangan.
+    hasil = solve_integer_lp([-1, -1], [[-1, -1]], [-1.3])
+    assert hasil.status == "optimal" and hasil.x.sum() == 2 and hasil.objective == -2, hasil
+    print(f"OK: {hasil.message}, x = {hasil.x}, simpul = {hasil.nodes}")
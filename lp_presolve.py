@@ -0,0 +1,260 @@
+import time
+from dataclasses import dataclass, field
+
+import numpy as np
+import scipy.sparse as sp
+
+from lp_solver import STATUS_MESSAGES, _as_bounds, solve_lp
+
+# =============== PRESOLVE MODEL LP ===============
+# Mengecilkan model sebelum diselesaikan, diulang sampai tidak ada perubahan:
+#   - variabel tetap (batas bawah = batas atas) disubstitusi keluar
+#   - baris kosong dibuang (atau model langsung tidak layak)
+#   - baris singleton  a x_j <= b  /  a x_j = b  diubah menjadi batas x_j
+#   - kolom kosong diisi batas terbaiknya menurut fungsi tujuan
+#   - batas variabel diperketat dari aktivitas minimum baris <=
+#   - baris <= yang aktivitas maksimumnya <= b (redundan) dibuang
+# Postsolve mengembalikan solusi ke ukuran model asli. Harga bayangan model
+# asli tidak tersedia setelah presolve (baris yang dibuang tidak punya dual).
+
+
+@dataclass
+class PresolveReport:
+    rows_before: int
+    cols_before: int
+    rows_after: int = 0
+    cols_after: int = 0
+    fixed_cols: int = 0
+    empty_cols: int = 0
+    empty_rows: int = 0
+    singleton_rows: int = 0
+    redundant_rows: int = 0
+    tightened_bounds: int = 0
+    passes: int = 0
+    time: float = 0.0
+    # Kolom asli yang batas atasnya tersirat dari kendala lain (batas redundan)
+    implied_upper: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=int))
+    # Baris <= asli yang dibuang karena redundan
+    redundant_ub_rows: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=int))
+
+    @property
+    def removed_rows(self):
+        return self.rows_before - self.rows_after
+
+    @property
+    def removed_cols(self):
+        return self.cols_before - self.cols_after
+
+
+@dataclass
+class PresolvedLP:
+    status: str  # "reduced" atau "infeasible"
+    c: np.ndarray
+    A_ub: object
+    b_ub: np.ndarray
+    A_eq: object
+    b_eq: np.ndarray
+    bounds: np.ndarray  # (n, 2), batas atas inf diizinkan
+    cols: np.ndarray  # indeks kolom asli yang tersisa
+    rows_ub: np.ndarray
+    rows_eq: np.ndarray
+    x_fixed: np.ndarray  # nilai kolom yang dikeluarkan (ukuran model asli)
+    maximize: bool
+    report: PresolveReport
+
+    def postsolve(self, x_reduced):
+        x = self.x_fixed.copy()
+        x[self.cols] = x_reduced
+        return x
+
+
+@dataclass
+class PresolvedSolution:
+    status: str
+    x: np.ndarray
+    objective: float
+    message: str
+    presolve: PresolvedLP = field(repr=False)
+    result: object = field(repr=False, default=None)  # LPResult model tereduksi
+
+    @property
+    def success(self):
+        return self.status == "optimal"
+
+
+def _keep_rows(A, keep):
+    return A[np.flatnonzero(keep)]
+
+
+def _keep_cols(A, keep):
+    return A[:, np.flatnonzero(keep)]
+
+
+def presolve(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=None,
+             maximize=True, tol=1e-9, max_passes=20):
+    start = time.perf_counter()
+    c = np.asarray(c, dtype=float).ravel()
+    n = c.size
+    sparse = sp.issparse(A_ub) or sp.issparse(A_eq)
+    A_ub = sp.csr_matrix((0, n)) if A_ub is None else sp.csr_matrix(A_ub, dtype=float)
+    A_eq = sp.csr_matrix((0, n)) if A_eq is None else sp.csr_matrix(A_eq, dtype=float)
+    b_ub = np.zeros(0) if b_ub is None else np.asarray(b_ub, dtype=float).ravel().copy()
+    b_eq = np.zeros(0) if b_eq is None else np.asarray(b_eq, dtype=float).ravel().copy()
+    lower, upper = _as_bounds(bounds, n)
+    original_upper = upper.copy()
+
+    cols = np.arange(n)
+    rows_ub = np.arange(A_ub.shape[0])
+    rows_eq = np.arange(A_eq.shape[0])
+    x_fixed = np.zeros(n)
+    report = PresolveReport(rows_before=A_ub.shape[0] + A_eq.shape[0], cols_before=n)
+    redundant_ub = []
+    sense = 1.0 if maximize else -1.0
+    status = "reduced"
+
+    def bound_tol(v):
+        return tol * (1.0 + np.abs(np.where(np.isfinite(v), v, 0.0)))
+
+    for _ in range(max_passes):
+        report.passes += 1
+        changed = False
+        A_ub.eliminate_zeros()
+        A_eq.eliminate_zeros()
+
+        # Variabel tetap: substitusi ke ruas kanan
+        fixed = upper - lower <= bound_tol(lower)
+        if fixed.any():
+            value = lower[fixed]
+            b_ub -= _keep_cols(A_ub, fixed) @ value
+            b_eq -= _keep_cols(A_eq, fixed) @ value
+            x_fixed[cols[fixed]] = value
+            keep = ~fixed
+            A_ub, A_eq = _keep_cols(A_ub, keep), _keep_cols(A_eq, keep)
+            c, lower, upper, cols = c[keep], lower[keep], upper[keep], cols[keep]
+            report.fixed_cols += int(fixed.sum())
+            changed = True
+
+        # Baris kosong
+        nnz_ub, nnz_eq = np.diff(A_ub.indptr), np.diff(A_eq.indptr)
+        if np.any(b_ub[nnz_ub == 0] < -bound_tol(b_ub[nnz_ub == 0])) or \
+                np.any(np.abs(b_eq[nnz_eq == 0]) > bound_tol(b_eq[nnz_eq == 0])):
+            status = "infeasible"
+            break
+
+        # Baris singleton menjadi batas variabel
+        single_ub, single_eq = nnz_ub == 1, nnz_eq == 1
+        if single_ub.any():
+            rows = np.flatnonzero(single_ub)
+            j = A_ub.indices[A_ub.indptr[rows]]
+            a = A_ub.data[A_ub.indptr[rows]]
+            limit = b_ub[rows] / a
+            np.minimum.at(upper, j[a > 0], limit[a > 0])
+            np.maximum.at(lower, j[a < 0], limit[a < 0])
+        if single_eq.any():
+            rows = np.flatnonzero(single_eq)
+            j = A_eq.indices[A_eq.indptr[rows]]
+            value = b_eq[rows] / A_eq.data[A_eq.indptr[rows]]
+            np.minimum.at(upper, j, value)
+            np.maximum.at(lower, j, value)
+        drop_ub, drop_eq = (nnz_ub == 0) | single_ub, (nnz_eq == 0) | single_eq
+        report.empty_rows += int((nnz_ub == 0).sum() + (nnz_eq == 0).sum())
+        report.singleton_rows += int(single_ub.sum() + single_eq.sum())
+
+        # Kolom kosong: pilih batas terbaik menurut fungsi tujuan
+        nnz_col = np.bincount(A_ub.indices, minlength=c.size) + np.bincount(A_eq.indices, minlength=c.size)
+        # (kolom yang membuat tujuan tak terbatas dibiarkan: solver yang
+        # memutuskan, karena sisa model bisa saja tidak layak)
+        gain = sense * c
+        empty = (nnz_col == 0) & ~((gain > 0) & ~np.isfinite(upper))
+        if empty.any():
+            gain = gain[empty]
+            best = np.where(gain > 0, upper[empty], lower[empty])
+            lower[empty] = upper[empty] = best
+            report.empty_cols += int(empty.sum())
+            changed = True
+
+        # Aktivitas minimum/maksimum baris <= (batas bawah selalu berhingga)
+        live = ~drop_ub
+        m_ub = A_ub.shape[0]
+        row_of = np.repeat(np.arange(m_ub), np.diff(A_ub.indptr))
+        a, j = A_ub.data, A_ub.indices
+        lo_c = np.where(a > 0, a * lower[j], a * upper[j])
+        hi_c = np.where(a > 0, a * upper[j], a * lower[j])
+        inf_lo = np.bincount(row_of, weights=np.isinf(lo_c), minlength=m_ub)
+        inf_hi = np.bincount(row_of, weights=np.isinf(hi_c), minlength=m_ub)
+        min_act = np.bincount(row_of, weights=np.where(np.isinf(lo_c), 0.0, lo_c), minlength=m_ub)
+        max_act = np.bincount(row_of, weights=np.where(np.isinf(hi_c), 0.0, hi_c), minlength=m_ub)
+
+        if np.any(live & (inf_lo == 0) & (min_act > b_ub + bound_tol(b_ub))):
+            status = "infeasible"
+            break
+        redundant = live & (inf_hi == 0) & (max_act <= b_ub + bound_tol(b_ub))
+        redundant_ub.extend(rows_ub[redundant].tolist())
+        report.redundant_rows += int(redundant.sum())
+        drop_ub |= redundant
+
+        # Pengetatan batas dari baris yang tersisa: slack = b - aktivitas minimum
+        use = (live & ~redundant)[row_of] & (inf_lo[row_of] == 0)
+        slack = (b_ub - min_act)[row_of]
+        new_upper = np.full(c.size, np.inf)
+        new_lower = np.full(c.size, -np.inf)
+        pos = use & (a > 0)
+        neg = use & (a < 0) & np.isfinite(upper[j])
+        np.minimum.at(new_upper, j[pos], lower[j[pos]] + slack[pos] / a[pos])
+        np.maximum.at(new_lower, j[neg], upper[j[neg]] + slack[neg] / a[neg])
+        tighter_u = new_upper < upper - bound_tol(upper) * 1e3
+        tighter_l = new_lower > lower + bound_tol(lower) * 1e3
+        upper = np.where(tighter_u, new_upper, upper)
+        lower = np.where(tighter_l, new_lower, lower)
+        report.tightened_bounds += int(tighter_u.sum() + tighter_l.sum())
+
+        if np.any(lower > upper + bound_tol(upper)):
+            status = "infeasible"
+            break
+        upper = np.maximum(upper, lower)
+
+        if drop_ub.any() or drop_eq.any():
+            A_ub, b_ub, rows_ub = _keep_rows(A_ub, ~drop_ub), b_ub[~drop_ub], rows_ub[~drop_ub]
+            A_eq, b_eq, rows_eq = _keep_rows(A_eq, ~drop_eq), b_eq[~drop_eq], rows_eq[~drop_eq]
+            changed = True
+        changed |= bool(tighter_u.any() or tighter_l.any())
+        if not changed:
+            break
+
+    report.rows_after = A_ub.shape[0] + A_eq.shape[0]
+    report.cols_after = c.size
+    implied = np.isfinite(original_upper[cols]) & (upper < original_upper[cols] - bound_tol(upper))
+    report.implied_upper = cols[implied]
+    report.redundant_ub_rows = np.array(sorted(redundant_ub), dtype=int)
+    report.time = time.perf_counter() - start
+    if not sparse:
+        A_ub, A_eq = A_ub.toarray(), A_eq.toarray()
+    return PresolvedLP(
+        status=status, c=c, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=b_eq,
+        bounds=np.column_stack([lower, upper]), cols=cols, rows_ub=rows_ub, rows_eq=rows_eq,
+        x_fixed=x_fixed, maximize=maximize, report=report,
+    )
+
+
+def solve_presolved(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=None,
+                    maximize=True, solver=solve_lp, **kwargs):
+    # Presolve, selesaikan model tereduksi dengan solver (solve_lp,
+    # solve_lp_interior, ...), lalu postsolve ke ukuran model asli.
+    reduced = presolve(c, A_ub, b_ub, A_eq, b_eq, bounds, maximize)
+    c_full = np.asarray(c, dtype=float).ravel()
+    if reduced.status != "reduced":
+        return PresolvedSolution(status=reduced.status, x=None, objective=np.nan,
+                                 message=STATUS_MESSAGES[reduced.status], presolve=reduced)
+    result = None
+    status = "optimal"
+    x_reduced = np.zeros(0)
+    if reduced.c.size:
+        result = solver(reduced.c, reduced.A_ub, reduced.b_ub, reduced.A_eq, reduced.b_eq,
+                        bounds=reduced.bounds, maximize=maximize, **kwargs)
+        status, x_reduced = result.status, result.x
+    if status != "optimal":
+        return PresolvedSolution(status=status, x=None, objective=result.objective,
+                                 message=result.message, presolve=reduced, result=result)
+    x = reduced.postsolve(x_reduced)
+    return PresolvedSolution(status=status, x=x, objective=float(c_full @ x),
+                             message=STATUS_MESSAGES[status], presolve=reduced, result=result)
@@ -0,0 +1,125 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from lp_solver import basis_matrix
+
+# =============== ANALISIS SENSITIVITAS DARI BASIS OPTIMAL ===============
+# Semua besaran dihitung dari basis akhir solver tanpa menyelesaikan ulang:
+#   - harga bayangan (shadow price) setiap kendala
+#   - reduced cost setiap variabel
+#   - rentang koefisien fungsi tujuan agar basis tetap optimal
+#   - rentang ruas kanan agar basis tetap layak
+# Nilai dilaporkan dalam arti model asli (maksimasi/minimasi).
+
+
+@dataclass
+class SensitivityReport:
+    shadow_prices: np.ndarray
+    rhs: np.ndarray
+    rhs_low: np.ndarray
+    rhs_high: np.ndarray
+    reduced_costs: np.ndarray
+    objective: np.ndarray
+    objective_low: np.ndarray
+    objective_high: np.ndarray
+    is_basic: np.ndarray
+
+
+def _ratio_bounds(numer, denom, upper_side, tol, axis=-1):
+    # Rentang delta agar  numer - delta * denom >= 0 (upper_side=False)
+    # atau  numer - delta * denom <= 0 (upper_side=True) di sepanjang axis.
+    sign = np.where(upper_side, -1.0, 1.0)
+    a = sign * denom
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = numer / denom
+    high = np.where(a > tol, ratio, np.inf).min(axis=axis, initial=np.inf)
+    low = np.where(a < -tol, ratio, -np.inf).max(axis=axis, initial=-np.inf)
+    return low, high
+
+
+def sensitivity_report(result, tol=1e-9):
+    if not result.success:
+        raise ValueError("Analisis sensitivitas hanya untuk solusi optimal")
+    model = result.model
+    A, c, b = model.A, model.c, model.b
+    m, n_std = A.shape
+    n = model.n_vars
+    basis = result.basis
+    Binv = np.linalg.inv(basis_matrix(model, basis))
+
+    is_basic = np.zeros(n_std, dtype=bool)
+    is_basic[basis[basis < n_std]] = True
+    x = np.where(result.at_upper, model.upper, model.lower)
+    x[is_basic] = 0.0
+    x_B = Binv @ (b - A @ x)
+
+    c_B = np.zeros(m)
+    c_B[basis < n_std] = c[basis[basis < n_std]]
+    y = c_B @ Binv
+    d = c - A.T @ y
+
+    # Variabel non-basis yang membatasi perubahan (variabel tetap diabaikan)
+    nonbasic = ~is_basic & (model.upper > model.lower)
+    at_upper_nb = result.at_upper[nonbasic]
+    d_nb = d[nonbasic]
+
+    # Rentang koefisien tujuan (dalam bentuk minimasi internal).
+    # Non-basis: hanya reduced cost-nya sendiri yang berubah.
+    obj_low = np.where(result.at_upper[:n], -np.inf, -d[:n])
+    obj_high = np.where(result.at_upper[:n], -d[:n], np.inf)
+    fixed = model.upper[:n] <= model.lower[:n]
+    obj_low[fixed], obj_high[fixed] = -np.inf, np.inf
+    # Basis: seluruh reduced cost non-basis bergeser sebesar -delta * baris tableau
+    rows = np.flatnonzero(basis < n)
+    if rows.size:
+        tableau = (A.T @ Binv[rows].T).T[:, nonbasic]
+        low, high = _ratio_bounds(d_nb, tableau, at_upper_nb, tol)
+        obj_low[basis[rows]], obj_high[basis[rows]] = low, high
+
+    # Rentang ruas kanan: x_B + delta * Binv[:, i] tetap dalam batasnya
+    real = basis < n_std
+    lb = np.zeros(m)
+    ub = np.zeros(m)
+    lb[real], ub[real] = model.lower[basis[real]], model.upper[basis[real]]
+    lo_a, hi_a = _ratio_bounds((x_B - lb)[:, None], -Binv, False, tol, axis=0)
+    lo_b, hi_b = _ratio_bounds((x_B - ub)[:, None], -Binv, True, tol, axis=0)
+    rhs_low = b + np.maximum(lo_a, lo_b)
+    rhs_high = b + np.minimum(hi_a, hi_b)
+
+    # Kembalikan ke arti model asli; untuk maksimasi rentang dibalik
+    sense = model.sense
+    c_user = sense * c[:n]
+    delta_low, delta_high = (obj_low, obj_high) if sense > 0 else (-obj_high, -obj_low)
+    return SensitivityReport(
+        shadow_prices=sense * y + 0.0,
+        rhs=b.copy(),
+        rhs_low=rhs_low,
+        rhs_high=rhs_high,
+        reduced_costs=sense * d[:n] + 0.0,
+        objective=c_user,
+        objective_low=c_user + delta_low,
+        objective_high=c_user + delta_high,
+        is_basic=is_basic[:n],
+    )
+
+
+def sensitivity_frames(report, var_names, row_names):
+    # Tabel siap tampil untuk halaman Optimasi: (variabel, kendala).
+    variabel = pd.DataFrame({
+        "Variabel": var_names,
+        "Basis": report.is_basic,
+        "Reduced cost": report.reduced_costs,
+        "Koefisien": report.objective,
+        "Koefisien min": report.objective_low,
+        "Koefisien maks": report.objective_high,
+    })
+    kendala = pd.DataFrame({
+        "Kendala": row_names,
+        "Harga bayangan": report.shadow_prices,
+        "Ruas kanan": report.rhs,
+        "Ruas kanan min": report.rhs_low,
+        "Ruas kanan maks": report.rhs_high,
+    })
+    return variabel, kendala
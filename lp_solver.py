@@ -0,0 +1,544 @@
+import time
+from dataclasses import dataclass, field
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import splu
+
+# =============== SOLVER LINEAR PROGRAMMING (REVISED SIMPLEX) ===============
+# Bentuk umum model:
+#   maks/min  c x
+#   dengan    A_ub x <= b_ub
+#             A_eq x  = b_eq
+#             lower <= x <= upper
+# Kendala diubah ke bentuk standar A x = b dengan variabel slack, lalu
+# diselesaikan dengan revised simplex dua fase untuk variabel berbatas
+# (variabel non-basis boleh berada di batas bawah maupun batas atas).
+# Matriks kendala boleh padat (ndarray) atau sparse (CSR/COO/CSC SciPy);
+# model sparse disimpan sebagai CSC dan basisnya difaktorkan dengan LU
+# sparse plus eta file sehingga matriks padat tidak pernah dibentuk.
+
+STATUS_MESSAGES = {
+    "optimal": "Solusi optimal ditemukan",
+    "infeasible": "Model tidak memiliki solusi layak",
+    "unbounded": "Fungsi tujuan tidak terbatas",
+    "iteration_limit": "Batas iterasi tercapai sebelum optimal",
+}
+
+
+@dataclass
+class StandardForm:
+    A: np.ndarray
+    b: np.ndarray
+    c: np.ndarray
+    lower: np.ndarray
+    upper: np.ndarray
+    n_vars: int
+    n_ub: int
+    n_eq: int
+    sense: float  # 1.0 untuk minimasi, -1.0 untuk maksimasi
+
+
+@dataclass
+class LPResult:
+    status: str
+    x: np.ndarray
+    objective: float
+    basis: np.ndarray
+    at_upper: np.ndarray
+    slack: np.ndarray
+    nit: int
+    solve_time: float
+    message: str
+    model: StandardForm = field(repr=False)
+    method: str = "cold"  # "cold", "warm_primal" atau "warm_dual"
+    ipm_iterations: int = 0  # iterasi interior point sebelum crossover
+
+    @property
+    def success(self):
+        return self.status == "optimal"
+
+
+def _as_bounds(bounds, n):
+    if bounds is None:
+        bounds = (0, None)
+    if isinstance(bounds, np.ndarray) and bounds.ndim == 2:
+        # Array (n, 2) dari model besar; NaN berarti tanpa batas
+        if bounds.shape != (n, 2):
+            raise ValueError("Jumlah batas variabel tidak sama dengan jumlah variabel")
+        lower = np.where(np.isnan(bounds[:, 0]), -np.inf, bounds[:, 0]).astype(float)
+        upper = np.where(np.isnan(bounds[:, 1]), np.inf, bounds[:, 1]).astype(float)
+    else:
+        if len(bounds) == 2 and not np.iterable(bounds[0]):
+            bounds = [bounds] * n
+        if len(bounds) != n:
+            raise ValueError("Jumlah batas variabel tidak sama dengan jumlah variabel")
+        lower = np.array([-np.inf if lo is None else lo for lo, _ in bounds], dtype=float)
+        upper = np.array([np.inf if hi is None else hi for _, hi in bounds], dtype=float)
+    if np.any(np.isinf(lower)):
+        raise ValueError("Batas bawah setiap variabel harus berhingga")
+    if np.any(lower > upper):
+        raise ValueError("Batas bawah lebih besar dari batas atas")
+    return lower, upper
+
+
+def _as_matrix(A, n, sparse):
+    if A is None:
+        return sp.csc_matrix((0, n)) if sparse else np.zeros((0, n))
+    if sparse:
+        return sp.csc_matrix(A, dtype=float)
+    return np.atleast_2d(np.asarray(A, dtype=float))
+
+
+def build_standard_form(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None,
+                        bounds=None, maximize=True):
+    c = np.asarray(c, dtype=float).ravel()
+    n = c.size
+    sparse = sp.issparse(A_ub) or sp.issparse(A_eq)
+    A_ub = _as_matrix(A_ub, n, sparse)
+    A_eq = _as_matrix(A_eq, n, sparse)
+    b_ub = np.zeros(0) if b_ub is None else np.asarray(b_ub, dtype=float).ravel()
+    b_eq = np.zeros(0) if b_eq is None else np.asarray(b_eq, dtype=float).ravel()
+    if A_ub.shape[1] != n or A_eq.shape[1] != n:
+        raise ValueError("Jumlah kolom matriks kendala harus sama dengan jumlah variabel")
+    if A_ub.shape[0] != b_ub.size or A_eq.shape[0] != b_eq.size:
+        raise ValueError("Jumlah baris kendala tidak sama dengan panjang ruas kanan")
+    m_ub, m_eq = A_ub.shape[0], A_eq.shape[0]
+    lower, upper = _as_bounds(bounds, n)
+
+    sense = -1.0 if maximize else 1.0
+    if sparse:
+        A = sp.bmat([[A_ub, sp.identity(m_ub)], [A_eq, None]], format="csc")
+    else:
+        A = np.zeros((m_ub + m_eq, n + m_ub))
+        A[:m_ub, :n] = A_ub
+        A[:m_ub, n:] = np.eye(m_ub)
+        A[m_ub:, :n] = A_eq
+    return StandardForm(
+        A=A,
+        b=np.concatenate([b_ub, b_eq]),
+        c=np.concatenate([sense * c, np.zeros(m_ub)]),
+        lower=np.concatenate([lower, np.zeros(m_ub)]),
+        upper=np.concatenate([upper, np.full(m_ub, np.inf)]),
+        n_vars=n, n_ub=m_ub, n_eq=m_eq, sense=sense,
+    )
+
+
+class _DenseBasis:
+    # Invers basis eksplisit dengan pembaruan rank-1 (cepat untuk model kecil).
+    def __init__(self, B):
+        self.Binv = np.linalg.inv(B) if B.shape[0] else np.zeros((0, 0))
+
+    def ftran(self, v):
+        return self.Binv @ v
+
+    def btran(self, u):
+        return u @ self.Binv
+
+    def update(self, r, alpha):
+        alpha = alpha.copy()
+        pivot = alpha[r]
+        alpha[r] = 0.0
+        self.Binv[r] /= pivot
+        self.Binv -= np.outer(alpha, self.Binv[r])
+
+
+class _SparseBasis:
+    # Faktor LU sparse dari basis awal ditambah eta file (product form):
+    # B_k^-1 = E_k ... E_1 B_0^-1, setiap E hanya menyimpan kolom alpha.
+    def __init__(self, B):
+        self.lu = splu(sp.csc_matrix(B))
+        self.etas = []
+
+    def ftran(self, v):
+        w = self.lu.solve(np.asarray(v, dtype=float))
+        for r, idx, vals, pivot in self.etas:
+            t = w[r] / pivot
+            w[idx] -= t * vals
+            w[r] = t
+        return w
+
+    def btran(self, u):
+        u = np.array(u, dtype=float)
+        for r, idx, vals, pivot in reversed(self.etas):
+            u[r] -= (u[idx] @ vals - u[r]) / pivot
+        return self.lu.solve(u, trans="T")
+
+    def update(self, r, alpha):
+        idx = np.flatnonzero(alpha)
+        self.etas.append((r, idx, alpha[idx], alpha[r]))
+
+
+def _factor(A, basis):
+    if len(basis) == 0:
+        return _DenseBasis(np.zeros((0, 0)))
+    if sp.issparse(A):
+        return _SparseBasis(A[:, basis])
+    return _DenseBasis(A[:, basis])
+
+
+def _column(A, j):
+    # Kolom j sebagai vektor padat; untuk CSC langsung dari indptr.
+    if sp.issparse(A):
+        col = np.zeros(A.shape[0])
+        start, end = A.indptr[j], A.indptr[j + 1]
+        col[A.indices[start:end]] = A.data[start:end]
+        return col
+    return A[:, j]
+
+
+def _transpose(A):
+    # A^T sekali saja dalam format CSR agar perkalian A^T y per iterasi murah.
+    return A.T.tocsr() if sp.issparse(A) else A.T
+
+
+def _hstack(A, B):
+    if sp.issparse(A):
+        return sp.hstack([A, B], format="csc")
+    return np.hstack([A, B.toarray() if sp.issparse(B) else B])
+
+
+def _simplex_core(A, b, c, lower, upper, basis, at_upper, max_iter,
+                  tol=1e-9, refactor_every=50):
+    # Iterasi revised simplex untuk variabel berbatas dengan pricing Devex.
+    # Reduced cost diperbarui dari baris pivot, dihitung ulang saat refaktor.
+    # Mengembalikan (status, x, basis, at_upper, jumlah iterasi).
+    m, n = A.shape
+    basis = np.array(basis, dtype=int)
+    at_upper = np.array(at_upper, dtype=bool)
+    is_basic = np.zeros(n, dtype=bool)
+    is_basic[basis] = True
+    movable = (upper - lower) > 0
+    dual_tol = tol * max(1.0, np.abs(c).max(initial=0.0))
+    At = _transpose(A)
+
+    x = np.where(at_upper, upper, lower)
+    x[basis] = 0.0
+    factor = _factor(A, basis)
+    x[basis] = factor.ftran(b - A @ x)
+    weights = np.ones(n)
+    fresh = False
+
+    degenerate_run = 0
+    for it in range(max_iter):
+        if it and it % refactor_every == 0:
+            factor = _factor(A, basis)
+            x[basis] = 0.0
+            x[basis] = factor.ftran(b - A @ x)
+            fresh = False
+        if not fresh:
+            # Pricing penuh: d = c - A^T y dengan y = c_B B^-1
+            d = c - At @ factor.btran(c[basis])
+            d[basis] = 0.0
+            fresh = True
+
+        # Perbaikan fungsi tujuan jika variabel non-basis digeser dari batasnya
+        gain = np.where(at_upper, d, -d)
+        gain[is_basic | ~movable] = 0.0
+        eligible = gain > dual_tol
+        if not eligible.any():
+            if it % refactor_every:
+                # Pastikan optimalitas dengan reduced cost yang dihitung ulang
+                d = c - At @ factor.btran(c[basis])
+                d[basis] = 0.0
+                gain = np.where(at_upper, d, -d)
+                gain[is_basic | ~movable] = 0.0
+                eligible = gain > dual_tol
+            if not eligible.any():
+                return "optimal", x, basis, at_upper, it
+
+        bland = degenerate_run > 50
+        if bland:
+            j = int(np.flatnonzero(eligible)[0])
+        else:
+            j = int(np.argmax(np.where(eligible, gain * gain / weights, -1.0)))
+        step_sign = -1.0 if at_upper[j] else 1.0
+        alpha = factor.ftran(_column(A, j))
+        delta = -step_sign * alpha
+
+        # Ratio test hanya pada elemen kolom alpha yang tidak nol
+        rows = np.flatnonzero(np.abs(delta) > tol)
+        xb, lb, ub, dr = x[basis[rows]], lower[basis[rows]], upper[basis[rows]], delta[rows]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t_low = np.where(dr < 0, (xb - lb) / -dr, np.inf)
+            t_up = np.where(dr > 0, (ub - xb) / dr, np.inf)
+        ratios = np.maximum(np.minimum(t_low, t_up), 0.0)
+        if rows.size == 0:
+            k, t = -1, np.inf
+        elif bland:
+            ties = np.flatnonzero(ratios <= ratios.min() + tol)
+            k = int(ties[np.argmin(basis[rows[ties]])])
+            t = ratios[k]
+        else:
+            k = int(np.argmin(ratios))
+            t = ratios[k]
+        t_flip = upper[j] - lower[j]
+
+        if not np.isfinite(min(t, t_flip)):
+            return "unbounded", x, basis, at_upper, it
+
+        degenerate_run = degenerate_run + 1 if min(t, t_flip) <= tol else 0
+        if t_flip <= t:
+            # Variabel masuk langsung berpindah ke batas lainnya tanpa ganti basis
+            x[j] += step_sign * t_flip
+            x[basis] += delta * t_flip
+            at_upper[j] = not at_upper[j]
+            continue
+
+        x[j] += step_sign * t
+        x[basis] += delta * t
+        r = rows[k]
+        leaving = basis[r]
+
+        # Baris pivot r dari B^-1 A untuk memperbarui reduced cost dan bobot Devex
+        unit = np.zeros(m)
+        unit[r] = 1.0
+        alpha_row = At @ factor.btran(unit)
+        pivot = alpha[r]
+        d -= (d[j] / pivot) * alpha_row
+        ratio_sq = (alpha_row / pivot) ** 2
+        weights = np.maximum(weights, ratio_sq * weights[j])
+        weights[leaving] = max(weights[j] / pivot ** 2, 1.0)
+
+        to_upper = t_up[k] <= t_low[k]
+        x[leaving] = upper[leaving] if to_upper else lower[leaving]
+        at_upper[leaving] = to_upper
+        at_upper[j] = False
+        is_basic[leaving] = False
+        is_basic[j] = True
+        basis[r] = j
+        d[j] = 0.0
+        factor.update(r, alpha)
+
+    return "iteration_limit", x, basis, at_upper, max_iter
+
+
+def _dual_simplex_core(A, b, c, lower, upper, basis, at_upper, max_iter,
+                       tol=1e-9, refactor_every=50):
+    # Dual simplex untuk variabel berbatas, dimulai dari basis yang layak dual
+    # (reduced cost bertanda benar) tetapi belum tentu layak primal.
+    m, n = A.shape
+    basis = np.array(basis, dtype=int)
+    at_upper = np.array(at_upper, dtype=bool)
+    is_basic = np.zeros(n, dtype=bool)
+    is_basic[basis] = True
+    movable = (upper - lower) > 0
+    primal_tol = tol * max(1.0, np.abs(b).max(initial=0.0))
+    At = _transpose(A)
+    factor = _factor(A, basis)
+
+    for it in range(max_iter):
+        if it and it % refactor_every == 0:
+            factor = _factor(A, basis)
+        x = np.where(at_upper, upper, lower)
+        x[basis] = 0.0
+        x[basis] = factor.ftran(b - A @ x)
+
+        xb, lb, ub = x[basis], lower[basis], upper[basis]
+        violation = np.maximum(lb - xb, xb - ub)
+        r = int(np.argmax(violation)) if m else -1
+        if m == 0 or violation[r] <= primal_tol:
+            return "optimal", x, basis, at_upper, it
+        to_upper = xb[r] > ub[r]
+
+        y = factor.btran(c[basis])
+        d = c - At @ y
+        unit = np.zeros(m)
+        unit[r] = 1.0
+        alpha_r = At @ factor.btran(unit)
+        # Variabel masuk harus menggeser x_B[r] kembali ke batasnya
+        direction = alpha_r if to_upper else -alpha_r
+        eligible = ~is_basic & movable & np.where(at_upper, direction < -tol, direction > tol)
+        if not eligible.any():
+            return "infeasible", x, basis, at_upper, it
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratios = np.where(eligible, np.abs(d) / np.abs(alpha_r), np.inf)
+        j = int(np.argmin(ratios))
+
+        leaving = basis[r]
+        at_upper[leaving] = to_upper
+        at_upper[j] = False
+        is_basic[leaving] = False
+        is_basic[j] = True
+        basis[r] = j
+        factor.update(r, factor.ftran(_column(A, j)))
+
+    return "iteration_limit", x, basis, at_upper, max_iter
+
+
+def _initial_basis(model):
+    # Basis awal: slack untuk kendala <=, variabel buatan untuk sisanya.
+    A, b = model.A, model.b
+    m, n = A.shape
+    x = model.lower.copy()
+    x[model.n_vars:] = 0.0
+    residual = b - A[:, :model.n_vars] @ x[:model.n_vars]
+
+    basis = np.empty(m, dtype=int)
+    art_rows, art_signs = [], []
+    for i in range(m):
+        if i < model.n_ub and residual[i] >= 0:
+            basis[i] = model.n_vars + i
+        else:
+            basis[i] = n + len(art_rows)
+            art_rows.append(i)
+            art_signs.append(1.0 if residual[i] >= 0 else -1.0)
+
+    k = len(art_rows)
+    art = sp.csc_matrix((art_signs, (art_rows, np.arange(k))), shape=(m, k))
+    return basis, art, np.array(art_rows, dtype=int)
+
+
+def _drive_out_artificials(A, basis, n_real, tol=1e-9):
+    # Keluarkan variabel buatan bernilai nol dari basis bila ada kolom pengganti.
+    m = A.shape[0]
+    factor = _factor(A, basis)
+    for r in np.flatnonzero(basis >= n_real):
+        unit = np.zeros(m)
+        unit[r] = 1.0
+        row = (A.T @ factor.btran(unit))[:n_real]
+        row[basis[basis < n_real]] = 0.0
+        candidates = np.flatnonzero(np.abs(row) > tol)
+        if candidates.size:
+            j = candidates[np.argmax(np.abs(row[candidates]))]
+            basis[r] = j
+            factor = _factor(A, basis)
+    return basis
+
+
+def _warm_solve(model, basis, at_upper, max_iter, tol, start):
+    # Mulai dari basis sebelumnya. Kolom satuan [A, I] menampung variabel
+    # buatan yang masih di basis (dikunci di nol). Mengembalikan None jika
+    # basis tidak dapat dipakai sehingga perlu solve dari awal.
+    m, n = model.A.shape
+    basis = np.asarray(basis, dtype=int)
+    if basis.shape != (m,) or np.asarray(at_upper).shape != (n,):
+        return None
+    A = _hstack(model.A, sp.identity(m, format="csc"))
+    lower = np.concatenate([model.lower, np.zeros(m)])
+    upper = np.concatenate([model.upper, np.zeros(m)])
+    c = np.concatenate([model.c, np.zeros(m)])
+    at_upper = np.concatenate([at_upper, np.zeros(m, dtype=bool)]) & np.isfinite(upper)
+    at_upper[basis] = False
+
+    try:
+        factor = _factor(A, basis)
+    except (np.linalg.LinAlgError, RuntimeError):
+        return None  # basis singular
+    x = np.where(at_upper, upper, lower)
+    x[basis] = 0.0
+    x_B = factor.ftran(model.b - A @ x)
+    primal_tol = 1e-9 * max(1.0, np.abs(model.b).max(initial=0.0))
+    primal_feasible = np.all(x_B >= lower[basis] - primal_tol) and np.all(x_B <= upper[basis] + primal_tol)
+
+    all_rows = np.arange(m)
+    if primal_feasible:
+        status, x, basis, at_upper, nit = _simplex_core(
+            A, model.b, c, lower, upper, basis, at_upper, max_iter, tol)
+        return _make_result(model, status, x, basis, at_upper, all_rows, nit, start, "warm_primal")
+
+    d = c - A.T @ factor.btran(c[basis])
+    dual_tol = tol * max(1.0, np.abs(c).max(initial=0.0))
+    nonbasic = np.ones(n + m, dtype=bool)
+    nonbasic[basis] = False
+    nonbasic &= upper > lower
+    dual_feasible = np.all(np.where(at_upper, d <= dual_tol, d >= -dual_tol)[nonbasic])
+    if not dual_feasible:
+        return None
+    status, x, basis, at_upper, nit = _dual_simplex_core(
+        A, model.b, c, lower, upper, basis, at_upper, max_iter, tol)
+    if status == "optimal":
+        # Bersihkan sisa toleransi dual dengan primal simplex (biasanya 0 iterasi)
+        status, x, basis, at_upper, extra = _simplex_core(
+            A, model.b, c, lower, upper, basis, at_upper, max_iter - nit, tol)
+        nit += extra
+    return _make_result(model, status, x, basis, at_upper, all_rows, nit, start, "warm_dual")
+
+
+def solve_standard(model, max_iter=None, tol=1e-9, basis=None, at_upper=None):
+    # Warm start dari basis sebelumnya bila diberikan dan masih dapat dipakai,
+    # jika tidak fase 1 (jika perlu variabel buatan) lalu fase 2.
+    start = time.perf_counter()
+    m, n = model.A.shape
+    max_iter = max_iter or 50 * (m + n) + 100
+    if basis is not None:
+        result = _warm_solve(model, basis, at_upper, max_iter, tol, start)
+        if result is not None:
+            return result
+    basis, art, art_rows = _initial_basis(model)
+    k = art.shape[1]
+
+    A = _hstack(model.A, art)
+    lower = np.concatenate([model.lower, np.zeros(k)])
+    upper = np.concatenate([model.upper, np.full(k, np.inf)])
+    at_upper = np.zeros(n + k, dtype=bool)
+    nit = 0
+
+    if k:
+        c1 = np.concatenate([np.zeros(n), np.ones(k)])
+        status, x, basis, at_upper, it = _simplex_core(
+            A, model.b, c1, lower, upper, basis, at_upper, max_iter, tol)
+        nit += it
+        infeasibility = x[n:].sum()
+        if status == "iteration_limit":
+            return _make_result(model, status, x, basis, at_upper, art_rows, nit, start)
+        if infeasibility > 1e-7 * max(1.0, np.abs(model.b).max(initial=0.0)):
+            return _make_result(model, "infeasible", x, basis, at_upper, art_rows, nit, start)
+        basis = _drive_out_artificials(A, basis, n, tol)
+        upper[n:] = 0.0
+
+    c2 = np.concatenate([model.c, np.zeros(k)])
+    status, x, basis, at_upper, it = _simplex_core(
+        A, model.b, c2, lower, upper, basis, at_upper, max_iter - nit, tol)
+    nit += it
+    return _make_result(model, status, x, basis, at_upper, art_rows, nit, start)
+
+
+def basis_matrix(model, basis):
+    # Matriks basis B; indeks >= jumlah kolom standar menandai variabel
+    # buatan pada baris (indeks - jumlah kolom), yaitu kolom satuan.
+    n_std = model.A.shape[1]
+    B = np.zeros((model.A.shape[0], len(basis)))
+    real = basis < n_std
+    cols = model.A[:, basis[real]]
+    B[:, real] = cols.toarray() if sp.issparse(cols) else cols
+    B[basis[~real] - n_std, np.flatnonzero(~real)] = 1.0
+    return B
+
+
+def _make_result(model, status, x, basis, at_upper, art_rows, nit, start, method="cold"):
+    # Indeks variabel buatan di basis dikodekan ulang sebagai n_std + baris.
+    n_std = model.A.shape[1]
+    basis = basis.copy()
+    artificial = basis >= n_std
+    basis[artificial] = n_std + art_rows[basis[artificial] - n_std]
+    x, at_upper = x[:n_std], at_upper[:n_std]
+    n = model.n_vars
+    objective = model.sense * float(model.c[:n] @ x[:n])
+    if status == "unbounded":
+        objective = -model.sense * np.inf
+    return LPResult(
+        status=status,
+        x=x[:n].copy(),
+        objective=objective,
+        basis=basis.copy(),
+        at_upper=at_upper.copy(),
+        slack=model.b - model.A[:, :n] @ x[:n],
+        nit=nit,
+        solve_time=time.perf_counter() - start,
+        message=STATUS_MESSAGES[status],
+        model=model,
+        method=method,
+    )
+
+
+def solve_lp(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=None,
+             maximize=True, max_iter=None, warm_start=None):
+    # Bentuk model standar lalu selesaikan; default memaksimalkan keuntungan
+    # dengan x >= 0 seperti pada halaman Optimasi. warm_start: LPResult
+    # sebelumnya dengan ukuran model yang sama.
+    model = build_standard_form(c, A_ub, b_ub, A_eq, b_eq, bounds, maximize)
+    if warm_start is not None and warm_start.success:
+        return solve_standard(model, max_iter=max_iter,
+                              basis=warm_start.basis, at_upper=warm_start.at_upper)
+    return solve_standard(model, max_iter=max_iter)
@@ -0,0 +1,66 @@
+import time
+from dataclasses import dataclass
+
+from lp_solver import solve_lp
+
+# =============== CACHE WARM START UNTUK SOLVE ULANG LP ===============
+# Menyimpan basis optimal terakhir per model (misalnya di st.session_state)
+# sehingga perubahan satu koefisien cukup diselesaikan dari basis lama
+# dengan primal simplex (basis masih layak) atau dual simplex (basis masih
+# optimal tetapi tidak layak). Solve dari awal hanya jika keduanya gagal.
+
+
+@dataclass
+class WarmStartStats:
+    solves: int = 0
+    warm_primal: int = 0
+    warm_dual: int = 0
+    cold: int = 0
+    pivots: int = 0
+    pivots_saved: int = 0
+    solve_time: float = 0.0
+    last_pivots: int = 0
+    last_pivots_saved: int = 0
+    last_method: str = ""
+    last_time: float = 0.0
+
+
+class WarmStartCache:
+    def __init__(self):
+        self.results = {}
+        self.cold_pivots = {}  # jumlah pivot solve dingin terakhir sebagai pembanding
+        self.stats = WarmStartStats()
+
+    def solve(self, key, c, A_ub=None, b_ub=None, A_eq=None, b_eq=None,
+              bounds=None, maximize=True):
+        start = time.perf_counter()
+        result = solve_lp(c, A_ub, b_ub, A_eq, b_eq, bounds, maximize,
+                          warm_start=self.results.get(key))
+        elapsed = time.perf_counter() - start
+
+        if result.method == "cold":
+            self.cold_pivots[key] = result.nit
+            saved = 0
+        else:
+            saved = max(self.cold_pivots.get(key, result.nit) - result.nit, 0)
+        if result.success:
+            self.results[key] = result
+        else:
+            self.results.pop(key, None)
+
+        stats = self.stats
+        stats.solves += 1
+        setattr(stats, result.method, getattr(stats, result.method) + 1)
+        stats.pivots += result.nit
+        stats.pivots_saved += saved
+        stats.solve_time += elapsed
+        stats.last_pivots = result.nit
+        stats.last_pivots_saved = saved
+        stats.last_method = result.method
+        stats.last_time = elapsed
+        return result
+
+    def clear(self):
+        self.results.clear()
+        self.cold_pivots.clear()
+        self.stats = WarmStartStats()
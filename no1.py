@@ -1,6 +1,9 @@
 import streamlit as st
 import matplotlib.pyplot as plt
 import numpy as np
+import pandas as pd
+
+from lp_multiperiod import solve_multiperiod
 
 st.title("🔥 Optimasi Produksi PT. Bakar-Bakar")
 
@@ -12,35 +15,77 @@ with col1:
 with col2:
     waktu_mingguan = st.number_input("Total Waktu Mingguan (menit)", value=1200)
 
+col1, col2 = st.columns(2)
+with col1:
+    hari_kerja = st.number_input("Hari Kerja per Minggu", min_value=1, value=5)
+with col2:
+    jumlah_minggu = st.number_input("Horizon Perencanaan (minggu)", min_value=1, max_value=52, value=1)
+
+st.subheader("Data Produk")
+data_produk = st.data_editor(
+    pd.DataFrame({
+        "Produk": ["Sosis Bakar", "Baso Bakar"],
+        "Waktu (menit/unit)": [2.0, 3.0],
+        "Keuntungan (Rp/unit)": [500.0, 1000.0],
+        "Permintaan Harian (0 = tanpa batas)": [0.0, 0.0],
+        "Biaya Simpan (Rp/unit/periode)": [0.0, 0.0],
+    }),
+    num_rows="dynamic",
+    use_container_width=True,
+)
+data_produk = data_produk.dropna()
+
 # Hitung Solusi
 if st.button("🎯 Hitung Solusi Optimal"):
-    # Solusi Harian
-    y_harian = waktu_harian / 3
-    z_harian = 1000 * y_harian
+    nama = data_produk["Produk"].tolist()
+    waktu = data_produk["Waktu (menit/unit)"].to_numpy(dtype=float)
+    untung = data_produk["Keuntungan (Rp/unit)"].to_numpy(dtype=float)
+    permintaan = data_produk["Permintaan Harian (0 = tanpa batas)"].to_numpy(dtype=float)
+    permintaan = np.where(permintaan > 0, permintaan, np.inf)
+    biaya_simpan = data_produk["Biaya Simpan (Rp/unit/periode)"].to_numpy(dtype=float)
+
+    # Harian: satu periode; Mingguan: periode per hari kerja dengan persediaan
+    # dibawa ke hari berikutnya (permintaan harian tiap hari)
+    rencana_harian = solve_multiperiod([waktu_harian], waktu, untung, demand=permintaan,
+                                       holding_cost=biaya_simpan)
+    n_hari = int(hari_kerja * jumlah_minggu)
+    rencana_mingguan = solve_multiperiod(np.full(n_hari, waktu_mingguan / hari_kerja), waktu, untung,
+                                         demand=permintaan, holding_cost=biaya_simpan)
 
-    # Solusi Mingguan
-    y_mingguan = waktu_mingguan / 3
-    z_mingguan = 1000 * y_mingguan
+    if not (rencana_harian.success and rencana_mingguan.success):
+        st.error(f"❌ {rencana_harian.message} / {rencana_mingguan.message}")
+        st.stop()
+
+    produksi_harian = rencana_harian.production[0]
+    produksi_mingguan = rencana_mingguan.production.sum(axis=0)
 
     # Tampilkan Hasil
     st.success(f"""
-    **🔹 Harian (4 Jam)**  
-    - Produksi: **0 sosis bakar**, **{y_harian:.0f} baso bakar**  
-    - Keuntungan Maksimal: **Rp{z_harian:,.0f}**  
+    **🔹 Harian ({waktu_harian / 60:g} Jam)**  
+    - Produksi: {", ".join(f"**{q:.0f} {n.lower()}**" for n, q in zip(nama, produksi_harian))}  
+    - Keuntungan Maksimal: **Rp{rencana_harian.profit:,.0f}**  
 
-    **🔹 Mingguan (20 Jam)**  
-    - Produksi: **0 sosis bakar**, **{y_mingguan:.0f} baso bakar**  
-    - Keuntungan Maksimal: **Rp{z_mingguan:,.0f}**  
+    **🔹 Mingguan ({n_hari} hari, {waktu_mingguan / 60:g} Jam/minggu)**  
+    - Produksi: {", ".join(f"**{q:.0f} {n.lower()}**" for n, q in zip(nama, produksi_mingguan))}  
+    - Keuntungan Maksimal: **Rp{rencana_mingguan.profit:,.0f}**  
     """)
 
-    # Grafik Kendala Harian
+    st.subheader("📅 Rencana Produksi per Hari")
+    periode = [f"Hari {t + 1}" for t in range(n_hari)]
+    tabel = pd.concat({
+        "Produksi": pd.DataFrame(rencana_mingguan.production, index=periode, columns=nama),
+        "Persediaan Akhir": pd.DataFrame(rencana_mingguan.inventory, index=periode, columns=nama),
+    }, axis=1)
+    tabel["Waktu Terpakai (menit)"] = rencana_mingguan.capacity_used
+    st.dataframe(tabel.round(2), use_container_width=True)
+
+    # Grafik produksi per periode
     fig, ax = plt.subplots()
-    x = np.linspace(0, waktu_harian/2, 100)
-    y = (waktu_harian - 2*x) / 3
-    ax.plot(x, y, label="Kendala Waktu Harian")
-    ax.fill_between(x, 0, y, alpha=0.1)
-    ax.scatter(0, y_harian, color="red", label="Solusi Optimal")
-    ax.set_xlabel("Sosis Bakar (x)")
-    ax.set_ylabel("Baso Bakar (y)")
+    bawah = np.zeros(n_hari)
+    for j, n in enumerate(nama):
+        ax.bar(np.arange(1, n_hari + 1), rencana_mingguan.production[:, j], bottom=bawah, label=n)
+        bawah += rencana_mingguan.production[:, j]
+    ax.set_xlabel("Hari")
+    ax.set_ylabel("Unit Diproduksi")
     ax.legend()
     st.pyplot(fig)
@@ -0,0 +1,159 @@
+from dataclasses import dataclass
+
+import numpy as np
+from scipy.special import gammaincc, gammaln
+
+# =============== ANTRIAN M/M/c (ERLANG C) ===============
+# Beban a = lambda/mu, c server, utilisasi rho = a/c. Erlang B dihitung di
+# ruang log lewat hubungan dengan distribusi Poisson:
+#   B(c, a) = P(N = c) / P(N <= c),  N ~ Poisson(a)
+# dengan log P(N = c) = c ln a - a - ln c! dan P(N <= c) = Q(c + 1, a)
+# (fungsi gamma tak lengkap teregularisasi), sehingga tetap stabil untuk c
+# ribuan (a^c dan c! tidak pernah dihitung langsung). Lalu
+#   C(c, a) = B / (1 - rho (1 - B))     = P(menunggu)
+#   Wq = C / (c mu - lambda),  P(Wq > t) = C exp(-(c mu - lambda) t)
+# Semua fungsi menerima skalar atau array (dibroadcast); sistem tidak
+# stabil (rho >= 1) menghasilkan P(menunggu) = 1 dan waktu tunggu inf.
+
+
+@dataclass
+class QueueMetrics:
+    servers: np.ndarray
+    utilization: np.ndarray  # rho
+    p_wait: np.ndarray  # Erlang C
+    Wq: np.ndarray
+    Lq: np.ndarray
+    W: np.ndarray
+    L: np.ndarray
+    stable: np.ndarray
+
+    def wait_quantile(self, p, arrival_rate, service_rate):
+        return wait_quantile(arrival_rate, service_rate, self.servers, p)
+
+
+def erlang_b(a, c):
+    a, c = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(c, dtype=float))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_pmf = np.where(a > 0, c * np.log(np.where(a > 0, a, 1.0)) - a - gammaln(c + 1), np.where(c == 0, 0.0, -np.inf))
+        log_cdf = np.log(gammaincc(c + 1, a))
+        return np.exp(log_pmf - log_cdf)
+
+
+def erlang_c(a, c):
+    a, c = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(c, dtype=float))
+    B = erlang_b(a, c)
+    rho = np.where(c > 0, a / np.where(c > 0, c, 1.0), np.inf)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        C = B / (1.0 - rho * (1.0 - B))
+    return np.where(rho < 1.0, np.clip(C, 0.0, 1.0), 1.0)
+
+
+def mmc_metrics(arrival_rate, service_rate, servers):
+    lam, mu, c = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (arrival_rate, service_rate, servers)))
+    if np.any(mu <= 0) or np.any(lam < 0) or np.any(c < 1) or np.any(c != np.floor(c)):
+        raise ValueError("Butuh λ >= 0, μ > 0 dan jumlah server bilangan bulat >= 1")
+    a = lam / mu
+    rho = a / c
+    stable = rho < 1.0
+    C = erlang_c(a, c)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Wq = np.where(stable, C / (c * mu - lam), np.inf)
+    Lq = np.where(stable, lam * Wq, np.inf)
+    W = Wq + 1.0 / mu
+    return QueueMetrics(c.astype(int), rho, C, Wq, Lq, W, np.where(stable, lam * W, np.inf), stable)
+
+
+def service_level(arrival_rate, service_rate, servers, target_wait):
+    # P(Wq <= target_wait): peluang pelanggan menunggu paling lama target_wait
+    lam, mu, c, t = np.broadcast_arrays(*(np.asarray(v, dtype=float)
+                                          for v in (arrival_rate, service_rate, servers, target_wait)))
+    C = erlang_c(lam / mu, c)
+    with np.errstate(over="ignore", invalid="ignore"):
+        level = 1.0 - C * np.exp(-(c * mu - lam) * t)
+    return np.where(lam < c * mu, level, 0.0)
+
+
+def wait_quantile(arrival_rate, service_rate, servers, p):
+    # Waktu tunggu kuantil p (mis. p = 0.95 -> P95): 0 bila P(menunggu) <= 1 - p
+    lam, mu, c, p = np.broadcast_arrays(*(np.asarray(v, dtype=float)
+                                          for v in (arrival_rate, service_rate, servers, p)))
+    C = erlang_c(lam / mu, c)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.log(C / (1.0 - p)) / (c * mu - lam)
+    return np.where(lam < c * mu, np.maximum(np.where(C > 0, t, 0.0), 0.0), np.inf)
+
+
+# =============== OPTIMASI JUMLAH SERVER (STAFFING) ===============
+# Biaya per jam(c) = c * biaya_server + lambda * Wq(c) * biaya_menunggu.
+# Wq(c) turun dan konveks terhadap c, sehingga biaya total unimodal:
+# semua pasangan (lambda, mu) dinaikkan c bersama dari c minimum stabil
+# sampai biaya naik (pasangan yang sudah berhenti di-mask). Jumlah server
+# minimum untuk target Wq / kuantil waktu tunggu dicari dengan
+# penggandaan lalu bisection, juga serentak untuk semua pasangan.
+
+
+@dataclass
+class StaffingResult:
+    servers: np.ndarray
+    server_cost: np.ndarray
+    waiting_cost: np.ndarray
+    total_cost: np.ndarray
+    metrics: QueueMetrics
+
+
+def _min_stable_servers(lam, mu):
+    return np.floor(lam / mu) + 1.0
+
+
+def _staffing_result(lam, mu, c, server_cost, waiting_cost):
+    m = mmc_metrics(lam, mu, c)
+    servers_cost = c * server_cost
+    waiting = lam * m.Wq * waiting_cost
+    return StaffingResult(c.astype(int), servers_cost, waiting, servers_cost + waiting, m)
+
+
+def optimal_staffing(arrival_rate, service_rate, server_cost, waiting_cost, max_servers=100_000):
+    # Jumlah server dengan biaya total per jam terkecil untuk setiap pasangan.
+    lam, mu, cs, cw = np.broadcast_arrays(*(np.asarray(v, dtype=float)
+                                            for v in (arrival_rate, service_rate, server_cost, waiting_cost)))
+    lam, mu, cs, cw = (np.atleast_1d(v).copy() for v in (lam, mu, cs, cw))
+    c = _min_stable_servers(lam, mu)
+    cost = c * cs + lam * mmc_metrics(lam, mu, c).Wq * cw
+    active = np.ones(c.shape, dtype=bool)
+    while active.any():
+        idx = np.flatnonzero(active)
+        trial = c[idx] + 1.0
+        trial_cost = trial * cs[idx] + lam[idx] * mmc_metrics(lam[idx], mu[idx], trial).Wq * cw[idx]
+        better = (trial_cost < cost[idx]) & (trial <= max_servers)
+        c[idx[better]] = trial[better]
+        cost[idx[better]] = trial_cost[better]
+        active[idx[~better]] = False
+    return _staffing_result(lam, mu, c, cs, cw)
+
+
+def min_servers(arrival_rate, service_rate, target_wait, quantile=None, max_servers=100_000):
+    # Server minimum agar Wq rata-rata <= target_wait (quantile=None) atau
+    # kuantil waktu tunggu (mis. quantile=0.95 -> P95) <= target_wait.
+    lam, mu, target = np.broadcast_arrays(*(np.asarray(v, dtype=float)
+                                            for v in (arrival_rate, service_rate, target_wait)))
+    lam, mu, target = (np.atleast_1d(v) for v in (lam, mu, target))
+
+    def ok(c):
+        wait = mmc_metrics(lam, mu, c).Wq if quantile is None else wait_quantile(lam, mu, c, quantile)
+        return wait <= target
+
+    lo = _min_stable_servers(lam, mu) - 1.0  # tidak stabil: selalu gagal
+    hi = lo + 1.0
+    failing = ~ok(hi)
+    while failing.any():
+        # Penggandaan langkah hanya untuk pasangan yang belum memenuhi target
+        step = hi - lo
+        lo = np.where(failing, hi, lo)
+        hi = np.where(failing, np.minimum(hi + 2.0 * step, max_servers), hi)
+        failing = ~ok(hi) & (hi < max_servers)
+    while np.any(hi - lo > 1):
+        mid = np.floor((lo + hi) / 2.0)
+        good = ok(np.maximum(mid, 1.0)) & (mid > lo)
+        hi = np.where(good & (hi - lo > 1), mid, hi)
+        lo = np.where(~good & (hi - lo > 1), mid, lo)
+    return np.where(ok(hi), hi, np.nan)
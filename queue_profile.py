@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+
+from queue_mmc import min_servers, mmc_metrics, optimal_staffing
+
+# =============== PROFIL KEDATANGAN BERUBAH TERHADAP WAKTU ===============
+# Pendekatan piecewise-stationary (PSA): hari dibagi interval (mis. per
+# jam) dan setiap interval dianggap antrian M/M/c stasioner dengan lambda
+# interval tersebut. Semua interval dihitung sekaligus lewat fungsi Erlang C
+# tervektorisasi: jumlah server optimal biaya, jumlah server minimum untuk
+# target waktu tunggu, dan ukuran kinerja pada jumlah server yang dipakai
+# (maksimum keduanya). Pendekatan ini mengabaikan antrian yang terbawa antar
+# interval, jadi cukup akurat bila lama layanan jauh lebih pendek dari
+# panjang interval.
+
+PROFILE_COLUMNS = {
+    "jam": "interval", "interval": "interval", "periode": "interval",
+    "lambda": "kedatangan", "λ": "kedatangan", "kedatangan": "kedatangan",
+    "mu": "pelayanan", "μ": "pelayanan", "pelayanan": "pelayanan",
+}
+
+
+def normalize_profile(df):
+    # Seragamkan nama kolom profil (jam/interval, lambda/kedatangan, mu opsional)
+    df = df.rename(columns={c: PROFILE_COLUMNS[c] for c in df.columns if c in PROFILE_COLUMNS})
+    if "kedatangan" not in df.columns:
+        raise ValueError("Profil harus memuat kolom kedatangan (lambda per jam)")
+    if "interval" not in df.columns:
+        df = df.assign(interval=np.arange(len(df)))
+    return df.dropna(subset=["kedatangan"]).reset_index(drop=True)
+
+
+def profile_staffing(df, service_rate, server_cost, waiting_cost, target_wait=None, quantile=None,
+                     interval_hours=1.0):
+    # Tabel profil -> tabel per interval dengan kolom server dan kinerja.
+    # Kolom pelayanan (mu per interval) menggantikan service_rate bila ada.
+    df = normalize_profile(df)
+    lam = df["kedatangan"].to_numpy(dtype=float)
+    mu = df["pelayanan"].to_numpy(dtype=float) if "pelayanan" in df.columns else np.full(lam.size, float(service_rate))
+    if np.any(lam < 0) or np.any(mu <= 0):
+        raise ValueError("Kedatangan harus >= 0 dan pelayanan > 0 di setiap interval")
+
+    optimum = optimal_staffing(lam, mu, server_cost, waiting_cost)
+    servers = optimum.servers.astype(float)
+    out = df[["interval", "kedatangan"]].copy()
+    out["pelayanan"] = mu
+    out["server_optimal_biaya"] = optimum.servers
+    if target_wait is not None:
+        target = min_servers(lam, mu, target_wait, quantile)
+        out["server_min_target"] = pd.Series(target).astype("Int64")
+        servers = np.fmax(servers, target)
+    out["server"] = servers.astype(int)
+
+    m = mmc_metrics(lam, mu, servers)
+    out["utilisasi"] = m.utilization
+    out["p_menunggu"] = m.p_wait
+    out["wq_menit"] = m.Wq * 60
+    out["lq"] = m.Lq
+    out["biaya_server"] = servers * server_cost * interval_hours
+    out["biaya_menunggu"] = lam * m.Wq * waiting_cost * interval_hours
+    out["biaya_total"] = out["biaya_server"] + out["biaya_menunggu"]
+    return out
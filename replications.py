@@ -0,0 +1,116 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+
+import numpy as np
+import pandas as pd
+from scipy.stats import t as student_t
+
+from inventory_sim import simulate_eoq_policy
+from queue_sim import simulate_queue
+
+# =============== REPLIKASI PARALEL DENGAN INTERVAL KEPERCAYAAN ===============
+# Replikasi independen sebuah simulasi dijalankan per putaran (batch) di
+# ProcessPoolExecutor. Seed tiap replikasi berasal dari
+# SeedSequence(seed).spawn(...), jadi aliran acak antar replikasi
+# independen dan hasil hanya bergantung pada seed dan jumlah replikasi,
+# bukan pada jumlah pekerja atau urutan selesai. Setelah setiap putaran,
+# rata-rata dan interval kepercayaan t-Student dihitung. Replikasi berhenti
+# lebih awal bila half-width metrik target <= target (absolut, atau relatif
+# terhadap rata-rata bila relative=True). Fungsi replikasi harus
+# didefinisikan di tingkat modul (dapat di-pickle): f(seed, **kwargs) -> dict.
+
+
+def queue_replication(seed, **kwargs):
+    hasil = asdict(simulate_queue(seed=seed, **kwargs))
+    hasil.pop("elapsed")
+    return hasil
+
+
+def inventory_replication(seed, **kwargs):
+    # Satu replikasi = satu batch simulasi persediaan tervektorisasi
+    return simulate_eoq_policy(seed=seed, **kwargs).summary()
+
+
+@dataclass
+class ReplicationSummary:
+    samples: pd.DataFrame  # satu baris per replikasi
+    statistics: pd.DataFrame  # per metrik: rata2, std, half_width, bawah, atas
+    confidence: float
+    converged: bool  # target half-width tercapai
+    elapsed: float
+
+    @property
+    def replications(self):
+        return len(self.samples)
+
+
+def confidence_intervals(samples, confidence=0.95):
+    # Rata-rata dan interval kepercayaan t-Student untuk setiap kolom numerik
+    numeric = samples.select_dtypes("number")
+    n = numeric.count()
+    mean = numeric.mean()
+    std = numeric.std(ddof=1)
+    quantile = student_t.ppf(0.5 + confidence / 2, np.maximum(n - 1, 1))
+    half = np.where(n > 1, quantile * std / np.sqrt(n), np.inf)
+    return pd.DataFrame({"rata2": mean, "std": std, "half_width": half,
+                         "bawah": mean - half, "atas": mean + half, "n": n})
+
+
+def _converged(stats, target_metrics, target_half_width, relative):
+    if target_half_width is None:
+        return False
+    rows = stats.loc[list(target_metrics)]
+    limit = target_half_width * rows["rata2"].abs() if relative else target_half_width
+    return bool(np.all(rows["half_width"] <= limit))
+
+
+def _seeds(sequence, n):
+    # Entropi 128-bit per replikasi: diterima default_rng maupun SeedSequence
+    return [child.generate_state(4).tolist() for child in sequence.spawn(n)]
+
+
+def iter_replications(func, kwargs=None, target_metrics=None, target_half_width=None, relative=True,
+                      confidence=0.95, min_replications=10, max_replications=200, batch_size=None,
+                      max_workers=None, seed=None):
+    # Generator ReplicationSummary setelah setiap putaran (untuk progress bar).
+    kwargs = kwargs or {}
+    max_workers = max_workers or os.cpu_count() or 1
+    batch_size = batch_size or max(2 * max_workers, 4)
+    sequence = np.random.SeedSequence(seed)
+    start = time.perf_counter()
+    rows = []
+    pool = ProcessPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+    try:
+        while len(rows) < max_replications:
+            n = min(batch_size if rows else max(batch_size, min_replications), max_replications - len(rows))
+            seeds = _seeds(sequence, n)
+            if pool is None:
+                rows.extend(func(s, **kwargs) for s in seeds)
+            else:
+                # map menjaga urutan replikasi sehingga hasil dapat diulang
+                rows.extend(pool.map(_call, [(func, s, kwargs) for s in seeds]))
+            samples = pd.DataFrame(rows)
+            stats = confidence_intervals(samples, confidence)
+            targets = target_metrics or list(stats.index)
+            converged = len(rows) >= min_replications and _converged(stats, targets, target_half_width, relative)
+            yield ReplicationSummary(samples, stats, confidence, converged, time.perf_counter() - start)
+            if converged:
+                return
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+
+def _call(job):
+    func, seed, kwargs = job
+    return func(seed, **kwargs)
+
+
+def run_replications(func, kwargs=None, **options):
+    # Versi headless: ringkasan terakhir.
+    summary = None
+    for summary in iter_replications(func, kwargs, **options):
+        pass
+    return summary
@@ -0,0 +1,118 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import wraps
+
+import numpy as np
+import pandas as pd
+
+# =============== CACHE HASIL LINTAS SESI ===============
+# Streamlit menjalankan ulang skrip setiap klik, tetapi modul yang diimpor
+# hanya dimuat sekali per proses. Cache di sini karena itu dipakai bersama
+# oleh semua sesi pengguna: input yang sama (setelah dinormalisasi) cukup
+# dihitung sekali. LRU dengan batas jumlah entri dan umur (TTL).
+# Hasil yang dikembalikan dipakai bersama, jangan diubah di tempat.
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expired: int = 0
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResultCache:
+    def __init__(self, max_entries=256, ttl=3600.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._entries = OrderedDict()  # key -> (waktu simpan, nilai)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        # Mengembalikan (ditemukan, nilai); entri kedaluwarsa dibuang.
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] > self.ttl:
+                del self._entries[key]
+                self.stats.expired += 1
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return True, entry[1]
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.stats = CacheStats()
+
+
+def normalize_key(value):
+    # Bentuk kunci hashable yang stabil: angka numpy jadi angka Python,
+    # float dibulatkan ke 12 digit signifikan (5 dan 5.0 sama), array dan
+    # tabel diwakili isi byte-nya.
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        value = float(value)
+        if np.isnan(value):
+            return "nan"  # NaN != NaN, tidak bisa dipakai sebagai kunci
+        return value if np.isinf(value) else float(f"{value:.12g}") + 0.0
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            return ("array", value.shape, normalize_key(value.tolist()))
+        return ("array", value.shape, value.dtype.str, np.ascontiguousarray(value).tobytes())
+    if isinstance(value, pd.DataFrame):
+        return ("frame", tuple(map(str, value.columns)),
+                pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    if isinstance(value, (list, tuple)):
+        return tuple(normalize_key(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), normalize_key(v)) for k, v in value.items()))
+    return value
+
+
+# Satu cache bersama per proses server
+MODEL_CACHE = ResultCache(max_entries=512, ttl=3600.0)
+
+
+def cached(name, cache=MODEL_CACHE):
+    # Dekorator untuk fungsi komputasi murni. Kunci memakai nama (bukan
+    # identitas fungsi) karena fungsi di skrip Streamlit didefinisikan ulang
+    # setiap rerun.
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (name, normalize_key(args), normalize_key(kwargs))
+            found, value = cache.get(key)
+            if found:
+                return value
+            value = func(*args, **kwargs)
+            cache.put(key, value)
+            return value
+        wrapper.cache = cache
+        return wrapper
+    return decorator
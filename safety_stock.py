@@ -0,0 +1,143 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from scipy.stats import norm
+
+from eoq_batch import SKU_COLUMNS
+
+# =============== SAFETY STOCK & ROP STOKASTIK ===============
+# ROP = rata-rata permintaan selama lead time + safety stock, dengan
+# tingkat layanan = peluang tidak kehabisan stok dalam satu siklus.
+#   normal   : SS = z * sqrt(L * sd_d^2 + d^2 * sd_L^2)
+#   empiris  : kuantil permintaan selama lead time dari histori harian
+#              (jendela bergulir sepanjang L hari, atau L diambil acak dari
+#              sampel lead time historis), SS = kuantil - rata-rata
+# Semua SKU dan semua tingkat layanan dihitung sekaligus: hasil (n, s).
+
+SERVICE_LEVELS = (0.90, 0.95, 0.98, 0.99)
+
+
+@dataclass
+class SafetyStockResult:
+    service_level: np.ndarray  # (s,)
+    lead_time_demand: np.ndarray  # (n,) rata-rata permintaan selama lead time
+    safety_stock: np.ndarray  # (n, s)
+    rop: np.ndarray  # (n, s)
+
+
+def empirical_quantile(samples, q):
+    # Kuantil per baris (interpolasi linear seperti np.quantile) yang
+    # mengabaikan NaN; jauh lebih cepat dari np.nanquantile untuk array 2D.
+    samples = np.atleast_2d(np.asarray(samples, dtype=float))
+    q = np.atleast_1d(np.asarray(q, dtype=float))
+    ordered = np.sort(samples, axis=1)  # NaN di akhir
+    count = np.sum(~np.isnan(ordered), axis=1)
+    pos = q[None, :] * np.maximum(count - 1, 0)[:, None]
+    lo = np.floor(pos).astype(int)
+    hi = np.minimum(lo + 1, np.maximum(count - 1, 0)[:, None])
+    frac = pos - lo
+    v_lo = np.take_along_axis(ordered, lo, axis=1)
+    v_hi = np.take_along_axis(ordered, hi, axis=1)
+    out = v_lo + frac * (v_hi - v_lo)
+    out[count == 0] = np.nan
+    return out
+
+
+def normal_safety_stock(daily_mean, daily_std, lead_time, lead_time_std=0.0,
+                        service_level=SERVICE_LEVELS):
+    # Parameter per SKU (skalar atau (n,)), lead time dalam hari.
+    d, sd, L, sd_L = (np.atleast_1d(np.asarray(v, dtype=float))
+                      for v in (daily_mean, daily_std, lead_time, lead_time_std))
+    d, sd, L, sd_L = np.broadcast_arrays(d, sd, L, sd_L)
+    level = np.atleast_1d(np.asarray(service_level, dtype=float))
+    z = norm.ppf(level)
+    sigma = np.sqrt(L * sd ** 2 + d ** 2 * sd_L ** 2)
+    mean_ltd = d * L
+    safety = np.maximum(z[None, :] * sigma[:, None], 0.0)
+    return SafetyStockResult(level, mean_ltd, safety, mean_ltd[:, None] + safety)
+
+
+def lead_time_demand_windows(history, lead_time):
+    # Permintaan total setiap jendela L hari berurutan, (n, T) berisi NaN
+    # untuk jendela yang melewati ujung histori. history: (n, T) harian.
+    history = np.atleast_2d(np.asarray(history, dtype=float))
+    n, T = history.shape
+    L = np.broadcast_to(np.rint(np.asarray(lead_time, dtype=float)).astype(int), (n,))
+    cs = np.concatenate([np.zeros((n, 1)), np.cumsum(np.nan_to_num(history), axis=1)], axis=1)
+    nan_cs = np.concatenate([np.zeros((n, 1)), np.cumsum(np.isnan(history), axis=1)], axis=1)
+    start = np.arange(T)[None, :]
+    end = np.minimum(start + L[:, None], T)
+    total = np.take_along_axis(cs, end, axis=1) - cs[:, :T]
+    missing = np.take_along_axis(nan_cs, end, axis=1) - nan_cs[:, :T]
+    valid = (start + L[:, None] <= T) & (missing == 0) & (L[:, None] > 0)
+    return np.where(valid, total, np.nan)
+
+
+def empirical_safety_stock(history, lead_time, service_level=SERVICE_LEVELS,
+                           lead_time_samples=None, n_samples=2000, seed=None):
+    # history: (n, T) permintaan harian (NaN = tidak ada data).
+    # lead_time_samples: (n, m) lead time historis per SKU (opsional); jika
+    # ada, permintaan lead time dibangkitkan dari jendela acak dengan L acak.
+    history = np.atleast_2d(np.asarray(history, dtype=float))
+    n, T = history.shape
+    level = np.atleast_1d(np.asarray(service_level, dtype=float))
+    if lead_time_samples is None:
+        ltd = lead_time_demand_windows(history, lead_time)
+    else:
+        rng = np.random.default_rng(seed)
+        samples = np.atleast_2d(np.asarray(lead_time_samples, dtype=float))
+        samples = np.broadcast_to(samples, (n, samples.shape[1]))
+        # L acak per sampel dari lead time historis (NaN diabaikan)
+        count = np.sum(~np.isnan(samples), axis=1)
+        ordered = np.sort(samples, axis=1)
+        pick = (rng.random((n, n_samples)) * np.maximum(count, 1)[:, None]).astype(int)
+        L = np.rint(np.take_along_axis(ordered, pick, axis=1)).astype(int)
+        L = np.clip(L, 1, T)
+        start = (rng.random((n, n_samples)) * (T - L + 1)).astype(int)
+        cs = np.concatenate([np.zeros((n, 1)), np.cumsum(np.nan_to_num(history), axis=1)], axis=1)
+        nan_cs = np.concatenate([np.zeros((n, 1)), np.cumsum(np.isnan(history), axis=1)], axis=1)
+        ltd = np.take_along_axis(cs, start + L, axis=1) - np.take_along_axis(cs, start, axis=1)
+        # Jendela yang memuat hari tanpa data dibuang, sama seperti jendela bergulir
+        missing = np.take_along_axis(nan_cs, start + L, axis=1) - np.take_along_axis(nan_cs, start, axis=1)
+        ltd[missing > 0] = np.nan
+        ltd[count == 0] = np.nan
+    if np.isnan(ltd).all():
+        raise ValueError("Tidak ada jendela lead time dengan data lengkap; histori terlalu pendek atau kosong")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_ltd = np.nansum(ltd, axis=1) / np.sum(~np.isnan(ltd), axis=1)
+    quantile = empirical_quantile(ltd, level)
+    safety = np.maximum(quantile - mean_ltd[:, None], 0.0)
+    return SafetyStockResult(level, mean_ltd, safety, mean_ltd[:, None] + safety)
+
+
+def history_matrix(df, sku="sku", date="tanggal", quantity="permintaan"):
+    # Histori format panjang (sku, tanggal, permintaan) -> (daftar SKU, array (n, T)).
+    wide = df.pivot_table(index=sku, columns=date, values=quantity, aggfunc="sum")
+    return wide.index.to_numpy(), wide.to_numpy(dtype=float)
+
+
+def safety_stock_frame(result, skus=None):
+    # Tabel lebar: satu baris per SKU, kolom ss_XX dan rop_XX per tingkat layanan.
+    labels = [f"{level * 100:g}" for level in result.service_level]
+    data = {"permintaan_lead_time": result.lead_time_demand}
+    for j, label in enumerate(labels):
+        data[f"ss_{label}"] = result.safety_stock[:, j]
+        data[f"rop_{label}"] = result.rop[:, j]
+    out = pd.DataFrame(data)
+    if skus is not None:
+        out.insert(0, "sku", skus)
+    return out
+
+
+def safety_stock_table(df, service_level=SERVICE_LEVELS, days_per_year=365):
+    # Tabel SKU (permintaan tahunan, lead_time hari, std_harian, std_lead_time
+    # opsional) -> tabel yang sama ditambah ss_XX/rop_XX model normal.
+    df = df.rename(columns={c: SKU_COLUMNS[c] for c in df.columns if c in SKU_COLUMNS})
+    if "std_harian" not in df.columns or "permintaan" not in df.columns:
+        raise ValueError("Tabel safety stock harus memuat permintaan dan std_harian")
+    column = lambda name: df[name].to_numpy(dtype=float) if name in df.columns else 0.0
+    hasil = normal_safety_stock(column("permintaan") / days_per_year, column("std_harian"),
+                                column("lead_time"), column("std_lead_time"), service_level)
+    extra = safety_stock_frame(hasil).set_index(df.index)
+    return pd.concat([df, extra], axis=1)
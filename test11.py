@@ -3,6 +3,8 @@ import numpy as np
 import matplotlib.pyplot as plt
 from io import BytesIO
 
+from feasible_region import draw_feasible_region, feasible_polygon
+
 # ===== KONFIGURASI =====
 st.set_page_config(layout="wide", page_title="Optimasi Produksi PT. Bakar-Bakar")
 st.title("📊 OPTIMASI PRODUKSI PT. BAKAR-BAKAR")
@@ -87,11 +89,11 @@ if st.button("🧮 HITUNG SOLUSI OPTIMAL", type="primary"):
     fig, ax = plt.subplots(figsize=(10,6))
     
     # Plot garis kendala
-    x = np.linspace(0, titik_x*1.1, 500)
+    x = np.array([0, titik_x*1.1])
     y = (total_time - time_a * x) / time_b
     
     ax.plot(x, y, label=f'{time_a}$x_1$ + {time_b}$x_2$ ≤ {total_time}', linewidth=2, color='navy')
-    ax.fill_between(x, 0, y, alpha=0.1, color='blue')
+    draw_feasible_region(ax, feasible_polygon([[time_a, time_b]], [total_time]), color='blue')
     
     # Titik-titik penting
     ax.scatter(0, 0, color='green', s=100, label='Titik (0,0)')
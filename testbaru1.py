@@ -1,9 +1,36 @@
 import streamlit as st
 import numpy as np
+import pandas as pd
+import scipy.sparse as sp
 import matplotlib.pyplot as plt
 from io import BytesIO
+from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
 import base64
+import os
+import time
+from functools import partial
+
+from demand_stream import StreamStats, aggregate_demand_iter, annual_demand, stream_eoq
+from eoq_batch import (discount_columns, eoq_batch, eoq_discount_batch, eoq_discount_frame, eoq_frame,
+                       inventory_batch, inventory_models_frame, read_sku_table)
+from feasible_region import draw_feasible_region, feasible_polygon
+from inventory_sim import simulate_eoq_policy
+from joint_replenishment import jrp_frame
+from lp_batch import solve_product_mix_batch
+from lp_bulk import read_instances, solve_instances_iter
+from lp_interior import solve_lp_interior
+from lp_mip import solve_integer_lp
+from lp_presolve import presolve, solve_presolved
+from lp_sensitivity import sensitivity_frames, sensitivity_report
+from lp_warmstart import WarmStartCache
+from queue_mmc import min_servers, mmc_metrics, optimal_staffing, wait_quantile
+from queue_profile import profile_staffing
+from queue_sim import simulate_queue
+from replications import iter_replications, queue_replication
+from result_cache import MODEL_CACHE, cached
+from safety_stock import (SERVICE_LEVELS, empirical_safety_stock, history_matrix, normal_safety_stock,
+                          safety_stock_frame, safety_stock_table)
 
 # =============== GENERATE LOGO & HEADER (VERSI UPGRADED) ===============
 def create_logo():
@@ -89,9 +116,104 @@ st.set_page_config(
 if 'current_page' not in st.session_state:
     st.session_state.current_page = "Beranda"
 
+if 'lp_warm_cache' not in st.session_state:
+    st.session_state.lp_warm_cache = WarmStartCache()
+
+# Folder berkas transaksi besar di server; bila tidak diatur hanya unggahan yang dipakai
+DATA_TRANSAKSI_DIR = os.environ.get("DATA_TRANSAKSI_DIR", "").strip()
+
 def change_page(page_name):
     st.session_state.current_page = page_name
 
+# =============== KOMPUTASI MODEL (CACHE LINTAS SESI) ===============
+# Fungsi murni per halaman; hasilnya dipakai bersama semua sesi sehingga
+# input bawaan yang sama tidak dihitung ulang setiap klik.
+@cached("optimasi_2_produk")
+def hitung_optimasi_murni(p1, p2, t1, t2, max1, max2, total_time, mode_bulat, batas_simpul, batas_waktu,
+                          metode_lp="Simplex"):
+    # Titik pojok tepat dari irisan setengah bidang semua kendala
+    titik_pojok = feasible_polygon([[t1, t2]], [total_time], bounds=[(0, max1), (0, max2)])
+    nilai_Z = titik_pojok @ np.array([p1, p2], dtype=float)
+    if mode_bulat:
+        # Branch and bound di atas relaksasi LP
+        hasil = solve_integer_lp([p1, p2], [[t1, t2]], [total_time],
+                                 bounds=[(0, max1), (0, max2)],
+                                 node_limit=batas_simpul, time_limit=batas_waktu)
+    elif metode_lp == "Interior point":
+        hasil = solve_lp_interior([p1, p2], [[t1, t2]], [total_time], bounds=[(0, max1), (0, max2)])
+    else:
+        hasil = None  # simplex diselesaikan per sesi (warm start), lihat hitung_optimasi
+    return titik_pojok, nilai_Z, hasil
+
+def hitung_optimasi(p1, p2, t1, t2, max1, max2, total_time, mode_bulat, batas_simpul, batas_waktu,
+                    metode_lp="Simplex"):
+    titik_pojok, nilai_Z, hasil = hitung_optimasi_murni(
+        p1, p2, t1, t2, max1, max2, total_time, mode_bulat, batas_simpul, batas_waktu, metode_lp)
+    if mode_bulat:
+        return titik_pojok, nilai_Z, hasil, None
+    if hasil is None:
+        # Basis warm start milik sesi ini, jadi tidak boleh masuk cache lintas sesi
+        hasil = st.session_state.lp_warm_cache.solve(
+            "optimasi_2_produk", [p1, p2], [[t1, t2]], [total_time],
+            bounds=[(0, max1), (0, max2)])
+    laporan = sensitivity_report(hasil) if hasil.success else None
+    return titik_pojok, nilai_Z, hasil, laporan
+
+@cached("eoq")
+def hitung_eoq(D, S, H, L):
+    hasil = eoq_batch(D, S, H, L)
+    return float(hasil.eoq), float(hasil.rop), float(hasil.total_cost)
+
+@cached("model_persediaan")
+def hitung_model_persediaan(D, S, H, L, P, B):
+    # EPQ (P terbatas) dan/atau backorder terencana (B terbatas) dari kernel yang sama dengan EOQ
+    hasil = inventory_batch(D, S, H, L, P, B)
+    return {name: float(getattr(hasil, name)) for name in hasil.__dataclass_fields__}
+
+@cached("antrian_mmc")
+def hitung_antrian(λ, μ, cost_waiting, cost_add_server, c=1):
+    # M/M/c (Erlang C); c = 1 sama dengan rumus M/M/1
+    m = mmc_metrics(λ, μ, c)
+    hasil = {
+        "ρ": float(m.utilization), "W": float(m.W), "Wq": float(m.Wq), "L": float(m.L), "Lq": float(m.Lq),
+        "P_tunggu": float(m.p_wait), "Wq_p95": float(wait_quantile(λ, μ, c, 0.95)),
+        "total_waiting_cost": float(m.Wq)*λ*cost_waiting,
+    }
+    if cost_add_server > 0:
+        # Tambah satu server (c + 1 server paralel), bukan mempercepat satu server
+        baru = mmc_metrics(λ, μ, c + 1)
+        new_cost = float(baru.Wq)*λ*cost_waiting + cost_add_server
+        hasil.update(new_c=c + 1, new_Wq=float(baru.Wq), new_cost=new_cost,
+                     improvement=(hasil["total_waiting_cost"] - new_cost)/hasil["total_waiting_cost"]*100
+                     if hasil["total_waiting_cost"] > 0 else 0.0)
+    return hasil
+
+@cached("johnson")
+def hitung_johnson(jobs):
+    group1 = [(i, m1, m2) for i, (m1, m2) in enumerate(jobs) if m1 <= m2]
+    group2 = [(i, m2, m1) for i, (m1, m2) in enumerate(jobs) if m1 > m2]
+    
+    group1_sorted = sorted(group1, key=lambda x: x[1])
+    group2_sorted = sorted(group2, key=lambda x: x[1], reverse=True)
+    
+    sequence = [x[0] for x in group1_sorted] + [x[0] for x in group2_sorted]
+    
+    m1_time = 0
+    m2_time = 0
+    m1_schedule = []
+    m2_schedule = []
+    
+    for job in sequence:
+        m1_start = m1_time
+        m1_time += jobs[job][0]
+        m1_schedule.append((job, m1_start, m1_time))
+        
+        m2_start = max(m1_time, m2_time)
+        m2_time = m2_start + jobs[job][1]
+        m2_schedule.append((job, m2_start, m2_time))
+    
+    return sequence, m1_schedule, m2_schedule, m2_time
+
 # =============== NAVIGASI SIDEBAR ===============
 with st.sidebar:
     st.image(f"data:image/png;base64,{LOGO_BASE64}", use_container_width=True)
@@ -121,6 +243,17 @@ with st.sidebar:
              use_container_width=True,
              type="primary")
     
+    st.markdown("---")
+    with st.expander("🗄️ Cache Hasil"):
+        stat_cache = MODEL_CACHE.stats
+        st.write(f"Hit: **{stat_cache.hits}** | Miss: **{stat_cache.misses}** "
+                 f"({stat_cache.hit_rate:.0%} hit)")
+        st.write(f"Entri: {len(MODEL_CACHE)}/{MODEL_CACHE.max_entries} | "
+                 f"Dibuang: {stat_cache.evictions} | Kedaluwarsa: {stat_cache.expired}")
+        st.caption(f"Dipakai bersama semua sesi, TTL {MODEL_CACHE.ttl/60:.0f} menit.")
+        if st.button("Kosongkan cache", key="cache_clear"):
+            MODEL_CACHE.clear()
+
     st.markdown("---")
     st.info("""
     **Kontak Pengembang:**
@@ -236,12 +369,12 @@ elif st.session_state.current_page == "Optimasi":
                 """)
             
             fig, ax = plt.subplots(figsize=(10,6))
-            x = np.linspace(0, 40, 100)
+            x = np.array([0, 40])
             y1 = (120 - 3*x)/2
             ax.plot(x, y1, 'b-', label='3x₁ + 2x₂ ≤ 120')
             ax.axvline(30, color='r', label='x₁ ≤ 30')
             ax.axhline(40, color='g', label='x₂ ≤ 40')
-            ax.fill_between(x, 0, np.minimum(y1, 40), where=(x<=30), alpha=0.1)
+            draw_feasible_region(ax, feasible_polygon([[3, 2]], [120], bounds=[(0, 30), (0, 40)]))
             ax.plot(30, 15, 'ro', markersize=8)
             ax.set_xlabel('Meja (x₁)')
             ax.set_ylabel('Kursi (x₂)')
@@ -264,23 +397,59 @@ elif st.session_state.current_page == "Optimasi":
         
         total_time = st.number_input("Total waktu tersedia (jam)", 120, key="total")
 
+        mode_bulat = st.checkbox("🔢 Mode bilangan bulat (produksi unit utuh)", key="mode_bulat")
+        if mode_bulat:
+            col1, col2 = st.columns(2)
+            with col1:
+                batas_simpul = st.number_input("Batas simpul branch and bound", min_value=10, value=10000, key="bb_nodes")
+            with col2:
+                batas_waktu = st.number_input("Batas waktu (detik)", min_value=0.1, value=10.0, key="bb_time")
+        else:
+            batas_simpul, batas_waktu = 10000, 10.0
+        metode_lp = "Simplex"
+        if not mode_bulat:
+            metode_lp = st.radio("Metode solver LP", ["Simplex", "Interior point"], horizontal=True,
+                                 key="metode_lp",
+                                 help="Interior point (Mehrotra) lalu crossover ke titik pojok; "
+                                      "lebih cepat untuk model padat dengan ribuan kendala.")
+
+    # Cek cepat dari rentang sensitivitas hasil terakhir tanpa menghitung ulang
+    terakhir = st.session_state.get("lp_sensitivitas")
+    if terakhir is not None and terakhir["kendala"] == (t1, t2, max1, max2, total_time):
+        laporan = terakhir["laporan"]
+        p_lama = np.array(terakhir["keuntungan"])
+        p_baru = np.array([p1, p2], dtype=float)
+        berubah = np.flatnonzero(p_baru != p_lama)
+        if berubah.size == 1:
+            j = berubah[0]
+            if laporan.objective_low[j] <= p_baru[j] <= laporan.objective_high[j]:
+                x_lama = terakhir["x"]
+                st.info(f"Rencana produksi sebelumnya ({x_lama[0]:.2f}, {x_lama[1]:.2f}) tetap optimal; "
+                        f"keuntungan menjadi Rp{p_baru @ x_lama:,.0f}")
+            else:
+                st.warning(f"Keuntungan Produk {j+1} di luar rentang "
+                           f"[{laporan.objective_low[j]:,.0f}, {laporan.objective_high[j]:,.0f}], "
+                           "rencana produksi akan berubah")
+
     if st.button("🧮 HITUNG SOLUSI OPTIMAL", type="primary", use_container_width=True):
-        titik_A = (0, 0)
-        titik_B = (max1, 0)
-        titik_C = (max1, min((total_time - t1*max1)/t2, max2))
-        titik_D = (min((total_time - t2*max2)/t1, max1), max2)
-        titik_E = (0, min(total_time/t2, max2))
-        
-        nilai_Z = [
-            p1*titik_A[0] + p2*titik_A[1],
-            p1*titik_B[0] + p2*titik_B[1],
-            p1*titik_C[0] + p2*titik_C[1],
-            p1*titik_D[0] + p2*titik_D[1],
-            p1*titik_E[0] + p2*titik_E[1]
-        ]
-        optimal_idx = np.argmax(nilai_Z)
-        optimal_value = nilai_Z[optimal_idx]
-        optimal_point = [titik_A, titik_B, titik_C, titik_D, titik_E][optimal_idx]
+        titik_pojok, nilai_Z, hasil, laporan = hitung_optimasi(
+            p1, p2, t1, t2, max1, max2, total_time, mode_bulat, batas_simpul, batas_waktu, metode_lp)
+        if not hasil.success:
+            st.error(f"Error: {hasil.message}")
+            st.stop()
+        optimal_value = hasil.objective
+        optimal_point = tuple(hasil.x)
+
+        if mode_bulat:
+            hasil_mip = hasil
+        else:
+            hasil_lp = hasil
+            st.session_state.lp_sensitivitas = {
+                "kendala": (t1, t2, max1, max2, total_time),
+                "keuntungan": (p1, p2),
+                "x": hasil_lp.x,
+                "laporan": laporan,
+            }
 
         st.markdown("---")
         st.header("📊 HASIL PERHITUNGAN")
@@ -296,19 +465,16 @@ elif st.session_state.current_page == "Optimasi":
             """)
             
             st.subheader("Titik Pojok")
-            st.write(f"A(0,0) = Rp{nilai_Z[0]:,.0f}")
-            st.write(f"B({max1},0) = Rp{nilai_Z[1]:,.0f}")
-            st.write(f"C({titik_C[0]:.0f},{titik_C[1]:.0f}) = Rp{nilai_Z[2]:,.0f}")
-            st.write(f"D({titik_D[0]:.0f},{max2}) = Rp{nilai_Z[3]:,.0f}")
-            st.write(f"E(0,{titik_E[1]:.0f}) = Rp{nilai_Z[4]:,.0f}")
+            for i, ((x1, x2), z) in enumerate(zip(titik_pojok, nilai_Z)):
+                st.write(f"{chr(65 + i)}({x1:g},{x2:g}) = Rp{z:,.0f}")
         
         with cols[1]:
             st.subheader("Visualisasi Solusi")
             fig, ax = plt.subplots(figsize=(8,6))
-            x = np.linspace(0, max1*1.1, 100)
+            x = np.array([0, max1*1.1])
             y = (total_time - t1*x)/t2
             ax.plot(x, y, 'b-', label=f'{t1}x₁ + {t2}x₂ ≤ {total_time}')
-            ax.fill_between(x, 0, np.minimum(y, max2), where=(x<=max1), alpha=0.1)
+            draw_feasible_region(ax, titik_pojok)
             ax.axvline(max1, color='r', label=f'x₁ ≤ {max1}')
             ax.axhline(max2, color='g', label=f'x₂ ≤ {max2}')
             ax.plot(optimal_point[0], optimal_point[1], 'ro', markersize=8)
@@ -327,6 +493,207 @@ elif st.session_state.current_page == "Optimasi":
         **Keuntungan Maksimum:** Rp{optimal_value:,.0f}
         """)
 
+        # Presolve menunjukkan kendala yang tidak pernah membatasi solusi
+        laporan_presolve = presolve([p1, p2], [[t1, t2]], [total_time], bounds=[(0, max1), (0, max2)]).report
+        redundan = [f"permintaan maksimal Produk {j+1}" for j in laporan_presolve.implied_upper]
+        if laporan_presolve.redundant_rows:
+            redundan.append("waktu produksi")
+        if redundan:
+            st.info(f"**Presolve:** batas {', '.join(redundan)} redundan (tersirat dari kendala lain) "
+                    "sehingga tidak ikut menentukan solusi.")
+
+        if mode_bulat:
+            st.info(f"""
+            **Branch and Bound:** {hasil_mip.message}  
+            Simpul diperiksa: {hasil_mip.nodes} ({hasil_mip.lp_iterations} iterasi simplex)  
+            Batas relaksasi: Rp{hasil_mip.bound:,.0f} | Gap incumbent: {hasil_mip.gap:.2%}  
+            Waktu: {hasil_mip.solve_time*1000:.1f} ms
+            """)
+        else:
+            st.subheader("Analisis Sensitivitas")
+            tabel_var, tabel_kendala = sensitivity_frames(laporan, ["Produk 1", "Produk 2"], ["Waktu produksi"])
+            st.dataframe(tabel_var, use_container_width=True)
+            st.dataframe(tabel_kendala, use_container_width=True)
+            st.caption("Rentang koefisien berlaku jika koefisien lain tetap. Reduced cost produk "
+                       "pada batas permintaan = tambahan keuntungan per unit kenaikan permintaan maksimal.")
+
+    with st.expander("🏭 MODEL UMUM (BANYAK PRODUK & KENDALA)"):
+        col1, col2 = st.columns(2)
+        with col1:
+            n_produk = st.number_input("Jumlah produk", min_value=1, max_value=500, value=3, key="lp_n")
+        with col2:
+            n_kendala = st.number_input("Jumlah kendala sumber daya", min_value=1, max_value=100, value=2, key="lp_m")
+
+        nama_kendala = [f"Kendala {i+1}" for i in range(n_kendala)]
+        st.write("**Data Produk** (keuntungan, permintaan maksimal, dan pemakaian sumber daya per unit)")
+        data_produk = st.data_editor(
+            pd.DataFrame({
+                "Produk": [f"Produk {j+1}" for j in range(n_produk)],
+                "Keuntungan/unit": np.resize([120000.0, 80000.0, 100000.0], n_produk),
+                "Maks permintaan": np.resize([30.0, 40.0, 35.0], n_produk),
+                **{k: np.resize(np.roll([3.0, 2.0, 4.0], -i), n_produk)
+                   for i, k in enumerate(nama_kendala)},
+            }),
+            key=f"lp_produk_{n_produk}_{n_kendala}",
+            use_container_width=True,
+        )
+        st.write("**Kapasitas Sumber Daya**")
+        data_kendala = st.data_editor(
+            pd.DataFrame({"Kendala": nama_kendala, "Kapasitas": [120.0] * n_kendala}),
+            key=f"lp_kendala_{n_kendala}",
+            use_container_width=True,
+        )
+
+        pakai_presolve = st.checkbox("Presolve (buang kendala redundan sebelum solve)", value=True,
+                                     key="lp_presolve", disabled=mode_bulat)
+
+        if st.button("🧮 HITUNG MODEL UMUM", type="primary", use_container_width=True):
+            c = data_produk["Keuntungan/unit"].to_numpy(dtype=float)
+            A = data_produk[nama_kendala].to_numpy(dtype=float).T
+            b = data_kendala["Kapasitas"].to_numpy(dtype=float)
+            batas_atas = data_produk["Maks permintaan"].to_numpy(dtype=float)
+            if np.count_nonzero(A) <= 0.05 * A.size:
+                # Kebutuhan bahan mayoritas nol: simpan sebagai matriks sparse
+                A = sp.csr_matrix(A)
+            batas = [(0, u if np.isfinite(u) else None) for u in batas_atas]
+            laporan_presolve = None
+            if mode_bulat:
+                hasil_lp = solve_integer_lp(c, A, b, bounds=batas,
+                                            node_limit=batas_simpul, time_limit=batas_waktu)
+            else:
+                if metode_lp == "Interior point":
+                    solver_lp = solve_lp_interior
+                elif pakai_presolve:
+                    solver_lp = partial(st.session_state.lp_warm_cache.solve, "optimasi_umum_presolve")
+                else:
+                    solver_lp = partial(st.session_state.lp_warm_cache.solve, "optimasi_umum")
+                if pakai_presolve:
+                    hasil_presolve = solve_presolved(c, A, b, bounds=batas, solver=solver_lp)
+                    laporan_presolve = hasil_presolve.presolve.report
+                    hasil_lp = hasil_presolve
+                else:
+                    hasil_lp = solver_lp(c, A, b, bounds=batas)
+
+            if not hasil_lp.success:
+                st.error(f"Error: {hasil_lp.message}")
+            else:
+                st.success(f"**Keuntungan Maksimum:** Rp{hasil_lp.objective:,.0f}")
+                st.dataframe(pd.DataFrame({
+                    "Produk": data_produk["Produk"],
+                    "Jumlah produksi": hasil_lp.x,
+                    "Kontribusi (Rp)": c * hasil_lp.x,
+                }), use_container_width=True)
+                st.dataframe(pd.DataFrame({
+                    "Kendala": nama_kendala,
+                    "Terpakai": A @ hasil_lp.x,
+                    "Sisa (slack)": b - A @ hasil_lp.x,
+                }), use_container_width=True)
+
+                if mode_bulat:
+                    st.caption(f"{hasil_lp.message}: {hasil_lp.nodes} simpul, gap {hasil_lp.gap:.2%}, "
+                               f"batas relaksasi Rp{hasil_lp.bound:,.0f}, {hasil_lp.solve_time*1000:.1f} ms")
+                elif laporan_presolve is not None:
+                    st.caption(f"Presolve ({laporan_presolve.time*1000:.1f} ms): "
+                               f"{laporan_presolve.removed_rows} dari {laporan_presolve.rows_before} kendala dan "
+                               f"{laporan_presolve.removed_cols} dari {laporan_presolve.cols_before} produk dibuang "
+                               f"({laporan_presolve.redundant_rows} baris redundan, "
+                               f"{laporan_presolve.singleton_rows} baris singleton, "
+                               f"{laporan_presolve.tightened_bounds} batas diperketat)")
+                    if hasil_presolve.result is not None:
+                        st.caption(f"Model tereduksi: {hasil_presolve.result.nit} iterasi dalam "
+                                   f"{hasil_presolve.result.solve_time*1000:.1f} ms")
+                    st.caption("Analisis sensitivitas hanya tersedia tanpa presolve.")
+                elif metode_lp == "Interior point":
+                    st.caption(f"{hasil_lp.ipm_iterations} iterasi interior point + {hasil_lp.nit} pivot "
+                               f"crossover dalam {hasil_lp.solve_time*1000:.1f} ms")
+                else:
+                    st.caption(f"{hasil_lp.nit} iterasi simplex dalam {hasil_lp.solve_time*1000:.1f} ms")
+
+                    st.subheader("Analisis Sensitivitas")
+                    tabel_var, tabel_kendala = sensitivity_frames(
+                        sensitivity_report(hasil_lp), data_produk["Produk"].tolist(), nama_kendala)
+                    st.dataframe(tabel_var, use_container_width=True)
+                    st.dataframe(tabel_kendala, use_container_width=True)
+
+    with st.expander("📈 ANALISIS SKENARIO HARGA"):
+        st.write("Sapu keuntungan/unit kedua produk pada grid dengan parameter waktu dan permintaan di atas.")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            p1_range = st.slider("Rentang keuntungan Produk 1 (Rp)", 0, 500000, (60000, 180000), step=5000)
+        with col2:
+            p2_range = st.slider("Rentang keuntungan Produk 2 (Rp)", 0, 500000, (40000, 120000), step=5000)
+        with col3:
+            n_grid = st.number_input("Titik grid per sumbu", min_value=10, max_value=1000, value=200, key="n_grid")
+
+        if st.button("🧮 HITUNG SKENARIO", use_container_width=True):
+            grid_p1 = np.linspace(*p1_range, n_grid)
+            grid_p2 = np.linspace(*p2_range, n_grid)
+            hasil_batch = solve_product_mix_batch(grid_p1[None, :], grid_p2[:, None],
+                                                  t1, t2, max1, max2, total_time)
+
+            fig, ax = plt.subplots(figsize=(8,6))
+            im = ax.imshow(hasil_batch.profit, origin='lower', aspect='auto',
+                           extent=[*p1_range, *p2_range], cmap='viridis')
+            fig.colorbar(im, ax=ax, label='Keuntungan maksimum (Rp)')
+            ax.set_xlabel('Keuntungan/unit Produk 1 (Rp)')
+            ax.set_ylabel('Keuntungan/unit Produk 2 (Rp)')
+            st.pyplot(fig)
+
+            titik, jumlah = np.unique(hasil_batch.corner_names, return_counts=True)
+            st.dataframe(pd.DataFrame({"Titik pojok optimal": titik,
+                                       "Porsi skenario": jumlah / jumlah.sum()}),
+                         use_container_width=True)
+
+    with st.expander("📂 UNGGAH BANYAK INSTANS (CSV/PARQUET)"):
+        st.write("Satu baris = satu konfigurasi pabrik/lini. Kolom `p1, p2, t1, t2, max1, max2, total_time` "
+                 "seperti di atas, atau bentuk umum `c_j`, `a_i_j`, `b_i`, `ub_j` (opsional) dan `id`.")
+        berkas = st.file_uploader("Berkas instans", type=["csv", "parquet"], key="lp_bulk_file")
+        col1, col2 = st.columns(2)
+        with col1:
+            n_pekerja = st.number_input("Jumlah proses pekerja", min_value=1, max_value=64,
+                                        value=min(4, os.cpu_count() or 1), key="lp_bulk_workers")
+        with col2:
+            ukuran_chunk = st.number_input("Instans per chunk (0 = otomatis)", min_value=0, value=0,
+                                           key="lp_bulk_chunk")
+
+        if berkas is not None and st.button("🧮 SELESAIKAN SEMUA INSTANS", use_container_width=True):
+            try:
+                data_instans = read_instances(berkas)
+                progres = st.progress(0.0, text="Menyiapkan instans...")
+                tabel_hasil = st.empty()
+                bagian = []
+                metode_massal = "interior" if metode_lp == "Interior point" else "simplex"
+                for selesai, total, part in solve_instances_iter(data_instans, n_pekerja, ukuran_chunk or None,
+                                                                 method=metode_massal):
+                    bagian.append(part)
+                    progres.progress(selesai / total, text=f"{selesai:,}/{total:,} instans selesai")
+                    tabel_hasil.dataframe(pd.concat(bagian).sort_index(), use_container_width=True)
+            except (ImportError, ValueError) as exc:
+                st.error(f"Error: {exc}")
+                st.stop()
+            if bagian:
+                hasil_massal = pd.concat(bagian).sort_index()
+                n_optimal = int((hasil_massal["status"] == "optimal").sum())
+                st.success(f"{n_optimal:,} dari {len(hasil_massal):,} instans optimal, "
+                           f"total waktu solver {hasil_massal['waktu_ms'].sum()/1000:.1f} detik")
+                st.download_button("⬇️ Unduh hasil (CSV)", hasil_massal.to_csv(index=False).encode("utf-8"),
+                                   file_name="hasil_instans_lp.csv", mime="text/csv")
+
+    stat_warm = st.session_state.lp_warm_cache.stats
+    if stat_warm.solves:
+        with st.expander("⚡ STATISTIK WARM START"):
+            cols = st.columns(4)
+            cols[0].metric("Metode terakhir", stat_warm.last_method)
+            cols[1].metric("Pivot terakhir", stat_warm.last_pivots,
+                           delta=f"{stat_warm.last_pivots_saved} dihemat", delta_color="off")
+            cols[2].metric("Total pivot dihemat", stat_warm.pivots_saved)
+            cols[3].metric("Waktu solve terakhir", f"{stat_warm.last_time*1000:.2f} ms")
+            st.write(f"Solve: {stat_warm.solves} (primal warm {stat_warm.warm_primal}, "
+                     f"dual warm {stat_warm.warm_dual}, dari awal {stat_warm.cold}), "
+                     f"total waktu {stat_warm.solve_time*1000:.1f} ms")
+            if st.button("Reset cache warm start"):
+                st.session_state.lp_warm_cache.clear()
+
 # =============== HALAMAN EOQ ===============
 elif st.session_state.current_page == "EOQ":
     st.title("📦 MODEL PERSEDIAAN (EOQ)")
@@ -394,11 +761,20 @@ elif st.session_state.current_page == "EOQ":
         S = st.number_input("Biaya pemesanan per pesanan (Rp)", 150000)
         H = st.number_input("Biaya penyimpanan per unit per tahun (Rp)", 5000)
         L = st.number_input("Waktu tunggu pengiriman (hari)", 5)
+        model_persediaan = st.radio("Model persediaan", ["EOQ klasik", "EPQ (produksi bertahap)",
+                                                         "Backorder terencana"], horizontal=True,
+                                    key="model_persediaan")
+        P, B = np.inf, np.inf
+        if model_persediaan == "EPQ (produksi bertahap)":
+            P = st.number_input("Laju produksi per tahun (unit, harus > permintaan)", min_value=1.0,
+                                value=float(max(2 * D, 1)), key="laju_produksi")
+        elif model_persediaan == "Backorder terencana":
+            B = st.number_input("Biaya backorder per unit per tahun (Rp)", min_value=1.0, value=20000.0,
+                                key="biaya_backorder")
 
-    if st.button("🧮 HITUNG EOQ", type="primary", use_container_width=True):
-        eoq = np.sqrt(2*D*S/H)
-        rop = (D/365)*L
-        total_cost = np.sqrt(2*D*S*H)
+    tombol_eoq = st.button("🧮 HITUNG EOQ", type="primary", use_container_width=True)
+    if tombol_eoq and model_persediaan == "EOQ klasik":
+        eoq, rop, total_cost = hitung_eoq(D, S, H, L)
         
         st.markdown("---")
         st.header("📊 HASIL PERHITUNGAN")
@@ -437,6 +813,345 @@ elif st.session_state.current_page == "EOQ":
         **Total biaya persediaan minimum:** Rp{total_cost:,.0f}/tahun
         """)
 
+    if tombol_eoq and model_persediaan != "EOQ klasik":
+        hasil_model = hitung_model_persediaan(D, S, H, L, P, B)
+        if np.isnan(hasil_model["order_quantity"]):
+            st.error("Error: parameter tidak valid (laju produksi harus lebih besar dari permintaan)")
+            st.stop()
+        Q = hasil_model["order_quantity"]
+
+        st.markdown("---")
+        st.header(f"📊 HASIL PERHITUNGAN {model_persediaan.upper()}")
+        cols = st.columns(2)
+        with cols[0]:
+            if model_persediaan == "EPQ (produksi bertahap)":
+                st.latex(r"EPQ = \sqrt{\frac{2DS}{H(1 - D/P)}}")
+                st.latex(fr"= \sqrt{{\frac{{2 \times {D:,} \times {S:,}}}{{{H:,} \times (1 - {D:,}/{P:,.0f})}}}} = {Q:.1f} \text{{ unit}}")
+                st.latex(fr"I_{{maks}} = Q\left(1 - \frac{{D}}{{P}}\right) = {hasil_model['max_inventory']:.1f} \text{{ unit}}")
+            else:
+                st.latex(r"Q^* = \sqrt{\frac{2DS}{H}} \sqrt{\frac{H + B}{B}}, \quad b^* = Q^* \frac{H}{H + B}")
+                st.latex(fr"Q^* = {Q:.1f} \text{{ unit}}, \quad b^* = {hasil_model['max_backorder']:.1f} \text{{ unit}}")
+                st.latex(fr"I_{{maks}} = Q^* - b^* = {hasil_model['max_inventory']:.1f} \text{{ unit}}")
+        with cols[1]:
+            st.latex(fr"""
+            \begin{{aligned}}
+            \text{{Biaya Pemesanan}} &= \text{{Rp}}{hasil_model['ordering_cost']:,.0f} \\
+            \text{{Biaya Penyimpanan}} &= \text{{Rp}}{hasil_model['holding_cost']:,.0f} \\
+            \text{{Biaya Backorder}} &= \text{{Rp}}{hasil_model['shortage_cost']:,.0f} \\
+            \text{{Total Biaya}} &= \text{{Rp}}{hasil_model['total_cost']:,.0f}
+            \end{{aligned}}
+            """)
+
+        _, _, biaya_eoq = hitung_eoq(D, S, H, L)
+        if np.isfinite(P):
+            rekomendasi = f"**Lama produksi per siklus:** {hasil_model['production_days']:.1f} hari"
+        elif hasil_model["rop"] < 0:
+            rekomendasi = f"**Pesan ulang saat backorder mencapai:** {-hasil_model['rop']:.1f} unit"
+        else:
+            rekomendasi = f"**Lakukan pemesanan ulang ketika stok mencapai:** {hasil_model['rop']:.1f} unit"
+        st.success(f"""
+        ## 🎯 REKOMENDASI
+        **Ukuran lot optimal:** {Q:,.0f} unit (stok maksimum {hasil_model['max_inventory']:,.0f} unit)  
+        **Frekuensi:** {hasil_model['orders_per_year']:.1f} kali/tahun, siklus {hasil_model['cycle_days']:.1f} hari  
+        {rekomendasi}  
+        **Total biaya persediaan minimum:** Rp{hasil_model['total_cost']:,.0f}/tahun
+        (EOQ klasik Rp{biaya_eoq:,.0f}, hemat Rp{biaya_eoq - hasil_model['total_cost']:,.0f})
+        """)
+
+    with st.expander("🛡️ SAFETY STOCK & ROP (TINGKAT LAYANAN)"):
+        st.write("ROP di atas mengasumsikan permintaan pasti. Safety stock melindungi dari variasi "
+                 "permintaan dan waktu tunggu; tingkat layanan = peluang tidak kehabisan stok per siklus.")
+        tingkat_layanan = st.multiselect("Target tingkat layanan (%)", [80.0, 85.0, 90.0, 95.0, 97.5, 98.0, 99.0, 99.5, 99.9],
+                                         default=[level * 100 for level in SERVICE_LEVELS], key="tingkat_layanan")
+        tingkat_layanan = np.sort(np.asarray(tingkat_layanan, dtype=float)) / 100
+        model_ss = st.radio("Model distribusi", ["Normal", "Empiris (histori permintaan)"], horizontal=True,
+                            key="model_ss")
+
+        if model_ss == "Normal":
+            col1, col2 = st.columns(2)
+            with col1:
+                std_harian = st.number_input("Simpangan baku permintaan harian (unit)", min_value=0.0,
+                                             value=5.0, key="std_harian")
+            with col2:
+                std_lead = st.number_input("Simpangan baku waktu tunggu (hari)", min_value=0.0,
+                                           value=1.0, key="std_lead")
+            st.latex(r"SS = z_{\alpha} \sqrt{L \sigma_d^2 + d^2 \sigma_L^2}, \quad ROP = dL + SS")
+            if tingkat_layanan.size:
+                hasil_ss = normal_safety_stock(D / 365, std_harian, L, std_lead, tingkat_layanan)
+                st.dataframe(pd.DataFrame({
+                    "Tingkat layanan (%)": tingkat_layanan * 100,
+                    "Safety stock (unit)": hasil_ss.safety_stock[0],
+                    "ROP (unit)": hasil_ss.rop[0],
+                    "Biaya simpan safety stock (Rp/tahun)": hasil_ss.safety_stock[0] * H,
+                }), use_container_width=True, hide_index=True)
+        else:
+            st.write("Unggah histori permintaan harian format panjang dengan kolom `sku`, `tanggal`, "
+                     "`permintaan`. Permintaan selama lead time diambil dari jendela bergulir "
+                     f"{L} hari pada histori setiap SKU.")
+            berkas_histori = st.file_uploader("Histori permintaan", type=["csv", "parquet"], key="histori_file")
+            if berkas_histori is not None and tingkat_layanan.size:
+                try:
+                    skus, histori = history_matrix(read_sku_table(berkas_histori))
+                except (ImportError, KeyError, ValueError) as exc:
+                    st.error(f"Error: {exc}")
+                    st.stop()
+                mulai = time.perf_counter()
+                try:
+                    hasil_ss = empirical_safety_stock(histori, L, tingkat_layanan)
+                except ValueError as exc:
+                    st.error(f"Error: {exc}")
+                    st.stop()
+                durasi = time.perf_counter() - mulai
+                tabel_ss = safety_stock_frame(hasil_ss, skus)
+                st.caption(f"{len(skus):,} SKU x {histori.shape[1]:,} hari dihitung dalam {durasi*1000:.1f} ms")
+                st.dataframe(tabel_ss, use_container_width=True, hide_index=True)
+                st.download_button("⬇️ Unduh safety stock (CSV)", tabel_ss.to_csv(index=False).encode("utf-8"),
+                                   file_name="safety_stock_sku.csv", mime="text/csv")
+
+    with st.expander("🎲 SIMULASI PERSEDIAAN (s,Q) / (s,S)"):
+        st.write("Uji rekomendasi EOQ/ROP pada permintaan acak: ribuan replikasi dinamika stok harian "
+                 "dijalankan sekaligus, lalu fill rate dan biaya realisasi dibandingkan dengan biaya analitik.")
+        eoq_sim, rop_sim, biaya_analitik = hitung_eoq(D, S, H, L)
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            kebijakan = st.radio("Kebijakan", ["(s,Q)", "(s,S)"], horizontal=True, key="kebijakan_sim")
+            titik_s = st.number_input("Titik pesan ulang s (unit)", min_value=0.0, value=float(round(rop_sim, 1)),
+                                      key="sim_s")
+            jumlah_Q = st.number_input("Q / (S - s) (unit)", min_value=1.0, value=float(round(eoq_sim, 1)),
+                                       key="sim_Q")
+        with col2:
+            model_permintaan = st.radio("Permintaan harian", ["Normal", "Poisson"], horizontal=True,
+                                        key="model_permintaan_sim")
+            std_sim = st.number_input("Simpangan baku harian (Normal)", min_value=0.0, value=5.0, key="sim_std")
+            std_lead_sim = st.number_input("Simpangan baku lead time (hari)", min_value=0.0, value=0.0,
+                                           key="sim_std_lead")
+        with col3:
+            replikasi = st.number_input("Jumlah replikasi", min_value=10, max_value=20000, value=2000, step=100,
+                                        key="sim_replikasi")
+            hari_sim = st.number_input("Horizon (hari)", min_value=30, max_value=3650, value=365, key="sim_hari")
+            seed_sim = st.number_input("Seed", min_value=0, value=42, key="sim_seed")
+        backorder = st.checkbox("Kekurangan menjadi backorder (bukan lost sales)", key="sim_backorder")
+        biaya_kurang = st.number_input("Biaya kekurangan per unit (Rp)", min_value=0.0, value=0.0,
+                                       key="sim_biaya_kurang")
+
+        if st.button("▶️ JALANKAN SIMULASI", use_container_width=True):
+            mulai = time.perf_counter()
+            hasil_sim = simulate_eoq_policy(
+                D, S, H, L, jumlah_Q, titik_s, daily_std=std_sim, replications=int(replikasi),
+                days=int(hari_sim), demand_model=model_permintaan.lower(),
+                policy="sQ" if kebijakan == "(s,Q)" else "sS", order_up_to=titik_s + jumlah_Q,
+                shortage_cost=biaya_kurang, lead_time_std=std_lead_sim, backorders=backorder,
+                seed=int(seed_sim))
+            durasi = time.perf_counter() - mulai
+            ringkas = hasil_sim.summary(biaya_analitik)
+            cols = st.columns(4)
+            cols[0].metric("Fill rate", f"{ringkas['fill_rate']*100:.2f}%")
+            cols[1].metric("Hari stockout/tahun", f"{ringkas['hari_stockout_per_tahun']:.1f}")
+            cols[2].metric("Biaya realisasi/tahun", f"Rp{ringkas['biaya_total']:,.0f}",
+                           f"{ringkas['selisih_biaya_%']:+.1f}% vs analitik", delta_color="inverse")
+            cols[3].metric("Biaya analitik/tahun", f"Rp{biaya_analitik:,.0f}")
+            st.caption(f"{int(replikasi):,} replikasi x {int(hari_sim):,} hari dalam {durasi:.2f} detik; "
+                       f"galat baku biaya Rp{ringkas['galat_baku_biaya']:,.0f}")
+            st.dataframe(pd.DataFrame({"Nilai rata-rata": ringkas}), use_container_width=True)
+
+            fig, ax = plt.subplots(figsize=(10, 4))
+            ax.plot(hasil_sim.sample_on_hand, lw=1, alpha=0.7, label="Stok (replikasi 1)")
+            ax.plot(hasil_sim.mean_on_hand, lw=2, label="Rata-rata stok semua replikasi")
+            ax.axhline(titik_s, color="red", ls="--", label="s (titik pesan ulang)")
+            ax.set_xlabel("Hari")
+            ax.set_ylabel("Unit")
+            ax.legend()
+            ax.grid(True, alpha=0.3)
+            st.pyplot(fig)
+
+    with st.expander("🏷️ EOQ DENGAN DISKON KUANTITAS"):
+        col1, col2 = st.columns(2)
+        with col1:
+            jenis_diskon = st.radio("Jenis diskon", ["All-units", "Incremental"], horizontal=True,
+                                    key="jenis_diskon",
+                                    help="All-units: semua unit mendapat harga tingkat pesanan. "
+                                         "Incremental: hanya unit di atas batas yang mendapat harga baru.")
+        with col2:
+            persen_simpan = st.number_input("Biaya simpan (% harga/unit/tahun)", min_value=0.0,
+                                            max_value=100.0, value=20.0, key="persen_simpan")
+        pakai_H = st.checkbox("Tambahkan biaya penyimpanan tetap H dari parameter di atas", key="diskon_H")
+        tingkat = st.data_editor(
+            pd.DataFrame({"Batas minimum (unit)": [0.0, 500.0, 1000.0],
+                          "Harga/unit (Rp)": [50000.0, 48000.0, 46000.0]}),
+            num_rows="dynamic", use_container_width=True, key="tingkat_diskon",
+        )
+
+        if st.button("🧮 HITUNG EOQ DISKON", use_container_width=True):
+            tingkat = tingkat.dropna().sort_values("Batas minimum (unit)").reset_index(drop=True)
+            if tingkat.empty:
+                st.error("Error: isi minimal satu tingkat harga")
+                st.stop()
+            hasil_diskon = eoq_discount_batch(
+                D, S, tingkat["Batas minimum (unit)"].to_numpy(), tingkat["Harga/unit (Rp)"].to_numpy(),
+                H=H if pakai_H else 0.0, holding_rate=persen_simpan / 100,
+                kind="all_units" if jenis_diskon == "All-units" else "incremental")
+            if hasil_diskon.tier[0] < 0:
+                st.error("Error: parameter tidak valid (permintaan, biaya simpan atau harga)")
+                st.stop()
+            terpilih = int(hasil_diskon.tier[0])
+            st.dataframe(pd.DataFrame({
+                "Tingkat": np.arange(1, len(tingkat) + 1),
+                "Batas minimum (unit)": tingkat["Batas minimum (unit)"],
+                "Harga/unit (Rp)": tingkat["Harga/unit (Rp)"],
+                "Q kandidat": hasil_diskon.tier_quantity[0],
+                "Biaya total (Rp)": hasil_diskon.tier_cost[0],
+                "Terpilih": np.arange(len(tingkat)) == terpilih,
+            }), use_container_width=True)
+            st.success(f"""
+            **Pesan {hasil_diskon.eoq[0]:,.0f} unit** (tingkat {terpilih + 1}, harga rata-rata Rp{hasil_diskon.unit_price[0]:,.0f}/unit)  
+            Biaya pembelian: Rp{hasil_diskon.purchase_cost[0]:,.0f} | Pemesanan: Rp{hasil_diskon.ordering_cost[0]:,.0f} | Penyimpanan: Rp{hasil_diskon.holding_cost[0]:,.0f}  
+            **Total biaya tahunan:** Rp{hasil_diskon.total_cost[0]:,.0f}
+            """)
+
+    with st.expander("🤝 JOINT REPLENISHMENT (PESAN BERSAMA SATU PEMASOK)"):
+        st.write("Item dari pemasok yang sama dipesan bersama: biaya pesan utama S0 dibayar sekali per "
+                 "pengiriman, tiap item menambah biaya minor s. Item i ikut setiap k kali siklus dasar T. "
+                 "Unggah tabel (kolom `sku`, `D`, `S` = biaya minor, `H`, opsional `pemasok` dan "
+                 "`biaya_pemasok`) atau isi tabel di bawah.")
+        biaya_utama = st.number_input("Biaya pesan utama S0 per pengiriman (Rp)", min_value=0.0,
+                                      value=float(S), key="biaya_utama")
+        berkas_jrp = st.file_uploader("Tabel item", type=["csv", "parquet"], key="jrp_file")
+        if berkas_jrp is not None:
+            item_jrp = read_sku_table(berkas_jrp)
+        else:
+            item_jrp = st.data_editor(
+                pd.DataFrame({"sku": ["Semen", "Pasir", "Cat", "Paku"],
+                              "D": [10000.0, 4000.0, 1500.0, 800.0],
+                              "S": [20000.0, 15000.0, 10000.0, 5000.0],
+                              "H": [5000.0, 2000.0, 8000.0, 1000.0]}),
+                num_rows="dynamic", use_container_width=True, key="item_jrp")
+
+        if st.button("🤝 HITUNG PESAN BERSAMA", use_container_width=True):
+            mulai = time.perf_counter()
+            try:
+                tabel_jrp, ringkasan_jrp = jrp_frame(item_jrp.dropna(subset=["D", "S", "H"], how="any")
+                                                     if berkas_jrp is None else item_jrp, biaya_utama)
+            except (KeyError, ValueError) as exc:
+                st.error(f"Error: {exc}")
+                st.stop()
+            durasi = time.perf_counter() - mulai
+            total = ringkasan_jrp[["biaya_gabungan", "biaya_independen", "penghematan"]].sum()
+            cols = st.columns(3)
+            cols[0].metric("Biaya pesan bersama/tahun", f"Rp{total['biaya_gabungan']:,.0f}")
+            cols[1].metric("Biaya EOQ independen/tahun", f"Rp{total['biaya_independen']:,.0f}")
+            cols[2].metric("Penghematan", f"Rp{total['penghematan']:,.0f}",
+                           f"{total['penghematan'] / total['biaya_independen'] * 100:.1f}%")
+            st.caption(f"{len(tabel_jrp):,} item dari {len(ringkasan_jrp):,} pemasok dihitung dalam "
+                       f"{durasi*1000:.1f} ms. EOQ independen: setiap item memesan sendiri dengan biaya S0 + s.")
+            if len(ringkasan_jrp) > 1:
+                st.dataframe(ringkasan_jrp, use_container_width=True, hide_index=True)
+            st.dataframe(tabel_jrp, use_container_width=True, hide_index=True)
+            st.download_button("⬇️ Unduh jadwal pesan bersama (CSV)", tabel_jrp.to_csv(index=False).encode("utf-8"),
+                               file_name="pesan_bersama.csv", mime="text/csv")
+
+    with st.expander("📂 MODE TABEL (BANYAK SKU)"):
+        st.write("Unggah CSV/Parquet dengan kolom `sku`, `D` (permintaan/tahun), `S` (biaya pesan), "
+                 "`H` (biaya simpan/unit/tahun) dan `L` (waktu tunggu, hari; opsional). "
+                 "Nama `permintaan`, `biaya_pesan`, `biaya_simpan`, `lead_time` juga diterima. "
+                 "Tambahkan pasangan `batas_1, harga_1, batas_2, harga_2, ...` (dan `persen_simpan`) "
+                 "untuk EOQ diskon kuantitas, `std_harian` (dan `std_lead_time`) untuk "
+                 "safety stock dan ROP per tingkat layanan, serta `laju_produksi` (EPQ) dan/atau "
+                 "`biaya_backorder` (backorder terencana) untuk membandingkan model persediaan.")
+        berkas_sku = st.file_uploader("Tabel SKU", type=["csv", "parquet"], key="eoq_file")
+        if berkas_sku is not None:
+            try:
+                tabel_sku = read_sku_table(berkas_sku)
+                mulai = time.perf_counter()
+                if discount_columns(tabel_sku)[1]:
+                    jenis_tabel = st.radio("Jenis diskon tabel", ["All-units", "Incremental"],
+                                           horizontal=True, key="jenis_diskon_tabel")
+                    tabel_sku = eoq_discount_frame(
+                        tabel_sku, kind="all_units" if jenis_tabel == "All-units" else "incremental")
+                    tabel_sku["frekuensi_pesan"] = tabel_sku["permintaan"] / tabel_sku["eoq_diskon"]
+                else:
+                    tabel_sku = eoq_frame(tabel_sku)
+                model_tabel = tuple(m for m, kolom in (("epq", "laju_produksi"), ("backorder", "biaya_backorder"))
+                                    if kolom in tabel_sku.columns)
+                if model_tabel:
+                    # Model tambahan untuk semua SKU dalam satu panggilan kernel
+                    tabel_sku = inventory_models_frame(tabel_sku, model_tabel)
+                if "std_harian" in tabel_sku.columns and tingkat_layanan.size:
+                    tabel_sku = safety_stock_table(tabel_sku, tingkat_layanan)
+                durasi = time.perf_counter() - mulai
+            except (ImportError, ValueError) as exc:
+                st.error(f"Error: {exc}")
+                st.stop()
+
+            cols = st.columns(3)
+            cols[0].metric("Jumlah SKU", f"{len(tabel_sku):,}")
+            cols[1].metric("Total biaya persediaan", f"Rp{tabel_sku['biaya_total'].sum():,.0f}")
+            cols[2].metric("Total pesanan/tahun", f"{tabel_sku['frekuensi_pesan'].sum():,.0f}")
+            n_invalid = int(tabel_sku["biaya_total"].isna().sum())
+            if n_invalid:
+                st.warning(f"{n_invalid:,} SKU memiliki parameter tidak valid (hasil kosong)")
+            st.caption(f"Dihitung dalam {durasi*1000:.1f} ms; tabel menampilkan 1.000 SKU dengan biaya terbesar.")
+            st.dataframe(tabel_sku.nlargest(1000, "biaya_total"), use_container_width=True)
+            st.download_button("⬇️ Unduh hasil EOQ (CSV)", tabel_sku.to_csv(index=False).encode("utf-8"),
+                               file_name="hasil_eoq_sku.csv", mime="text/csv")
+
+    with st.expander("🌊 EOQ DARI HISTORI TRANSAKSI (STREAMING)"):
+        st.write("Hitung permintaan tahunan per SKU langsung dari histori transaksi (kolom SKU, tanggal, "
+                 "jumlah). Berkas dibaca per chunk sehingga berkas berukuran GB tidak perlu muat di memori. "
+                 "Biaya S, H dan L diambil dari parameter di atas kecuali ada tabel parameter per SKU.")
+        path_transaksi = ""
+        if DATA_TRANSAKSI_DIR:
+            path_transaksi = st.text_input(f"Nama berkas transaksi di folder data server {DATA_TRANSAKSI_DIR} "
+                                           "(untuk berkas sangat besar)", key="path_transaksi")
+        berkas_transaksi = st.file_uploader("Unggah CSV transaksi", type=["csv"], key="transaksi_file")
+        cols = st.columns(4)
+        kolom_sku = cols[0].text_input("Kolom SKU", "sku", key="kolom_sku")
+        kolom_tanggal = cols[1].text_input("Kolom tanggal (kosongkan jika tidak ada)", "tanggal",
+                                           key="kolom_tanggal")
+        kolom_jumlah = cols[2].text_input("Kolom jumlah", "jumlah", key="kolom_jumlah")
+        tahun_histori = cols[3].number_input("Rentang histori (tahun, 0 = dari tanggal)", min_value=0.0,
+                                             value=0.0, key="tahun_histori")
+        berkas_parameter = st.file_uploader("Tabel parameter per SKU (opsional: sku, S, H, L)",
+                                            type=["csv", "parquet"], key="parameter_file")
+
+        sumber = path_transaksi.strip() or berkas_transaksi
+        if sumber and st.button("🌊 PROSES HISTORI", use_container_width=True):
+            if isinstance(sumber, str):
+                # Hanya berkas di dalam folder data yang boleh dibaca (tolak ../ dan path absolut lain)
+                folder = Path(DATA_TRANSAKSI_DIR).resolve()
+                berkas = (folder / sumber).resolve()
+                if not berkas.is_relative_to(folder) or not berkas.is_file():
+                    st.error(f"Error: berkas {sumber} tidak ditemukan di folder data")
+                    st.stop()
+                sumber = berkas
+            progres = st.progress(0.0, text="Membaca transaksi...")
+            agregat, statistik = pd.DataFrame(columns=["permintaan", "transaksi"]), StreamStats()
+            try:
+                for agregat, statistik in aggregate_demand_iter(sumber, kolom_sku, kolom_jumlah,
+                                                               kolom_tanggal.strip() or None):
+                    progres.progress(statistik.progress,
+                                     text=f"{statistik.rows:,} baris, {statistik.skus:,} SKU "
+                                          f"({statistik.rows_per_second:,.0f} baris/detik)")
+                permintaan = annual_demand(agregat, statistik, tahun_histori or None)
+                parameter = read_sku_table(berkas_parameter) if berkas_parameter is not None else None
+                hasil_stream = stream_eoq(permintaan, parameter, S=S, H=H, L=L)
+            except (ImportError, ValueError) as exc:
+                st.error(f"Error: {exc}")
+                st.stop()
+            progres.progress(1.0, text="Selesai")
+
+            cols = st.columns(4)
+            cols[0].metric("Transaksi", f"{statistik.rows:,}")
+            cols[1].metric("SKU", f"{statistik.skus:,}")
+            cols[2].metric("Throughput", f"{statistik.mb_per_second:,.1f} MB/detik")
+            cols[3].metric("Total biaya persediaan", f"Rp{hasil_stream['biaya_total'].sum():,.0f}")
+            rentang = (f"{statistik.first_date:%d-%m-%Y} s.d. {statistik.last_date:%d-%m-%Y}"
+                       if statistik.first_date is not None else f"{tahun_histori:g} tahun")
+            st.caption(f"Histori {rentang}; {statistik.chunks} chunk dalam {statistik.elapsed:.1f} detik; "
+                       f"{statistik.skipped_rows:,} baris dilewati (jumlah/SKU kosong).")
+            st.dataframe(hasil_stream.nlargest(1000, "biaya_total"), use_container_width=True)
+            st.download_button("⬇️ Unduh EOQ per SKU (CSV)", hasil_stream.to_csv(index=False).encode("utf-8"),
+                               file_name="eoq_dari_histori.csv", mime="text/csv")
+
 # =============== HALAMAN ANTRIAN ===============
 elif st.session_state.current_page == "Antrian":
     st.title("🔄 MODEL ANTRIAN (M/M/1)")
@@ -497,34 +1212,46 @@ elif st.session_state.current_page == "Antrian":
         with col2:
             μ = st.number_input("Tingkat pelayanan (pelanggan/jam)", min_value=0.1, value=15.0, step=0.1)
         
+        jumlah_server = st.number_input("Jumlah server paralel (c)", min_value=1, max_value=10000, value=1,
+                                        help="c = 1: M/M/1; c > 1: M/M/c (Erlang C)")
         cost_waiting = st.number_input("Biaya menunggu per pelanggan/jam (Rp)", 50000)
         cost_add_server = st.number_input("Biaya tambahan server/jam (Rp)", 200000)
 
     if st.button("🧮 HITUNG PARAMETER", type="primary", use_container_width=True):
-        if μ <= λ:
-            st.error("Error: Tingkat pelayanan harus > tingkat kedatangan (μ > λ)")
+        if jumlah_server * μ <= λ:
+            st.error("Error: Kapasitas pelayanan harus > tingkat kedatangan (cμ > λ)")
         else:
-            ρ = λ/μ
-            W = 1/(μ-λ)
-            Wq = W - (1/μ)
-            L = λ*W
-            Lq = λ*Wq
-            total_waiting_cost = Wq*λ*cost_waiting
+            hasil_antrian = hitung_antrian(λ, μ, cost_waiting, cost_add_server, int(jumlah_server))
+            ρ, W, Wq = hasil_antrian["ρ"], hasil_antrian["W"], hasil_antrian["Wq"]
+            L, Lq = hasil_antrian["L"], hasil_antrian["Lq"]
+            total_waiting_cost = hasil_antrian["total_waiting_cost"]
             
             st.markdown("---")
             st.header("📊 HASIL PERHITUNGAN")
             
             cols = st.columns(2)
-            with cols[0]:
-                st.subheader("Parameter Utama")
-                st.latex(rf"""
-                \begin{{aligned}}
-                \rho &= \frac{{\lambda}}{{\mu}} = \frac{{{λ}}}{{{μ}}} = {ρ:.2f} \\
-                W &= \frac{{1}}{{\mu-\lambda}} = \frac{{1}}{{{μ}-{λ}}} = {W:.2f} \text{{ jam}} \\
-                W_q &= W - \frac{{1}}{{\mu}} = {Wq:.2f} \text{{ jam}} \\
-                &= {Wq*60:.1f} \text{{ menit}}
-                \end{{aligned}}
-                """)
+            if jumlah_server == 1:
+                with cols[0]:
+                    st.subheader("Parameter Utama")
+                    st.latex(rf"""
+                    \begin{{aligned}}
+                    \rho &= \frac{{\lambda}}{{\mu}} = \frac{{{λ}}}{{{μ}}} = {ρ:.2f} \\
+                    W &= \frac{{1}}{{\mu-\lambda}} = \frac{{1}}{{{μ}-{λ}}} = {W:.2f} \text{{ jam}} \\
+                    W_q &= W - \frac{{1}}{{\mu}} = {Wq:.2f} \text{{ jam}} \\
+                    &= {Wq*60:.1f} \text{{ menit}}
+                    \end{{aligned}}
+                    """)
+            else:
+                with cols[0]:
+                    st.subheader("Parameter Utama (M/M/c)")
+                    st.latex(rf"""
+                    \begin{{aligned}}
+                    \rho &= \frac{{\lambda}}{{c\mu}} = \frac{{{λ}}}{{{jumlah_server} \times {μ}}} = {ρ:.2f} \\
+                    P(\text{{menunggu}}) &= C(c, \lambda/\mu) = {hasil_antrian["P_tunggu"]:.3f} \\
+                    W_q &= \frac{{C(c, \lambda/\mu)}}{{c\mu-\lambda}} = {Wq:.3f} \text{{ jam}} = {Wq*60:.1f} \text{{ menit}} \\
+                    W &= W_q + \frac{{1}}{{\mu}} = {W:.3f} \text{{ jam}}
+                    \end{{aligned}}
+                    """)
             
             with cols[1]:
                 st.subheader("Jumlah Pelanggan")
@@ -534,17 +1261,17 @@ elif st.session_state.current_page == "Antrian":
                 L_q &= \lambda W_q = {λ} \times {Wq:.2f} = {Lq:.1f}
                 \end{{aligned}}
                 """)
+                st.write(f"**Peluang menunggu:** {hasil_antrian['P_tunggu']:.1%}  \n"
+                         f"**Waktu tunggu P95:** {hasil_antrian['Wq_p95']*60:.1f} menit")
             
             st.subheader("Analisis Biaya")
             st.write(f"**Biaya menunggu total:** Rp{total_waiting_cost:,.0f}/jam")
             
             if cost_add_server > 0:
-                new_μ = μ + 15
-                new_Wq = (λ)/(new_μ*(new_μ-λ))
-                new_cost = new_Wq*λ*cost_waiting + cost_add_server
-                improvement = (total_waiting_cost - new_cost)/total_waiting_cost*100
+                new_c, new_Wq = hasil_antrian["new_c"], hasil_antrian["new_Wq"]
+                new_cost, improvement = hasil_antrian["new_cost"], hasil_antrian["improvement"]
                 
-                st.write(f"**Dengan tambahan server (μ={new_μ}):**")
+                st.write(f"**Dengan tambahan server ({new_c} server paralel, M/M/{new_c}):**")
                 st.write(f"- Waktu tunggu baru: {new_Wq*60:.1f} menit")
                 st.write(f"- Total biaya baru: Rp{new_cost:,.0f}/jam")
                 st.write(f"- Penghematan: {improvement:.1f}%")
@@ -570,6 +1297,208 @@ elif st.session_state.current_page == "Antrian":
             - {'Pertimbangkan penambahan server' if ρ > 0.7 else 'Sistem dalam kondisi baik'}
             """)
 
+    with st.expander("👥 OPTIMASI JUMLAH SERVER"):
+        st.write("Cari jumlah server dengan biaya total per jam terkecil "
+                 "(c × biaya server + λ × Wq × biaya menunggu), serta jumlah server minimum agar "
+                 "target waktu tunggu terpenuhi. Tabel cabang dihitung sekaligus dalam satu panggilan.")
+        col1, col2 = st.columns(2)
+        target_wq = col1.number_input("Target Wq rata-rata (menit)", min_value=0.0, value=5.0, key="target_wq")
+        target_p95 = col2.number_input("Target waktu tunggu P95 (menit)", min_value=0.0, value=15.0,
+                                       key="target_p95")
+        cabang = st.data_editor(
+            pd.DataFrame({"Cabang": ["Pusat", "Cabang A", "Cabang B"],
+                          "λ (pelanggan/jam)": [float(λ), 40.0, 120.0],
+                          "μ (pelanggan/jam)": [float(μ), 15.0, 12.0]}),
+            num_rows="dynamic", use_container_width=True, key="cabang_antrian")
+
+        if st.button("👥 OPTIMASI SERVER", use_container_width=True):
+            cabang = cabang.dropna().reset_index(drop=True)
+            lam_c = cabang["λ (pelanggan/jam)"].to_numpy(dtype=float)
+            mu_c = cabang["μ (pelanggan/jam)"].to_numpy(dtype=float)
+            try:
+                mulai = time.perf_counter()
+                optimum = optimal_staffing(lam_c, mu_c, cost_add_server, cost_waiting)
+                c_wq = min_servers(lam_c, mu_c, target_wq / 60)
+                c_p95 = min_servers(lam_c, mu_c, target_p95 / 60, quantile=0.95)
+                durasi = time.perf_counter() - mulai
+            except ValueError as exc:
+                st.error(f"Error: {exc}")
+                st.stop()
+            st.dataframe(pd.DataFrame({
+                "Cabang": cabang["Cabang"],
+                "Server optimal (biaya)": optimum.servers,
+                "Biaya total (Rp/jam)": optimum.total_cost,
+                "Wq optimal (menit)": optimum.metrics.Wq * 60,
+                "Utilisasi": optimum.metrics.utilization,
+                f"Server min. Wq ≤ {target_wq:g} mnt": c_wq,
+                f"Server min. P95 ≤ {target_p95:g} mnt": c_p95,
+            }), use_container_width=True, hide_index=True)
+            st.caption(f"{len(cabang):,} cabang dihitung dalam {durasi*1000:.1f} ms (Erlang C)")
+
+            # Kurva biaya terhadap jumlah server untuk cabang pertama
+            if len(cabang):
+                c0 = int(optimum.servers[0])
+                c_awal = int(lam_c[0] // mu_c[0]) + 1
+                grid_c = np.arange(c_awal, max(c0 * 2, c_awal + 5))
+                m_c = mmc_metrics(lam_c[0], mu_c[0], grid_c)
+                biaya_server = grid_c * cost_add_server
+                biaya_tunggu = lam_c[0] * m_c.Wq * cost_waiting
+                fig, ax = plt.subplots(figsize=(10, 4))
+                ax.plot(grid_c, biaya_server, marker="o", label="Biaya server")
+                ax.plot(grid_c, biaya_tunggu, marker="o", label="Biaya menunggu")
+                ax.plot(grid_c, biaya_server + biaya_tunggu, marker="o", lw=2, label="Biaya total")
+                ax.axvline(c0, color="red", ls="--", label=f"Optimal: {c0} server")
+                ax.set_xlabel("Jumlah server (c)")
+                ax.set_ylabel("Biaya (Rp/jam)")
+                ax.set_title(f"Biaya per jam - {cabang['Cabang'][0]}")
+                ax.legend()
+                ax.grid(True, alpha=0.3)
+                st.pyplot(fig)
+
+    with st.expander("🎲 SIMULASI ANTRIAN G/G/c"):
+        st.write("Kedatangan nyata jarang Poisson. Simulasi discrete-event (FIFO, c server) dengan "
+                 "distribusi waktu antar kedatangan dan layanan bebas; hasil dibandingkan dengan rumus "
+                 "M/M/c di atas (sama bila kedua distribusi eksponensial).")
+        pilihan_distribusi = ["Eksponensial", "Deterministik", "Uniform (±50%)", "Erlang-k", "Lognormal"]
+
+        def spesifikasi(label, rata2, key):
+            jenis = st.selectbox(label, pilihan_distribusi, key=f"{key}_jenis")
+            if jenis == "Eksponensial":
+                return ("exponential", rata2)
+            if jenis == "Deterministik":
+                return ("deterministic", rata2)
+            if jenis == "Uniform (±50%)":
+                return ("uniform", 0.5 * rata2, 1.5 * rata2)
+            if jenis == "Erlang-k":
+                k = st.number_input("k (bentuk)", min_value=1, value=2, key=f"{key}_k")
+                return ("erlang", int(k), rata2)
+            cv = st.number_input("Koefisien variasi", min_value=0.01, value=1.0, key=f"{key}_cv")
+            return ("lognormal", rata2, cv)
+
+        col1, col2 = st.columns(2)
+        with col1:
+            dist_datang = spesifikasi("Distribusi antar kedatangan (rata-rata 1/λ)", 1 / λ, "sim_datang")
+            berkas_datang = st.file_uploader("atau unggah sampel antar kedatangan (CSV, menit, satu kolom)",
+                                             type=["csv"], key="sim_datang_file")
+        with col2:
+            dist_layanan = spesifikasi("Distribusi waktu layanan (rata-rata 1/μ)", 1 / μ, "sim_layanan")
+            pelanggan = st.number_input("Jumlah pelanggan disimulasikan", min_value=1000, max_value=20_000_000,
+                                        value=1_000_000, step=100_000, key="sim_pelanggan")
+            seed_antrian = st.number_input("Seed", min_value=0, value=42, key="sim_seed_antrian")
+
+        if st.button("▶️ SIMULASIKAN ANTRIAN", use_container_width=True):
+            if berkas_datang is not None:
+                dist_datang = pd.read_csv(berkas_datang).iloc[:, 0].dropna().to_numpy(dtype=float) / 60
+            try:
+                hasil_sim = simulate_queue(dist_datang, dist_layanan, int(jumlah_server), int(pelanggan),
+                                           seed=int(seed_antrian))
+            except ValueError as exc:
+                st.error(f"Error: {exc}")
+                st.stop()
+            rumus = mmc_metrics(λ, μ, int(jumlah_server))
+            rumus_p95 = wait_quantile(λ, μ, int(jumlah_server), 0.95)
+            st.dataframe(pd.DataFrame({
+                "Ukuran": ["Wq (menit)", "W (menit)", "Lq", "L", "P(menunggu)", "Waktu tunggu P95 (menit)",
+                           "Utilisasi"],
+                "Simulasi": [hasil_sim.Wq * 60, hasil_sim.W * 60, hasil_sim.Lq, hasil_sim.L, hasil_sim.p_wait,
+                             hasil_sim.wait_p95 * 60, hasil_sim.utilization],
+                f"Rumus M/M/{int(jumlah_server)}": [float(rumus.Wq) * 60, float(rumus.W) * 60, float(rumus.Lq),
+                                                   float(rumus.L), float(rumus.p_wait), float(rumus_p95) * 60,
+                                                   float(rumus.utilization)],
+            }), use_container_width=True, hide_index=True)
+            st.caption(f"{hasil_sim.customers:,} pelanggan dalam {hasil_sim.elapsed:.2f} detik "
+                       f"({hasil_sim.customers_per_second:,.0f} pelanggan/detik); "
+                       f"λ terukur {hasil_sim.arrival_rate:.2f}/jam")
+
+    with st.expander("🔁 REPLIKASI PARALEL & INTERVAL KEPERCAYAAN"):
+        st.write("Satu kali simulasi masih berisik. Replikasi independen (seed dari SeedSequence) dijalankan "
+                 "paralel di beberapa proses dengan distribusi dari simulasi G/G/c di atas, lalu dihitung "
+                 "interval kepercayaan; berhenti lebih awal bila half-width Wq sudah cukup kecil.")
+        cols = st.columns(4)
+        pelanggan_replikasi = cols[0].number_input("Pelanggan per replikasi", min_value=1000, value=100_000,
+                                                   step=10_000, key="rep_pelanggan")
+        target_relatif = cols[1].number_input("Target half-width Wq (% rata-rata)", min_value=0.1, value=2.0,
+                                              key="rep_target")
+        maks_replikasi = cols[2].number_input("Replikasi maksimum", min_value=2, max_value=10_000, value=200,
+                                              key="rep_maks")
+        kepercayaan = cols[3].selectbox("Tingkat kepercayaan", [0.90, 0.95, 0.99], index=1, key="rep_conf")
+
+        if st.button("🔁 JALANKAN REPLIKASI", use_container_width=True):
+            progres = st.progress(0.0, text="Menjalankan replikasi...")
+            ringkasan = None
+            try:
+                for ringkasan in iter_replications(
+                        queue_replication,
+                        dict(interarrival=dist_datang, service=dist_layanan, servers=int(jumlah_server),
+                             customers=int(pelanggan_replikasi), warmup=min(10_000, int(pelanggan_replikasi) // 10)),
+                        target_metrics=["Wq"], target_half_width=target_relatif / 100, confidence=kepercayaan,
+                        max_replications=int(maks_replikasi), seed=int(seed_antrian)):
+                    hw = ringkasan.statistics.loc["Wq", "half_width"] / ringkasan.statistics.loc["Wq", "rata2"]
+                    progres.progress(ringkasan.replications / int(maks_replikasi),
+                                     text=f"{ringkasan.replications} replikasi, half-width Wq {hw:.2%}")
+            except ValueError as exc:
+                st.error(f"Error: {exc}")
+                st.stop()
+            progres.progress(1.0, text="Selesai")
+            statistik = ringkasan.statistics.loc[["Wq", "W", "Lq", "L", "p_wait", "wait_p95", "utilization"]]
+            st.dataframe(statistik, use_container_width=True)
+            status = "tercapai" if ringkasan.converged else "belum tercapai (batas replikasi)"
+            st.caption(f"{ringkasan.replications} replikasi dalam {ringkasan.elapsed:.1f} detik "
+                       f"({os.cpu_count() or 1} CPU); target half-width {status}. Waktu dalam jam.")
+
+    with st.expander("🕒 PROFIL KEDATANGAN PER JAM"):
+        st.write("λ berubah sepanjang hari. Setiap jam dihitung sebagai antrian M/M/c stasioner "
+                 "(pendekatan piecewise-stationary) dengan μ dan biaya dari parameter di atas; semua jam "
+                 "dihitung sekaligus. Unggah CSV dengan kolom `jam` dan `lambda` (opsional `mu`) "
+                 "atau isi tabel di bawah.")
+        berkas_profil = st.file_uploader("Profil kedatangan", type=["csv", "parquet"], key="profil_file")
+        if berkas_profil is not None:
+            profil = read_sku_table(berkas_profil)
+        else:
+            profil = st.data_editor(
+                pd.DataFrame({"jam": [f"{h:02d}:00" for h in range(8, 18)],
+                              "lambda": [3.0, 6.0, 10.0, 14.0, 25.0, 22.0, 12.0, 9.0, 7.0, 4.0]}),
+                num_rows="dynamic", use_container_width=True, key="profil_kedatangan")
+        col1, col2 = st.columns(2)
+        jenis_target = col1.radio("Target waktu tunggu", ["Tanpa target", "Wq rata-rata", "P95"],
+                                  horizontal=True, key="profil_jenis_target")
+        target_profil = col2.number_input("Target (menit)", min_value=0.0, value=5.0, key="profil_target")
+
+        if st.button("🕒 HITUNG KEBUTUHAN SERVER PER JAM", use_container_width=True):
+            try:
+                tabel_profil = profile_staffing(
+                    profil, μ, cost_add_server, cost_waiting,
+                    target_wait=None if jenis_target == "Tanpa target" else target_profil / 60,
+                    quantile=0.95 if jenis_target == "P95" else None)
+            except (KeyError, ValueError) as exc:
+                st.error(f"Error: {exc}")
+                st.stop()
+
+            cols = st.columns(3)
+            cols[0].metric("Total jam-server", f"{tabel_profil['server'].sum():,}")
+            cols[1].metric("Server puncak", f"{tabel_profil['server'].max():,}")
+            cols[2].metric("Total biaya harian", f"Rp{tabel_profil['biaya_total'].sum():,.0f}")
+
+            fig, ax = plt.subplots(figsize=(10, 4))
+            posisi = np.arange(len(tabel_profil))
+            ax.bar(posisi, tabel_profil["kedatangan"], color="lightsteelblue", label="λ (pelanggan/jam)")
+            ax.set_ylabel("Kedatangan per jam")
+            ax.set_xticks(posisi)
+            ax.set_xticklabels(tabel_profil["interval"].astype(str), rotation=45)
+            ax2 = ax.twinx()
+            ax2.step(posisi, tabel_profil["server"], where="mid", color="red", lw=2, label="Server dijadwalkan")
+            ax2.set_ylabel("Jumlah server")
+            ax2.set_ylim(0, tabel_profil["server"].max() + 1)
+            ax2.yaxis.get_major_locator().set_params(integer=True)
+            garis = ax.get_legend_handles_labels()[0] + ax2.get_legend_handles_labels()[0]
+            ax.legend(garis, [g.get_label() for g in garis], loc="upper left")
+            ax.set_title("Kebutuhan Server per Jam")
+            ax.grid(True, alpha=0.3)
+            st.pyplot(fig)
+            st.dataframe(tabel_profil, use_container_width=True, hide_index=True)
+            st.download_button("⬇️ Unduh jadwal server (CSV)", tabel_profil.to_csv(index=False).encode("utf-8"),
+                               file_name="jadwal_server_per_jam.csv", mime="text/csv")
+
 # =============== HALAMAN JOHNSON ===============
 elif st.session_state.current_page == "Johnson":
     st.title("⏱ PENJADWALAN (JOHNSON'S RULE)")
@@ -662,29 +1591,7 @@ elif st.session_state.current_page == "Johnson":
         jobs = list(zip(m1_times, m2_times))
 
     if st.button("🧮 HITUNG JADWAL OPTIMAL", type="primary", use_container_width=True):
-        group1 = [(i, m1, m2) for i, (m1, m2) in enumerate(jobs) if m1 <= m2]
-        group2 = [(i, m2, m1) for i, (m1, m2) in enumerate(jobs) if m1 > m2]
-        
-        group1_sorted = sorted(group1, key=lambda x: x[1])
-        group2_sorted = sorted(group2, key=lambda x: x[1], reverse=True)
-        
-        sequence = [x[0] for x in group1_sorted] + [x[0] for x in group2_sorted]
-        
-        m1_time = 0
-        m2_time = 0
-        m1_schedule = []
-        m2_schedule = []
-        
-        for job in sequence:
-            m1_start = m1_time
-            m1_time += jobs[job][0]
-            m1_schedule.append((job, m1_start, m1_time))
-            
-            m2_start = max(m1_time, m2_time)
-            m2_time = m2_start + jobs[job][1]
-            m2_schedule.append((job, m2_start, m2_time))
-        
-        makespan = m2_time
+        sequence, m1_schedule, m2_schedule, makespan = hitung_johnson(jobs)
         
         st.markdown("---")
         st.header("📊 HASIL PENJADWALAN")